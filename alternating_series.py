@@ -2,6 +2,8 @@
 from manim import *
 import numpy as np
 
+from series_engine import SeriesPartialSums
+
 class AlternatingSeriesConvergence(Scene):
     def construct(self):
         # 设置默认字体
@@ -103,10 +105,6 @@ class AlternatingSeriesConvergence(Scene):
             Write(y_labels)
         )
 
-        # 计算部分和
-        def get_partial_sum(n):
-            return sum((-1)**(k+1)/k for k in range(1, n+1))
-
         # 创建高亮框
         highlight_box = SurroundingRectangle(terms[0], color=YELLOW)
         self.play(Create(highlight_box))
@@ -114,7 +112,10 @@ class AlternatingSeriesConvergence(Scene):
         # 创建部分和点和折线
         dots = VGroup()
         n_terms = 20
-        partial_sums = [get_partial_sum(n) for n in range(1, n_terms+1)]
+        # 交错级数收敛很慢，用补偿求和一次算出全部部分和
+        partial_sums = SeriesPartialSums(
+            lambda k: (-1.0)**(k+1) / k, n_terms, start=1, compensated=True
+        ).sums.tolist()
         
         # 创建点
         prev_dot = None
@@ -8,6 +8,11 @@ the decomposition of a signal into its frequency components.
 from manim import *
 import numpy as np
 
+from fourier_engine import (
+    EpicycleDrawing, Epicycles, FourierSeries, sample_closed_path
+)
+from geometry import graph_from_samples
+
 class AnimatedFourierTransform(Scene):
     def construct(self):
         # Set default font
@@ -86,9 +91,11 @@ class AnimatedFourierTransform(Scene):
         components_title.to_corner(UL, buff=1)
         self.play(Write(components_title))
         
-        # Individual components
-        frequencies = [1, 3, 5]
-        amplitudes = [0.5, 0.3, 0.2]
+        # Individual components, read off the FFT of the signal instead of hand-written
+        spectrum = FourierSeries(composite_signal)
+        magnitudes = np.hypot(spectrum.a, spectrum.b)
+        frequencies = [int(k) + 1 for k in np.flatnonzero(magnitudes > 1e-6)]
+        amplitudes = [round(float(magnitudes[k - 1]), 2) for k in frequencies]
         colors = [RED, GREEN, YELLOW]
         
         # Show each component separately
@@ -262,26 +269,23 @@ class FourierSeriesAnimation(Scene):
         )
         self.wait(1)
         
-        # Function to compute Fourier series approximation
-        def fourier_approx(x, n_terms):
-            result = 0
-            for n in range(1, n_terms*2, 2):  # Only odd terms
-                result += (4 / (n * PI)) * np.sin(n * x)
-            return result
+        # Fourier coefficients come from one FFT of the square wave; every partial
+        # sum over the sample grid is then a single matrix product
+        series = FourierSeries(square_wave)
+        term_counts = [1, 2, 3, 5, 10, 20]
+        harmonics = [2*n_terms - 1 for n_terms in term_counts]  # Only odd terms
+        x_samples = np.arange(-2*PI, 2*PI + 0.005, 0.01)
+        partial_sums = series.partial_sums(x_samples, harmonics)
         
         # Animate the approximation with increasing terms
         colors = [RED, GREEN, YELLOW, PURPLE, ORANGE, MAROON]
         prev_approx = None
         
-        for i, n_terms in enumerate([1, 2, 3, 5, 10, 20]):
-            approx = axes.plot(
-                lambda x: fourier_approx(x, n_terms),
-                color=colors[i],
-                x_range=[-2*PI, 2*PI, 0.01]
-            )
+        for i, n_terms in enumerate(term_counts):
+            approx = graph_from_samples(axes, x_samples, partial_sums[i], color=colors[i])
             
             approx_label = MathTex(f"n={n_terms*2-1}", color=colors[i]).scale(0.5)
-            approx_label.next_to(axes.c2p(PI, fourier_approx(PI, n_terms)), UP, buff=0.2)
+            approx_label.next_to(axes.c2p(PI, series(PI, harmonics[i])), UP, buff=0.2)
             
             if prev_approx is None:
                 self.play(
@@ -308,6 +312,58 @@ class FourierSeriesAnimation(Scene):
         self.play(Write(explanation))
         self.wait(3)
 
+# Epicycle mode: a chain of rotating vectors (the complex Fourier series of a
+# closed path) traces the path
+class FourierEpicycleAnimation(Scene):
+    svg_file = None     # Closed path to draw; None uses the built-in heart curve
+    n_terms = 500       # Number of rotating vectors
+    n_samples = 1024    # Points sampled along the path for the DFT
+    draw_time = 10      # Seconds for one full turn
+
+    def get_path_points(self):
+        if self.svg_file is not None:
+            path = SVGMobject(self.svg_file).scale_to_fit_height(5)
+            return sample_closed_path(path, self.n_samples)
+        t = np.linspace(0, TAU, self.n_samples, endpoint=False)
+        return np.stack([
+            16 * np.sin(t)**3,
+            13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t),
+            np.zeros_like(t)
+        ], axis=-1) / 6
+
+    def construct(self):
+        # Set default font
+        Text.set_default(font="SimSun")
+        
+        # Title
+        title = Text("傅里叶级数本轮作图").scale(0.8)
+        title.to_edge(UP, buff=0.3)
+        self.play(Write(title))
+        
+        # Every frame's circle centres and arm joints come from one
+        # (frames x terms) complex cumulative sum computed here, up front
+        epicycles = Epicycles(self.get_path_points(), self.n_terms)
+        n_frames = int(self.draw_time * config.frame_rate) + 1
+        drawing = EpicycleDrawing(epicycles, n_frames, center=DOWN * 0.3)
+        
+        self.add(drawing)
+        self.play(
+            UpdateFromAlphaFunc(drawing, lambda mob, alpha: mob.set_progress(alpha)),
+            run_time=self.draw_time,
+            rate_func=linear
+        )
+        self.play(FadeOut(drawing.circles), FadeOut(drawing.arms))
+        
+        # Final explanation
+        explanation = Text(
+            f"{self.n_terms} 个旋转向量之和描出闭合曲线",
+            font="SimSun"
+        ).scale(0.6)
+        explanation.to_edge(DOWN, buff=0.5)
+        
+        self.play(Write(explanation))
+        self.wait(3)
+
 def main():
     # Render the Fourier transform animation
     scene1 = AnimatedFourierTransform()
@@ -316,6 +372,10 @@ def main():
     # Render the Fourier series animation
     scene2 = FourierSeriesAnimation()
     scene2.render()
+    
+    # Render the epicycle drawing
+    scene3 = FourierEpicycleAnimation()
+    scene3.render()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,114 @@
+from manim import *
+import numpy as np
+
+from fast_surface import grid_face_points
+
+
+def field_on_points(func, points):
+    """在一组点 (n, 3) 上一次性计算向量场，返回 (n, 3) 的向量
+
+    func(X, Y, Z) 接收三个坐标数组，返回 (Fx, Fy, Fz) 三个分量（分量可以是标量）。
+    """
+    points = np.asarray(points, dtype=float)
+    X, Y, Z = points[:, 0], points[:, 1], points[:, 2]
+    components = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in func(X, Y, Z)), X)[:3]
+    return np.stack(components, axis=-1)
+
+
+def normalized(vectors, length=1.0):
+    """把每个向量（最后一维）缩放到给定长度，零向量保持为零"""
+    vectors = np.asarray(vectors, dtype=float)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors * length, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def grid_points(x_values, y_values, z_values):
+    """x、y、z 采样值组成的三维网格上的全部点，形状为 (n, 3)"""
+    X, Y, Z = np.meshgrid(x_values, y_values, z_values, indexing="ij")
+    return np.stack([X.ravel(), Y.ravel(), Z.ravel()], axis=-1)
+
+
+def _arrow_template(resolution):
+    """沿 +z 方向的单位箭头模板：侧面是 resolution 个四边形，锥尖是 resolution 个三角形
+
+    返回箭杆和箭头两部分的面控制点，形状均为 (resolution, 16, 3)，
+    箭杆半径为 1、z 从 0 到 1；箭头底面半径为 1、z 从 0 到 1。
+    """
+    theta = np.linspace(0, TAU, resolution + 1)
+    ring = np.stack([np.cos(theta), np.sin(theta), np.zeros_like(theta)], axis=-1)
+    top = ring + OUT
+    apex = np.broadcast_to(OUT, ring.shape)
+    shaft = grid_face_points(np.stack([ring, top], axis=1))[:, 0]
+    tip = grid_face_points(np.stack([ring, apex], axis=1))[:, 0]
+    return shaft, tip
+
+
+def _frames(directions):
+    """每个单位方向 d 对应的正交基 (e1, e2, d)，形状为 (n, 3, 3)，各行为基向量"""
+    helper = np.where(np.abs(directions[:, 2:]) < 0.9, OUT, RIGHT)
+    e1 = np.cross(helper, directions)
+    e1 /= np.linalg.norm(e1, axis=1, keepdims=True)
+    e2 = np.cross(directions, e1)
+    return np.stack([e1, e2, directions], axis=1)
+
+
+class ArrowField3D(VGroup):
+    """一组三维箭头，用来代替逐个创建 Arrow3D 的循环
+
+    所有箭头共用一个箭头模板网格，每个箭头的面由模板经过缩放、旋转、平移
+    一次性算出，直接写入各个面的点，不再为每个箭头构建圆柱和圆锥两个 Surface。
+    外观与 Arrow3D 相同（thickness、tip_height、tip_radius 含义一致），
+    每个子对象是一个箭头（由若干个面组成的 VGroup），可以像 Arrow3D 的 VGroup 一样逐个访问。
+    resolution 为箭头一周的面数，默认在 -ql 预览时取 6，否则取 12。
+
+        ArrowField3D(starts, vectors, color=BLUE)
+        ArrowField3D.from_function(lambda x, y, z: (-y, x, 0), grid_points(...))
+    """
+
+    def __init__(self, starts, vectors, color=WHITE, thickness=0.02, tip_height=0.3,
+                 tip_radius=0.08, resolution=None, fill_opacity=1.0, **kwargs):
+        super().__init__(**kwargs)
+        if resolution is None:
+            resolution = 6 if config.pixel_width < 1280 else 12
+        starts = np.atleast_2d(np.asarray(starts, dtype=float))
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=float))
+        lengths = np.linalg.norm(vectors, axis=1)
+        # 零向量没有方向，不画箭头
+        keep = lengths > 1e-8
+        starts, vectors, lengths = starts[keep], vectors[keep], lengths[keep]
+        self.starts = starts
+        self.vectors = vectors
+        if len(starts) == 0:
+            return
+
+        # 比箭头还短的向量整体按比例缩小箭头
+        tip_h = np.minimum(tip_height, lengths)
+        shaft_len = lengths - tip_h
+        frames = _frames(vectors / lengths[:, None])
+
+        shaft, tip = _arrow_template(resolution)
+        shaft_scale = np.stack(
+            [np.full_like(lengths, thickness), np.full_like(lengths, thickness), shaft_len], axis=-1
+        )
+        tip_scale = np.stack([tip_radius * tip_h / tip_height] * 2 + [tip_h], axis=-1)
+        # (n, faces, 16, 3)：先按每个箭头缩放，再用其正交基旋转，最后平移到起点
+        shaft_points = np.einsum("fpk,nk,nkj->nfpj", shaft, shaft_scale, frames)
+        tip_points = np.einsum("fpk,nk,nkj->nfpj", tip, tip_scale, frames)
+        tip_points += shaft_len[:, None, None, None] * frames[:, None, None, 2]
+        face_points = np.concatenate([shaft_points, tip_points], axis=1) + starts[:, None, None]
+
+        for arrow_faces in face_points:
+            arrow = VGroup()
+            for points in arrow_faces:
+                face = ThreeDVMobject()
+                face.set_points(points)
+                arrow.add(face)
+            self.add(arrow)
+        self.set_fill(color, opacity=fill_opacity)
+        self.set_stroke(width=0)
+
+    @classmethod
+    def from_function(cls, func, points, scale=1.0, **kwargs):
+        """在 points 上一次性计算向量场 func(X, Y, Z)，以每个点为起点画出 scale 倍的向量"""
+        points = np.asarray(points, dtype=float)
+        return cls(points, scale * field_on_points(func, points), **kwargs)
@@ -1,4 +1,5 @@
 from manim import *
+from fast_surface import FastSurface, auto_resolution
 import numpy as np
 
 class BinaryExtremumDemo(ThreeDScene):
@@ -105,16 +106,20 @@ class BinaryExtremumDemo(ThreeDScene):
         self.play(Write(judgment_group))
         self.wait()
 
-        # 创建曲面
+        # 创建曲面：分辨率按渲染质量只确定一次，变形过程中每帧的面数保持不变；
+        # 每帧的系数都不同，不写入网格缓存
+        resolution = auto_resolution(lambda u, v: (u, v, u**2 + 2*v**2), [-3, 3], [-3, 3])
+
         def create_surface(a, c):
-            return Surface(
-                lambda u, v: np.array([
+            return FastSurface(
+                lambda u, v: (
                     u, v, a*u**2 + c*v**2
-                ]),
+                ),
                 u_range=[-3, 3],
                 v_range=[-3, 3],
-                resolution=(40, 40),
-                should_make_jagged=False
+                resolution=resolution,
+                should_make_jagged=False,
+                mesh_cache=None
             )
 
         # 创建初始曲面 (a=1, c=2, 极小值)
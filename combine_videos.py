@@ -1,65 +1,310 @@
+import argparse
+import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
-def combine_videos():
-    # 定义视频文件路径
-    point_mass_video = "media/videos/diameter_moment_of_inertia/480p15/PointMassInertiaScene.mp4"
-    disk_video = "media/videos/diameter_moment_of_inertia/480p15/DiameterMomentOfInertiaScene.mp4"
-    output_video = "media/videos/combined_inertia_scene.mp4"
-    file_list = "media/videos/file_list.txt"
-    
-    # 确保视频文件存在
-    if not os.path.exists(point_mass_video):
-        print(f"错误：找不到质点场景视频: {point_mass_video}")
-        print("首先运行: manim -pql diameter_moment_of_inertia.py PointMassInertiaScene")
-        return False
-    
-    if not os.path.exists(disk_video):
-        print(f"错误：找不到圆盘场景视频: {disk_video}")
-        print("首先运行: manim -pql diameter_moment_of_inertia.py DiameterMomentOfInertiaScene")
-        return False
-    
-    # 确保输出目录存在
-    os.makedirs(os.path.dirname(output_video), exist_ok=True)
-    
-    # 创建文件列表
-    with open(file_list, 'w') as f:
-        f.write(f"file '{os.path.abspath(point_mass_video)}'\n")
-        f.write(f"file '{os.path.abspath(disk_video)}'\n")
-    
-    # 使用FFmpeg合并视频
+from render_all import video_path
+
+# 默认章节：转动惯量的两个场景
+DEFAULT_MANIFEST = {
+    "output": "media/videos/combined_inertia_scene.mp4",
+    "chapters": [
+        {"module": "diameter_moment_of_inertia", "scene": "PointMassInertiaScene", "quality": "l"},
+        {"module": "diameter_moment_of_inertia", "scene": "DiameterMomentOfInertiaScene", "quality": "l"},
+    ],
+}
+
+# 只有这些参数全部一致时才能直接复制流拼接
+VIDEO_KEYS = ("codec_name", "profile", "width", "height", "pix_fmt", "r_frame_rate", "time_base")
+AUDIO_KEYS = ("codec_name", "sample_rate", "channels", "channel_layout")
+
+
+def load_manifest(path):
+    """读取章节清单（JSON），返回 (输出路径, 章节列表)
+
+    格式: {"output": "media/videos/lecture.mp4",
+           "chapters": [{"module": "gauss_theorem", "scene": "GaussTheorem", "quality": "h"}, ...]}
+    章节中设置 "segments": true 时直接拼接该场景已缓存的 manim 分段视频。
+    """
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    return manifest["output"], manifest["chapters"]
+
+
+def chapter_job(chapter):
+    """章节对应的渲染任务 (模块文件, 场景名, 画质)"""
+    module = chapter["module"]
+    if not module.endswith(".py"):
+        module += ".py"
+    return module, chapter["scene"], chapter.get("quality", "h")
+
+
+def chapter_path(chapter):
+    """章节对应的视频文件：可直接给出 path，也可给出 module/scene/quality"""
+    if "path" in chapter:
+        return chapter["path"]
+    return video_path(*chapter_job(chapter))
+
+
+def scene_segments(chapter):
+    """章节对应的 manim 分段视频（partial movie files），按播放顺序排列
+
+    manim 把每次 play/wait 渲染成一个分段，并在 partial_movie_file_list.txt
+    中记录拼接顺序。分段缺失时返回 None。
+    """
+    final = chapter_path(chapter)
+    list_file = os.path.join(
+        os.path.dirname(final), "partial_movie_files", chapter["scene"], "partial_movie_file_list.txt"
+    )
+    if not os.path.exists(list_file):
+        return None
+    segments = []
+    with open(list_file, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith("file "):
+                continue
+            path = line[len("file "):].strip("'")
+            if path.startswith("file:"):
+                path = path[len("file:"):]
+            segments.append(path)
+    if not segments or not all(os.path.exists(p) for p in segments):
+        return None
+    return segments
+
+
+def chapter_inputs(chapter, cached=False):
+    """章节的输入文件：设置 segments 时优先使用分段视频，否则使用完整视频
+
+    cached 为 True 表示完整视频刚从渲染缓存取回。缓存只保存完整视频，
+    媒体目录中的分段可能来自旧版本的场景，此时只使用完整视频。
+    """
+    if chapter.get("segments") and not cached:
+        segments = scene_segments(chapter)
+        if segments is not None:
+            return segments
+    return [chapter_path(chapter)]
+
+
+def render_chapters(chapters, root="."):
+    """渲染清单中的全部场景，返回 (是否全部成功, 取自缓存的任务集合)
+
+    每个场景都经由渲染缓存：内容未变的场景直接取回缓存的视频，不会重新渲染；
+    源码改过的场景一定重新渲染，不会把媒体目录中过时的视频拼接进去。
+    直接给出 path 的章节不渲染。取自缓存的任务为 chapter_job 的结果。
+    """
+    from render_all import render_all
+    from render_cache import RenderCache
+
+    by_quality = {}
+    for chapter in chapters:
+        if "path" in chapter:
+            continue
+        module, scene, quality = chapter_job(chapter)
+        jobs = by_quality.setdefault(quality, [])
+        if (module, scene) not in jobs:
+            jobs.append((module, scene))
+
+    cache = RenderCache(os.path.join(root, "media", "render_cache"))
+    ok = True
+    cached = set()
+    for quality, jobs in by_quality.items():
+        results = render_all(jobs, quality, root=root, cache=cache)
+        ok = ok and all(r["ok"] for r in results)
+        cached.update((r["module"], r["scene"], quality) for r in results if r.get("cached"))
+    return ok, cached
+
+
+def probe(path):
+    """用 ffprobe 读取视频和音频流的编码参数，以及文件时长（秒，键为 "duration"）"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
     cmd = [
-        'ffmpeg', 
-        '-y',  # 覆盖输出文件
-        '-f', 'concat',  # 使用concat模式
-        '-safe', '0',  # 允许绝对路径
-        '-i', file_list,  # 输入文件列表
-        '-c', 'copy',  # 直接复制流（不重新编码）
-        output_video  # 输出文件
+        "ffprobe", "-v", "error",
+        "-show_entries", "stream=codec_type," + ",".join(set(VIDEO_KEYS + AUDIO_KEYS)) + ":format=duration",
+        "-of", "json", path,
     ]
-    
-    print("执行命令:", ' '.join(cmd))
     result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    
-    # 删除临时文件
-    if os.path.exists(file_list):
-        os.remove(file_list)
-    
-    if result.returncode == 0:
-        print(f"合并完成! 输出文件: {output_video}")
-        
-        # 自动打开视频（可选）
-        if os.name == 'posix':  # macOS或Linux
-            subprocess.call(('open', output_video))
-        elif os.name == 'nt':  # Windows
-            os.startfile(output_video)
-        
-        return True
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe 无法读取 {path}: {result.stderr.decode().strip()}")
+
+    info = json.loads(result.stdout)
+    params = {"duration": float(info.get("format", {}).get("duration", 0))}
+    for stream in info["streams"]:
+        kind = stream.get("codec_type")
+        keys = VIDEO_KEYS if kind == "video" else AUDIO_KEYS if kind == "audio" else ()
+        if keys and kind not in params:
+            params[kind] = tuple(str(stream.get(k)) for k in keys)
+    return params
+
+
+def probe_all(paths, workers=None):
+    """并行检查所有输入文件，返回每个文件的编码参数"""
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=workers or min(len(paths), os.cpu_count() or 1)) as pool:
+        return list(pool.map(probe, paths))
+
+
+def _concat_list(paths):
+    """concat 分离器的文件列表，通过标准输入传给 ffmpeg，不写临时文件"""
+    lines = []
+    for path in paths:
+        escaped = os.path.abspath(path).replace("'", r"'\''")
+        # 必须显式写出 file: 协议，否则 ffmpeg 会把路径当作相对于 pipe: 的地址
+        lines.append(f"file 'file:{escaped}'\n")
+    return "".join(lines).encode()
+
+
+def concat_copy(paths, output):
+    """编码参数一致时直接复制流拼接"""
+    cmd = [
+        "ffmpeg", "-y",
+        "-f", "concat", "-safe", "0",
+        "-protocol_whitelist", "file,pipe,fd",
+        "-i", "pipe:0",
+        "-c", "copy",
+        output,
+    ]
+    print("执行命令:", " ".join(cmd))
+    return subprocess.run(cmd, input=_concat_list(paths), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def concat_reencode(paths, output, params):
+    """编码参数不一致时，统一缩放到第一个有视频的输入的分辨率与帧率后重新编码一次
+
+    只要有一个输入带音频，输出就带音频：没有音频的输入按其时长补上静音，
+    没有视频的输入补上黑屏，这样各章节的音画仍然同步。
+    """
+    video = next((p["video"] for p in params if "video" in p), None)
+    if video is None:
+        raise ValueError("所有输入都没有视频流")
+    width, height, fps = video[2], video[3], video[5]
+    audio = next((p["audio"] for p in params if "audio" in p), None)
+    has_audio = audio is not None
+    if has_audio:
+        sample_rate = audio[1]
+        layout = audio[3] if audio[3] != "None" else "stereo"
+
+    cmd = ["ffmpeg", "-y"]
+    for path in paths:
+        cmd += ["-i", path]
+
+    filters = []
+    streams = ""
+    for i, p in enumerate(params):
+        source = f"[{i}:v]" if "video" in p else f"color=c=black:s={width}x{height}:r={fps}:d={p['duration']},"
+        filters.append(
+            f"{source}scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps},format=yuv420p[v{i}]"
+        )
+        streams += f"[v{i}]"
+        if has_audio:
+            if "audio" in p:
+                streams += f"[{i}:a]"
+            else:
+                filters.append(
+                    f"anullsrc=channel_layout={layout}:sample_rate={sample_rate},"
+                    f"atrim=duration={p['duration']}[a{i}]"
+                )
+                streams += f"[a{i}]"
+    a = 1 if has_audio else 0
+    filters.append(f"{streams}concat=n={len(paths)}:v=1:a={a}[outv]" + ("[outa]" if has_audio else ""))
+
+    cmd += ["-filter_complex", ";".join(filters), "-map", "[outv]"]
+    if has_audio:
+        cmd += ["-map", "[outa]", "-c:a", "aac"]
+    cmd += ["-c:v", "libx264", "-pix_fmt", "yuv420p", output]
+    print("执行命令:", " ".join(cmd))
+    return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def concat_videos(paths, output, open_result=False):
+    """按顺序拼接任意数量的视频，优先使用流复制"""
+    if not paths:
+        print("错误：没有要拼接的视频")
+        return False
+    try:
+        params = probe_all(paths)
+    except FileNotFoundError as e:
+        print(f"错误：找不到视频: {e}")
+        print("首先运行: python render_all.py <模块文件>")
+        return False
+    except RuntimeError as e:
+        print(f"错误：{e}")
+        return False
+
+    # 确保输出目录存在
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+
+    # 时长不影响能否直接拼接，只比较各流的编码参数
+    formats = [(p.get("video"), p.get("audio")) for p in params]
+    if all(f == formats[0] for f in formats):
+        result = concat_copy(paths, output)
     else:
+        print("输入视频的编码参数不一致，改为重新编码一次")
+        try:
+            result = concat_reencode(paths, output, params)
+        except ValueError as e:
+            print(f"错误：{e}")
+            return False
+
+    if result.returncode != 0:
         print("合并失败!")
         print("错误输出:", result.stderr.decode())
         return False
 
+    print(f"合并完成! 输出文件: {output}")
+    if open_result:
+        # 自动打开视频
+        if os.name == 'posix':  # macOS或Linux
+            subprocess.call(('open', output))
+        elif os.name == 'nt':  # Windows
+            os.startfile(output)
+    return True
+
+
+def combine_chapters(chapters, output, open_result=False, render=False):
+    """按章节顺序拼接视频，render 为 True 时先渲染（或从缓存取回）各章节的场景"""
+    cached = set()
+    if render:
+        ok, cached = render_chapters(chapters)
+        if not ok:
+            print("部分场景渲染失败，停止合并")
+            return False
+    paths = [
+        path
+        for chapter in chapters
+        for path in chapter_inputs(chapter, "path" not in chapter and chapter_job(chapter) in cached)
+    ]
+    return concat_videos(paths, output, open_result)
+
+
+def combine_manifest(manifest_path, open_result=False, render=False):
+    """按章节清单拼接视频"""
+    output, chapters = load_manifest(manifest_path)
+    return combine_chapters(chapters, output, open_result, render)
+
+
+def combine_videos():
+    """合并转动惯量的质点场景与圆盘场景"""
+    return combine_chapters(DEFAULT_MANIFEST["chapters"], DEFAULT_MANIFEST["output"], open_result=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="按章节清单拼接已渲染的场景视频")
+    parser.add_argument("manifest", nargs="?", help="章节清单 JSON 文件（默认合并转动惯量视频）")
+    parser.add_argument("--open", action="store_true", help="合并完成后打开视频")
+    parser.add_argument("--render", action="store_true", help="先渲染清单中的场景（内容未变的场景取自渲染缓存）")
+    args = parser.parse_args()
+
+    if args.manifest is None:
+        print("开始合并转动惯量视频...")
+        combine_videos()
+    else:
+        combine_manifest(args.manifest, args.open, args.render)
+
+
 if __name__ == "__main__":
-    print("开始合并转动惯量视频...")
-    combine_videos() 
\ No newline at end of file
+    main()
@@ -1,4 +1,5 @@
 from manim import *
+from fast_surface import FastSurface
 import numpy as np
 
 class ConditionalExtremaDemo(ThreeDScene):
@@ -32,12 +33,12 @@ class ConditionalExtremaDemo(ThreeDScene):
             return x**2 + y**2/2 - 1
 
         # 创建目标函数的曲面
-        surface = Surface(
-            lambda u, v: np.array([
+        surface = FastSurface(
+            lambda u, v: (
                 u,
                 v,
                 f(u, v)
-            ]),
+            ),
             u_range=[-2, 2],
             v_range=[-2, 2],
             checkerboard_colors=[BLUE_D, BLUE_E],
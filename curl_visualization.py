@@ -1,4 +1,5 @@
 from manim import *
+from arrow_field import ArrowField3D, grid_points
 import numpy as np
 
 config.tex_template = TexTemplateLibrary.ctex
@@ -33,24 +34,16 @@ class CurlVisualization(ThreeDScene):
         self.wait(1)
 
         # 创建旋转向量场（以z轴为轴的旋转场）
-        def vector_field_func(point):
-            x, y, z = point
-            return np.array([-y, x, 0]) / 2
-
-        # 创建向量场
-        vector_field = VGroup()
-        for x in np.linspace(-2, 2, 5):
-            for y in np.linspace(-2, 2, 5):
-                for z in [0]:  # 只在z=0平面创建向量
-                    point = np.array([x, y, z])
-                    vector = vector_field_func(point)
-                    arrow = Arrow3D(
-                        start=point,
-                        end=point + vector,
-                        color=BLUE,
-                        thickness=0.02
-                    )
-                    vector_field.add(arrow)
+        def vector_field_func(x, y, z):
+            return -y / 2, x / 2, 0
+
+        # 创建向量场（只在z=0平面创建向量，所有箭头一次生成）
+        vector_field = ArrowField3D.from_function(
+            vector_field_func,
+            grid_points(np.linspace(-2, 2, 5), np.linspace(-2, 2, 5), [0]),
+            color=BLUE,
+            thickness=0.02
+        )
 
         self.play(Create(vector_field))
         self.wait(1)
@@ -59,7 +52,6 @@ class CurlVisualization(ThreeDScene):
         radius = 0.5
         test_points = [(1.5, 0, 0), (-1.5, 0, 0), (0, 1.5, 0), (0, -1.5, 0)]
         discs = VGroup()
-        disc_vectors = VGroup()
         
         for center in test_points:
             # 创建圆盘
@@ -77,21 +69,15 @@ class CurlVisualization(ThreeDScene):
             )
             discs.add(disc)
 
-            # 在圆盘周围添加向量
-            for theta in np.linspace(0, TAU, 8):
-                point = np.array([
-                    center[0] + radius * np.cos(theta),
-                    center[1] + radius * np.sin(theta),
-                    center[2]
-                ])
-                vector = vector_field_func(point)
-                arrow = Arrow3D(
-                    start=point,
-                    end=point + vector,
-                    color=YELLOW,
-                    thickness=0.02
-                )
-                disc_vectors.add(arrow)
+        # 在每个圆盘周围添加向量
+        theta = np.linspace(0, TAU, 8)
+        ring = radius * np.stack([np.cos(theta), np.sin(theta), np.zeros_like(theta)], axis=-1)
+        disc_vectors = ArrowField3D.from_function(
+            vector_field_func,
+            np.concatenate([np.array(center) + ring for center in test_points]),
+            color=YELLOW,
+            thickness=0.02
+        )
 
         self.play(Create(discs), Create(disc_vectors))
         self.wait(1)
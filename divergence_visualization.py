@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from flow_lines import lic_texture
+
 def create_vector_field(x, y):
     """创建一个示例矢量场"""
     u = x
@@ -24,7 +26,9 @@ def plot_divergence_field():
     # 创建图形
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
     
-    # 绘制矢量场
+    # 绘制矢量场：线积分卷积纹理显示整个场的走向，箭头显示方向和大小
+    texture = lic_texture(create_vector_field, (-2, 2, -2, 2), resolution=(400, 400))
+    ax1.imshow(texture, extent=(-2, 2, -2, 2), origin='lower', cmap='gray', alpha=0.8)
     ax1.quiver(X, Y, U, V)
     ax1.set_title('矢量场')
     ax1.set_xlabel('X')
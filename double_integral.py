@@ -1,4 +1,40 @@
 from manim import *
+from fast_surface import FastSurface
+from geometry import axes_c2p, line_segment_points
+import numpy as np
+
+
+class RiemannSumGrid(VMobject):
+    """All cells of a Riemann sum stored as the subpaths of one VMobject.
+
+    Cell centers and corner/handle points are computed in a single NumPy pass,
+    so the whole grid is created, lifted and animated as one mobject no matter
+    how many cells it has.
+    """
+
+    def __init__(self, axes, x_values, y_values, side_length, **kwargs):
+        kwargs.setdefault("color", WHITE)
+        kwargs.setdefault("fill_opacity", 0.5)
+        super().__init__(**kwargs)
+        X, Y = np.meshgrid(x_values, y_values, indexing="ij")
+        self.centers = axes_c2p(axes, X.ravel(), Y.ravel())
+
+        # Corners of a square (counterclockwise), and the closing edge back to the start
+        half = side_length / 2
+        corners = np.array([[half, half, 0], [-half, half, 0], [-half, -half, 0], [half, -half, 0]])
+        edge_points = line_segment_points(corners, np.roll(corners, -1, axis=0))  # (4 edges, 4 points, 3)
+        points = self.centers[:, None, None, :] + edge_points[None]  # (cells, 4 edges, 4 points, 3)
+        self.set_points(points.reshape(-1, 3))
+
+    def lift(self, height_func):
+        """Shift every cell up by height_func(x, y) of its center, evaluated on the whole grid at once."""
+        heights = height_func(self.centers[:, 0], self.centers[:, 1])
+        points_per_cell = len(self.points) // len(self.centers)
+        offsets = np.repeat(heights, points_per_cell)[:, None] * UP
+        self.set_points(self.points + offsets)
+        self.centers = self.centers + heights[:, None] * UP
+        return self
+
 
 class DoubleIntegralScene(ThreeDScene):
     def construct(self):
@@ -11,8 +47,8 @@ class DoubleIntegralScene(ThreeDScene):
         )
 
         # Create the surface for f(x, y) = x^2 + y^2
-        surface = Surface(
-            lambda u, v: axes.c2p(u, v, u**2 + v**2),  # f(x, y) = x^2 + y^2
+        surface = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, u**2 + v**2),  # f(x, y) = x^2 + y^2
             u_range=[-2, 2],
             v_range=[-2, 2],
             checkerboard_colors=[BLUE_D, BLUE_E],
@@ -40,46 +76,30 @@ class DoubleIntegralScene(ThreeDScene):
 
     def show_riemann_sum(self, axes, rect):
         # Create a grid of small squares for the approximation
-        squares = VGroup()
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                square = Square(side_length=1, color=WHITE, fill_opacity=0.5).move_to(
-                    axes.c2p(i, j, 0)
-                )
-                squares.add(square)
+        coords = np.arange(-1, 2)
+        squares = RiemannSumGrid(axes, coords, coords, side_length=1)
         
         self.play(Create(squares))
         
-        # Animate the height of squares based on the function f(x, y) = x^2 + y^2
-        for square in squares:
-            x, y, z = square.get_center()
-            height = x**2 + y**2
-            square.generate_target()
-            square.target = square.copy().shift(UP * height)  # Shift the square to the correct height
-            self.play(MoveToTarget(square))
+        # Animate the height of all squares at once based on f(x, y) = x^2 + y^2
+        squares.generate_target()
+        squares.target.lift(lambda x, y: x**2 + y**2)
+        self.play(MoveToTarget(squares), run_time=3)
         
         # Sum approximation visual (use a label for simplicity)
         self.play(Write(Text("Sum Approximation").next_to(squares, UP)))
 
     def show_limit_of_riemann_sum(self, axes, rect):
         # Now create smaller rectangles (approaching infinitesimal width/height)
-        small_squares = VGroup()
-        for i in range(-5, 6):
-            for j in range(-5, 6):
-                small_square = Square(side_length=0.4, color=WHITE, fill_opacity=0.5).move_to(
-                    axes.c2p(i * 0.4, j * 0.4, 0)
-                )
-                small_squares.add(small_square)
+        coords = np.arange(-5, 6) * 0.4
+        small_squares = RiemannSumGrid(axes, coords, coords, side_length=0.4)
         
         self.play(Create(small_squares))
 
-        # Animate the heights of these small squares
-        for small_square in small_squares:
-            x, y, z = small_square.get_center()
-            height = x**2 + y**2
-            small_square.generate_target()
-            small_square.target = small_square.copy().shift(UP * height)  # Move to the height position
-            self.play(MoveToTarget(small_square))
+        # Animate the heights of all small squares in a single play call
+        small_squares.generate_target()
+        small_squares.target.lift(lambda x, y: x**2 + y**2)
+        self.play(MoveToTarget(small_squares), run_time=3)
         
         # Fade in the idea of the limit
         self.play(Write(Text("Limit as Δx, Δy -> 0").next_to(small_squares, UP)))
@@ -90,4 +110,3 @@ class DoubleIntegralScene(ThreeDScene):
         # Display the result
         result_text = Text("Double Integral Result: Volume", font_size=36).shift(UP * 3)
         self.play(Write(result_text))
-
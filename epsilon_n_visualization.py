@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from glyph_text import GlyphText, NumberReadout
+
 class EpsilonNVisualization(Scene):
     def construct(self):
         # Set default font
@@ -65,14 +67,14 @@ class EpsilonNVisualization(Scene):
         
         # 然后显示N的推导过程
         # 添加一般形式的推导过程
-        derivation_title = Text("N 的一般形式推导过程:", font="SimSun").scale(0.4)  # 缩小字体
+        derivation_title = GlyphText("N 的一般形式推导过程:", font="SimSun").scale(0.4)  # 缩小字体
         derivation_title.to_corner(UL, buff=0.3)  # 调整位置
         derivation_title.shift(DOWN * 1.2)  # 下移一点点
         
         derivation_step1 = MathTex(r"|f(n) - 3| = \left|\frac{9}{n^2 - 3}\right|").scale(0.4)  # 缩小字体
-        derivation_step2_part1 = Text("当", font="SimSun").scale(0.4)
+        derivation_step2_part1 = GlyphText("当", font="SimSun").scale(0.4)
         derivation_step2_part2 = MathTex(r"n > \sqrt{3}").scale(0.4)
-        derivation_step2_part3 = Text("时", font="SimSun").scale(0.4)
+        derivation_step2_part3 = GlyphText("时", font="SimSun").scale(0.4)
         derivation_step2_part4 = MathTex(r"\frac{9}{n^2 - 3} < \varepsilon").scale(0.4)
         
         # 组合 derivation_step2
@@ -83,7 +85,7 @@ class EpsilonNVisualization(Scene):
         derivation_step4 = MathTex(r"n^2 > \frac{9}{\varepsilon} + 3").scale(0.4)  # 缩小字体
         derivation_step5 = MathTex(r"n > \sqrt{\frac{9}{\varepsilon} + 3}").scale(0.4)  # 缩小字体
         
-        derivation_step6_part1 = Text("因此", font="SimSun").scale(0.4)
+        derivation_step6_part1 = GlyphText("因此", font="SimSun").scale(0.4)
         derivation_step6_part2 = MathTex(r"N = \left\lceil \sqrt{\frac{9}{\varepsilon} + 3} \right\rceil").scale(0.4)
         
         # 组合 derivation_step6
@@ -114,6 +116,8 @@ class EpsilonNVisualization(Scene):
         epsilons = [0.5, 0.15]
         colors = [RED, ORANGE]
         highlight_colors = [YELLOW, PURPLE]
+        # “N =”只编译一次，各 ε 下的 N 标签复制它并拼上数值
+        N_prefix = MathTex("N =")
         
         for i, (epsilon, color, highlight_color) in enumerate(zip(epsilons, colors, highlight_colors)):
             # Calculate N for this epsilon
@@ -123,12 +127,16 @@ class EpsilonNVisualization(Scene):
             # 将N具体数值的计算移到右上角
             if i == 0:
                 # For first epsilon, show full calculation
-                n_value_title = Text(f"当ε = {epsilon}时:", font="SimSun").scale(0.4)  # 缩小字体
+                n_value_title = GlyphText(f"当ε = {epsilon}时:", font="SimSun").scale(0.4)  # 缩小字体
                 n_value_title.to_corner(UR, buff=0.3)  # 调整位置到右上角
                 n_value_title.shift(DOWN * 0.5)  # 下移一点点
                 
                 n_value_step1 = MathTex(f"N = \\left\\lceil \\sqrt{{\\frac{{9}}{{{epsilon}}} + 3}} \\right\\rceil").scale(0.5)  # 缩小字体
-                n_value_step2 = MathTex(f"N = \\left\\lceil {N_float:.2f} \\right\\rceil = {N}").scale(0.5)  # 缩小字体
+                # 数值部分由缓存的 LaTeX 数字字形拼成，公式部分是固定的字面量
+                n_value_step2 = VGroup(
+                    MathTex(r"N = \lceil"), NumberReadout(N_float, num_decimal_places=2, tex=True),
+                    MathTex(r"\rceil ="), NumberReadout(N, num_decimal_places=0, tex=True)
+                ).arrange(RIGHT, buff=0.1).scale(0.5)  # 缩小字体
                 
                 n_value_group = VGroup(n_value_title, n_value_step1, n_value_step2)
                 n_value_group.arrange(DOWN, aligned_edge=LEFT, buff=0.1)  # 减小行间距
@@ -144,9 +152,9 @@ class EpsilonNVisualization(Scene):
                 n_value_group_prev = n_value_group
             else:
                 # For second epsilon, just show the result
-                n_result_part1 = Text("当", font="SimSun").scale(0.4)
+                n_result_part1 = GlyphText("当", font="SimSun").scale(0.4)
                 n_result_part2 = MathTex(r"\varepsilon").scale(0.4)
-                n_result_part3 = Text(f"= {epsilon}时，N = {N}", font="SimSun").scale(0.4)
+                n_result_part3 = GlyphText(f"= {epsilon}时，N = {N}", font="SimSun").scale(0.4)
                 
                 n_result = VGroup(n_result_part1, n_result_part2, n_result_part3)
                 n_result.arrange(RIGHT, buff=0.1)
@@ -226,7 +234,9 @@ class EpsilonNVisualization(Scene):
                 axes.c2p(N, 0),
                 line_config={"color": highlight_color, "stroke_width": 4}
             )
-            N_label = MathTex(f"N = {N}").next_to(N_line, UP, buff=0.1).scale(0.7)
+            N_label = VGroup(N_prefix.copy(), NumberReadout(N, num_decimal_places=0, tex=True))
+            N_label.arrange(RIGHT, buff=0.15, aligned_edge=DOWN)  # 数字与 N 的基线对齐
+            N_label.next_to(N_line, UP, buff=0.1).scale(0.7)
             N_label.set_color(highlight_color)
             
             # Create a dotted vertical line spanning the entire y-range for better visibility
@@ -0,0 +1,131 @@
+from manim import *
+import numpy as np
+
+from geometry import axes_c2p, line_segment_points
+from mesh_cache import default_cache, mesh_key
+
+
+def evaluate_uv_grid(func, u_values, v_values):
+    """在 (u, v) 网格上一次性计算参数方程，返回形状为 (len(u), len(v), 3) 的点阵
+
+    func(U, V) 可以返回 (X, Y, Z) 三个分量组成的元组，分量可以是标量（会自动广播）；
+    也可以返回最后一维为坐标、形状为 U.shape + (3,) 的数组（如 axes_c2p 的结果）。
+    """
+    U, V = np.meshgrid(u_values, v_values, indexing="ij")
+    result = func(U, V)
+    if isinstance(result, np.ndarray) and result.shape == U.shape + (3,):
+        return result.astype(float)
+    if isinstance(result, np.ndarray) and result.shape != (3,) + U.shape:
+        raise ValueError(f"曲面函数返回的数组形状 {result.shape} 与网格 {U.shape} 不匹配")
+    components = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in result), U)[:3]
+    return np.stack(components, axis=-1)
+
+
+def grid_face_points(points):
+    """由 (nu+1, nv+1, 3) 的点阵生成每个四边形面的贝塞尔控制点，形状为 (nu, nv, 16, 3)
+
+    面的顶点顺序与 Surface 相同：(u1,v1) → (u2,v1) → (u2,v2) → (u1,v2) → (u1,v1)，
+    每条边是控制点位于 1/3、2/3 处的直线段。
+    """
+    corners = np.stack(
+        [points[:-1, :-1], points[1:, :-1], points[1:, 1:], points[:-1, 1:]], axis=2
+    )
+    edges = line_segment_points(corners, np.roll(corners, -1, axis=2))
+    nu, nv = corners.shape[:2]
+    return edges.reshape(nu, nv, 16, 3)
+
+
+def auto_resolution(func, u_range, v_range, pixels_per_face=32, min_faces=4, max_faces=64,
+                    axes=None):
+    """根据当前渲染质量和曲面在屏幕上的大小选择网格分辨率
+
+    func 的参数和返回值与 FastSurface 相同，应返回场景坐标；若返回的是坐标轴
+    中的坐标，传入 axes，采样点会先经 axes_c2p 换算到场景坐标再测量。
+    先在 9×9 的粗网格上计算曲面，x、y 超出画面的部分截断到画面范围内
+    （z 沿视线方向，不截断），取沿 u、v 方向最长的网格线长度，
+    按 config 中的像素密度（pixel_width / frame_width）换算成像素，
+    使每个面的边长约为 pixels_per_face 像素。-ql 预览的像素密度不到 -qh 的一半，
+    面数也相应减少。不考虑相机缩放和透视，按相机默认视野估计。
+    """
+    points = evaluate_uv_grid(func, np.linspace(*u_range[:2], 9), np.linspace(*v_range[:2], 9))
+    if axes is not None:
+        points = axes_c2p(axes, points[..., 0], points[..., 1], points[..., 2])
+    half_width, half_height = config.frame_width / 2, config.frame_height / 2
+    points[..., 0] = np.clip(points[..., 0], -half_width, half_width)
+    points[..., 1] = np.clip(points[..., 1], -half_height, half_height)
+    steps = np.linalg.norm(np.diff(points, axis=0), axis=-1)
+    u_length = steps.sum(axis=0).max()
+    steps = np.linalg.norm(np.diff(points, axis=1), axis=-1)
+    v_length = steps.sum(axis=1).max()
+    pixels_per_unit = config.pixel_width / config.frame_width
+    return tuple(
+        int(np.clip(np.ceil(length * pixels_per_unit / pixels_per_face), min_faces, max_faces))
+        for length in (u_length, v_length)
+    )
+
+
+class FastSurface(Surface):
+    """Surface 的向量化版本
+
+    参数与 Surface 相同，但 func 接收整个网格的数组 (U, V) 而不是单个标量：
+
+        FastSurface(lambda u, v: axes_c2p(axes, u, v, u**2 + v**2), ...)
+        FastSurface(lambda u, v: (u, v, u**2 + v**2), ...)
+
+    曲面上所有点用一次 NumPy 调用算出，面的顶点直接从数组写入，
+    不再逐点调用 func 和 apply_function，因此提高 resolution 的代价很小。
+
+    面顶点数组保存在 mesh_cache 中（默认为进程间共享的磁盘缓存），
+    相同的函数和采样点只计算一次；传入 mesh_cache=None 可关闭缓存。
+
+    resolution="auto" 时由 auto_resolution 根据渲染质量和曲面大小决定分辨率。
+    """
+
+    def __init__(self, func, *args, mesh_cache=default_cache, **kwargs):
+        if kwargs.get("resolution") == "auto":
+            kwargs["resolution"] = auto_resolution(
+                func, kwargs.get("u_range", [0, 1]), kwargs.get("v_range", [0, 1])
+            )
+        self.mesh_cache = mesh_cache
+        self._building = True
+        super().__init__(func, *args, **kwargs)
+        self._building = False
+
+    def apply_function(self, function, **kwargs):
+        # Surface.__init__ 会逐点把 func 作用到 uv 网格上，这里网格已经计算好，直接跳过
+        if getattr(self, "_building", False):
+            return self
+        return super().apply_function(function, **kwargs)
+
+    def _setup_in_uv_space(self):
+        u_values, v_values = self._get_u_values_and_v_values()
+        def compute():
+            return grid_face_points(evaluate_uv_grid(self._func, u_values, v_values))
+
+        if self.mesh_cache is None:
+            face_points = compute()
+        else:
+            key = mesh_key(self._func, u_values, v_values)
+            face_points = self.mesh_cache.get_or_compute(key, compute)
+
+        faces = VGroup()
+        self.list_of_faces = []
+        for i in range(len(u_values) - 1):
+            for j in range(len(v_values) - 1):
+                face = ThreeDVMobject()
+                face.set_points(face_points[i, j])
+                face.u_index = i
+                face.v_index = j
+                face.u1, face.u2 = u_values[i], u_values[i + 1]
+                face.v1, face.v2 = v_values[j], v_values[j + 1]
+                faces.add(face)
+                self.list_of_faces.append(face)
+        faces.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        faces.set_stroke(
+            color=self.stroke_color,
+            width=self.stroke_width,
+            opacity=self.stroke_opacity,
+        )
+        self.add(*faces)
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
@@ -0,0 +1,157 @@
+"""二维向量场的流线与线积分卷积（LIC）
+
+向量场写成 field(X, Y) → (U, V)，X、Y 是任意形状的坐标数组，
+与 divergence_visualization.create_vector_field 的写法相同。
+
+- streamlines：从大量种子点同时出发，沿场的方向以自适应步长积分，得到流线
+- lic_texture：对白噪声沿流线做卷积，得到显示整个场走向的灰度纹理
+
+两者都对所有种子点（或所有像素）同时计算，每一步只调用一次 field。
+"""
+
+import numpy as np
+
+
+def _unit_field(field, points, sign=1.0, eps=1e-9):
+    """field 在 points (n, 2) 处的单位方向和速率；速率低于 eps 的点方向为零"""
+    u, v = field(points[:, 0], points[:, 1])
+    vectors = np.stack(np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(v, dtype=float)), axis=-1)
+    vectors = vectors.reshape(len(points), 2)
+    speed = np.linalg.norm(vectors, axis=1)
+    unit = np.divide(sign * vectors, speed[:, None], out=np.zeros_like(vectors),
+                     where=speed[:, None] > eps)
+    return unit, speed
+
+
+def _inside(points, bounds):
+    x_min, x_max, y_min, y_max = bounds
+    return (
+        (points[:, 0] >= x_min) & (points[:, 0] <= x_max)
+        & (points[:, 1] >= y_min) & (points[:, 1] <= y_max)
+    )
+
+
+def integrate_streamlines(field, seeds, bounds, sign=1.0, max_length=1.0, step=0.02,
+                          tol=1e-3, max_steps=200, eps=1e-9):
+    """从 seeds (n, 2) 沿场的方向（sign=-1 时逆着场）积分流线
+
+    按弧长参数化（沿单位方向场积分），用 Bogacki–Shampine 2(3) 阶嵌入式
+    Runge-Kutta 法估计每一步的误差，每个种子点各自调整步长，使局部误差不超过 tol。
+    流线在离开 bounds=(x_min, x_max, y_min, y_max)、到达驻点、方向突然反转
+    或长度超过 max_length 时停止。
+
+    返回形状为 (n, max_steps + 1, 2) 的数组，每条流线停止之后的位置为 NaN。
+    """
+    points = np.array(seeds, dtype=float)
+    n = len(points)
+    out = np.full((n, max_steps + 1, 2), np.nan)
+    out[:, 0] = points
+    h = np.full(n, step)
+    length = np.zeros(n)
+    count = np.zeros(n, dtype=int)
+    previous = np.zeros((n, 2))
+    alive = _inside(points, bounds)
+    min_step, max_step = step / 16, step * 4
+
+    for _ in range(4 * max_steps):
+        idx = np.flatnonzero(alive)
+        if len(idx) == 0:
+            break
+        p, hh = points[idx], h[idx, None]
+        k1, speed = _unit_field(field, p, sign, eps)
+        k2, _ = _unit_field(field, p + 0.5 * hh * k1, sign, eps)
+        k3, _ = _unit_field(field, p + 0.75 * hh * k2, sign, eps)
+        high = p + hh * (2 * k1 + 3 * k2 + 4 * k3) / 9
+        k4, _ = _unit_field(field, high, sign, eps)
+        low = p + hh * (7 * k1 / 24 + k2 / 4 + k3 / 3 + k4 / 8)
+        error = np.linalg.norm(high - low, axis=1)
+
+        # 按误差调整步长；误差过大的点用缩小后的步长重算这一步
+        factor = np.clip(0.9 * (tol / np.maximum(error, 1e-12)) ** (1 / 3), 0.2, 4.0)
+        h[idx] = np.clip(hh[:, 0] * factor, min_step, max_step)
+        accept = (error <= tol) | (hh[:, 0] <= min_step)
+
+        # 驻点、方向反转（例如越过源或汇）时停止
+        stalled = speed <= eps
+        reversed_ = np.einsum("ij,ij->i", k1, previous[idx]) < 0
+        alive[idx[stalled | (accept & reversed_)]] = False
+        accept &= ~stalled & ~reversed_
+
+        acc = idx[accept]
+        new_points = high[accept]
+        step_lengths = np.linalg.norm(new_points - points[acc], axis=1)
+        count[acc] += 1
+        out[acc, count[acc]] = new_points
+        previous[acc] = k1[accept]
+        points[acc] = new_points
+        length[acc] += step_lengths
+
+        done = ~_inside(new_points, bounds) | (length[acc] >= max_length) | (count[acc] >= max_steps)
+        alive[acc[done]] = False
+    return out
+
+
+def streamlines(field, seeds, bounds, max_length=1.0, **kwargs):
+    """经过每个种子点的流线（向前、向后各积分 max_length / 2），返回折线列表
+
+    每条流线是形状为 (m, 2) 的数组，按场的方向排列；少于两个点的流线被丢弃。
+    其余参数与 integrate_streamlines 相同。
+    """
+    forward = integrate_streamlines(field, seeds, bounds, 1.0, max_length / 2, **kwargs)
+    backward = integrate_streamlines(field, seeds, bounds, -1.0, max_length / 2, **kwargs)
+    lines = []
+    for fwd, bwd in zip(forward, backward):
+        fwd = fwd[~np.isnan(fwd[:, 0])]
+        bwd = bwd[~np.isnan(bwd[:, 0])]
+        line = np.concatenate([bwd[::-1], fwd[1:]])
+        if len(line) >= 2:
+            lines.append(line)
+    return lines
+
+
+def jittered_seeds(bounds, n_x, n_y, jitter=0.5, seed=0):
+    """在 bounds 内 n_x × n_y 的网格上随机抖动的种子点，形状为 (n_x * n_y, 2)"""
+    x_min, x_max, y_min, y_max = bounds
+    rng = np.random.default_rng(seed)
+    dx, dy = (x_max - x_min) / n_x, (y_max - y_min) / n_y
+    X, Y = np.meshgrid(x_min + (np.arange(n_x) + 0.5) * dx, y_min + (np.arange(n_y) + 0.5) * dy)
+    offsets = rng.uniform(-jitter / 2, jitter / 2, size=(X.size, 2)) * [dx, dy]
+    return np.stack([X.ravel(), Y.ravel()], axis=-1) + offsets
+
+
+def lic_texture(field, bounds, resolution=(400, 400), kernel_length=20, seed=0):
+    """线积分卷积纹理：每个像素沿流线向前、向后各走 kernel_length 步，对白噪声取平均
+
+    resolution 为 (宽, 高) 像素；每步走一个像素，方向用中点法计算。
+    所有像素同时追踪，每步只调用两次 field。
+    返回形状为 (高, 宽)、取值在 [0, 1] 的数组，第 0 行对应 y_min
+    （matplotlib 中用 origin='lower' 显示）。
+    """
+    x_min, x_max, y_min, y_max = bounds
+    width, height = resolution
+    dx, dy = (x_max - x_min) / width, (y_max - y_min) / height
+    ds = min(dx, dy)
+    noise = np.random.default_rng(seed).random((height, width))
+
+    X, Y = np.meshgrid(x_min + (np.arange(width) + 0.5) * dx, y_min + (np.arange(height) + 0.5) * dy)
+    start = np.stack([X.ravel(), Y.ravel()], axis=-1)
+    total = noise.ravel().copy()
+    weight = np.ones(len(start))
+
+    for sign in (1.0, -1.0):
+        points = start.copy()
+        active = np.ones(len(points), dtype=bool)
+        for _ in range(kernel_length):
+            k1, _ = _unit_field(field, points, sign)
+            k2, _ = _unit_field(field, points + 0.5 * ds * k1, sign)
+            points += ds * k2
+            active &= _inside(points, bounds) & np.any(k2 != 0, axis=1)
+            cols = np.clip(((points[:, 0] - x_min) / dx).astype(int), 0, width - 1)
+            rows = np.clip(((points[:, 1] - y_min) / dy).astype(int), 0, height - 1)
+            total += np.where(active, noise[rows, cols], 0)
+            weight += active
+
+    texture = (total / weight).reshape(height, width)
+    # 平均后对比度变低，按分位数拉伸到 [0, 1]
+    low, high = np.percentile(texture, [1, 99])
+    return np.clip((texture - low) / max(high - low, 1e-12), 0, 1)
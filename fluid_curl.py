@@ -1,4 +1,6 @@
 from manim import *
+from particle_system import ParticleCloud, ParticleSystem, rotation_velocity
+from trail import TrailGroup
 import numpy as np
 
 config.tex_template = TexTemplateLibrary.ctex
@@ -32,30 +34,25 @@ class FluidCurl(ThreeDScene):
         self.play(Create(axes))
         self.wait(1)
 
-        # 创建流体粒子（用小球表示）
-        particles = VGroup()
-        particle_traces = VGroup()  # 存储粒子轨迹
-        n_particles = 30
-        radius = 2
-
-        for i in range(n_particles):
-            angle = i * TAU / n_particles
-            pos = np.array([
-                radius * np.cos(angle),
-                radius * np.sin(angle),
-                0
-            ])
-            particle = Sphere(radius=0.1, fill_opacity=0.8)
-            particle.set_color(BLUE)
-            particle.move_to(pos)
-            particles.add(particle)
-            
-            # 为每个粒子创建轨迹
-            trace = VMobject(stroke_color=BLUE_A, stroke_opacity=0.3)
-            trace.set_points_as_corners([pos, pos])
-            particle_traces.add(trace)
-
-        self.play(Create(particles), Create(particle_traces))
+        # 创建流体粒子：多个同心圆环上的粒子，位置保存在同一个数组中整体推进
+        n_rings = 12
+        n_per_ring = 100
+        radii = np.repeat(np.linspace(0.4, 2.6, n_rings), n_per_ring)
+        angles = np.tile(np.linspace(0, TAU, n_per_ring, endpoint=False), n_rings)
+        start_positions = np.stack([
+            radii * np.cos(angles),
+            radii * np.sin(angles),
+            np.zeros_like(radii)
+        ], axis=-1)
+
+        # 绕z轴的刚体旋转（角速度0.5）
+        system = ParticleSystem(start_positions, rotation_velocity(omega=0.5))
+        particles = ParticleCloud(system.positions, color=BLUE, opacity=0.8)
+
+        # 每个粒子的轨迹保留最近50个位置，尾部逐渐变淡
+        particle_traces = TrailGroup(start_positions, capacity=50, color=BLUE_A, stroke_width=1, opacity=0.3)
+
+        self.play(FadeIn(particles), Create(particle_traces))
 
         # 创建浮标（用于显示局部旋转）
         paddles = VGroup()
@@ -103,24 +100,12 @@ class FluidCurl(ThreeDScene):
 
         # 添加动画
         def update_particles(particles, dt):
-            for i, particle in enumerate(particles):
-                # 获取当前位置
-                pos = particle.get_center()
-                # 计算新位置（旋转运动）
-                angle = dt * 0.5  # 角速度
-                x, y, z = pos
-                new_x = x * np.cos(angle) - y * np.sin(angle)
-                new_y = x * np.sin(angle) + y * np.cos(angle)
-                new_pos = np.array([new_x, new_y, z])
-                particle.move_to(new_pos)
-                
-                # 更新轨迹
-                trace = particle_traces[i]
-                points = trace.get_points()
-                points = np.vstack([points, [new_pos]])
-                if len(points) > 50:  # 限制轨迹长度
-                    points = points[-50:]
-                trace.set_points_as_corners(points)
+            if dt == 0:
+                return
+            system.step(dt)
+            particles.set_positions(system.positions)
+            # 更新轨迹（原地写入环形缓冲区，不重新分配数组）
+            particle_traces.add_points(system.positions)
 
         # 创建浮标旋转动画
         paddle_rotations = [
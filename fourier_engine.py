@@ -0,0 +1,195 @@
+"""傅里叶级数计算
+
+FourierSeries 对一个周期的等距采样做一次 FFT 得到全部系数，
+之后在整个采样网格上计算任意多个部分和只需一次矩阵乘法：
+
+    S = a_0 + W @ B
+
+其中 B 的各行是 cos(kωx)、sin(kωx) 在网格上的值，W 的每一行是
+“前 n 项为系数、其余为 0”的累加权重，S 的每一行就是一个部分和 S_n(x)。
+"""
+
+from manim import *
+import numpy as np
+
+
+class FourierSeries:
+    """周期为 period 的函数的实傅里叶级数
+
+    f(x) ≈ a_0 + Σ_k (a_k cos(kωx) + b_k sin(kωx))，ω = 2π / period。
+    func 必须接受数组；n_samples 越大，高次系数受混叠的影响越小。
+    采样点取在各小区间的中点，避免恰好落在方波等函数的间断点上。
+    """
+
+    def __init__(self, func, period=TAU, n_samples=4096):
+        step = period / n_samples
+        x = (np.arange(n_samples) + 0.5) * step
+        self._init_from_samples(np.asarray(func(x), dtype=float), period, offset=step / 2)
+
+    @classmethod
+    def from_samples(cls, samples, period=TAU):
+        """由 [0, period) 上的等距采样值构造"""
+        series = cls.__new__(cls)
+        series._init_from_samples(np.asarray(samples, dtype=float), period)
+        return series
+
+    def _init_from_samples(self, samples, period, offset=0.0):
+        n = len(samples)
+        self.period = period
+        self.omega = TAU / period
+        spectrum = np.fft.rfft(samples) / n
+        # 第一个采样点在 x = offset 处，相应地平移各频率分量的相位
+        spectrum *= np.exp(-1j * np.arange(len(spectrum)) * self.omega * offset)
+        self.a0 = spectrum[0].real
+        # c_k = (a_k - i b_k) / 2；最后一项在 n 为偶数时是奈奎斯特频率，不使用
+        self.a = 2 * spectrum[1:(n + 1) // 2].real
+        self.b = -2 * spectrum[1:(n + 1) // 2].imag
+
+    @property
+    def max_harmonic(self):
+        return len(self.a)
+
+    def basis(self, x, max_harmonic):
+        """cos(kωx)、sin(kωx)（k = 1..max_harmonic）在 x 上的值，形状为 (2K, len(x))"""
+        phase = np.outer(np.arange(1, max_harmonic + 1) * self.omega, x)
+        return np.concatenate([np.cos(phase), np.sin(phase)])
+
+    def partial_sums(self, x, harmonics):
+        """各部分和在 x 上的值，形状为 (len(harmonics), len(x))
+
+        harmonics 中的每个 n 表示包含 1..n 次谐波的部分和 S_n。
+        """
+        x = np.asarray(x, dtype=float)
+        harmonics = np.atleast_1d(harmonics)
+        k_max = int(harmonics.max())
+        if k_max > self.max_harmonic:
+            raise ValueError(f"最多只能计算到 {self.max_harmonic} 次谐波，请增大 n_samples")
+        # 第 i 行的前 harmonics[i] 个权重为 1
+        mask = np.arange(k_max)[None, :] < harmonics[:, None]
+        weights = np.concatenate([mask * self.a[:k_max], mask * self.b[:k_max]], axis=1)
+        return self.a0 + weights @ self.basis(x, k_max)
+
+    def __call__(self, x, n):
+        """部分和 S_n(x)"""
+        return self.partial_sums(np.atleast_1d(x), [n])[0]
+
+
+def sample_closed_path(mobject, n_samples=1024):
+    """沿 VMobject（例如 SVGMobject）的全部子路径按弧长等距取 n_samples 个点，形状为 (n, 3)
+
+    先把每段三次贝塞尔曲线在 16 个参数值上展开成折线（一次矩阵乘法），
+    再按累计弧长插值；各子路径首尾相接，组成一条闭合路径。
+    """
+    curves = np.concatenate([
+        mob.points[:len(mob.points) // 4 * 4].reshape(-1, 4, 3)
+        for mob in mobject.family_members_with_points()
+    ])
+    t = np.linspace(0, 1, 16, endpoint=False)[:, None]
+    bernstein = np.hstack([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3])
+    polyline = np.einsum("sj,cjd->csd", bernstein, curves).reshape(-1, 3)
+    polyline = np.vstack([polyline, polyline[:1]])
+    arc = np.concatenate([[0], np.cumsum(np.linalg.norm(np.diff(polyline, axis=0), axis=1))])
+    targets = np.linspace(0, arc[-1], n_samples, endpoint=False)
+    return np.stack([np.interp(targets, arc, polyline[:, d]) for d in range(3)], axis=-1)
+
+
+class Epicycles:
+    """闭合路径的复数离散傅里叶变换，用旋转向量链（本轮）重现路径
+
+    points 为沿路径等距采样的点（(n, 2) 或 (n, 3)，只使用 x、y）。
+    保留模最大的 n_terms 个频率分量，按模从大到小排列。
+    """
+
+    def __init__(self, points, n_terms=None):
+        points = np.asarray(points, dtype=float)
+        z = points[:, 0] + 1j * points[:, 1]
+        n = len(z)
+        coefficients = np.fft.fft(z) / n
+        frequencies = np.fft.fftfreq(n, 1 / n)
+        order = np.argsort(-np.abs(coefficients))[:n_terms]
+        self.coefficients = coefficients[order]
+        self.frequencies = frequencies[order]
+
+    @property
+    def radii(self):
+        return np.abs(self.coefficients)
+
+    def chain(self, times):
+        """各时刻（一周为 [0, 1)）向量链各节点的位置，形状为 (len(times), n_terms + 1) 的复数
+
+        第 0 列为原点，第 j 列为前 j 个旋转向量之和，最后一列为画笔位置；
+        全部时刻一次算出：先求 (时刻 × 分量) 的旋转向量矩阵，再沿分量方向累加。
+        """
+        times = np.asarray(times, dtype=float)
+        vectors = self.coefficients * np.exp(TAU * 1j * np.outer(times, self.frequencies))
+        chain = np.zeros((len(times), len(self.coefficients) + 1), dtype=complex)
+        np.cumsum(vectors, axis=1, out=chain[:, 1:])
+        return chain
+
+
+def _unit_circle_bezier(n_segments=8):
+    """单位圆的三次贝塞尔控制点，形状为 (4 * n_segments, 3)"""
+    angles = np.linspace(0, TAU, n_segments + 1)
+    handle = 4 / 3 * np.tan(TAU / n_segments / 4)
+    start, end = angles[:-1], angles[1:]
+    points = np.stack([
+        np.stack([np.cos(start), np.sin(start)], axis=-1),
+        np.stack([np.cos(start) - handle * np.sin(start), np.sin(start) + handle * np.cos(start)], axis=-1),
+        np.stack([np.cos(end) + handle * np.sin(end), np.sin(end) - handle * np.cos(end)], axis=-1),
+        np.stack([np.cos(end), np.sin(end)], axis=-1),
+    ], axis=1)
+    return np.concatenate([points, np.zeros((*points.shape[:2], 1))], axis=-1).reshape(-1, 3)
+
+
+def _to_points(z):
+    return np.stack([z.real, z.imag, np.zeros(z.shape)], axis=-1)
+
+
+class EpicycleDrawing(VGroup):
+    """本轮画图：圆、旋转臂和画笔轨迹
+
+    构造时就算好 n_frames 帧中全部向量链的位置（一次 (帧数 × 项数) 的复数累加），
+    set_progress 只从表中取出一帧，把所有圆、所有臂分别作为一个 VMobject 的子路径
+    整体写入，没有逐项的 Python 循环。
+
+    表中的位置是相对于图形自身的坐标。不可见的子对象 reference 记录图形的
+    原点和基向量，随整个图形一起平移、缩放、旋转；每帧的点经它给出的仿射
+    变换放到场景中，构造后对图形做的变换在 set_progress 之后仍然保留。
+    """
+
+    # reference 基向量的长度，取得很小，不影响图形的边界框
+    reference_size = 0.01
+
+    def __init__(self, epicycles, n_frames, center=ORIGIN, circle_color=BLUE_E,
+                 arm_color=WHITE, trace_color=YELLOW, **kwargs):
+        super().__init__(**kwargs)
+        self.chain = epicycles.chain(np.linspace(0, 1, n_frames))
+        self._tips = _to_points(self.chain[:, -1])
+        self._circle_template = _unit_circle_bezier()
+        self._radii = epicycles.radii
+
+        self.reference = VMobject(stroke_width=0, stroke_opacity=0, fill_opacity=0)
+        self.reference.set_points(np.array([ORIGIN, RIGHT, UP, OUT]) * self.reference_size + center)
+        self.circles = VMobject(stroke_color=circle_color, stroke_width=1, stroke_opacity=0.6)
+        self.arms = VMobject(stroke_color=arm_color, stroke_width=1.5)
+        self.trace = VMobject(stroke_color=trace_color, stroke_width=3)
+        self.add(self.reference, self.circles, self.arms, self.trace)
+        self.set_progress(0)
+
+    def _place(self, points):
+        """图形自身坐标 (..., 3) 转换为场景坐标"""
+        origin = self.reference.points[0]
+        basis = (self.reference.points[1:] - origin) / self.reference_size
+        return origin + points @ basis
+
+    def set_progress(self, alpha):
+        """显示进度 alpha ∈ [0, 1] 对应的一帧"""
+        frame = int(round(alpha * (len(self.chain) - 1)))
+        nodes = _to_points(self.chain[frame])
+        # 第 k 个圆以第 k 个节点为圆心、以第 k 个分量的模为半径
+        circles = nodes[:-1, None, :] + self._radii[:, None, None] * self._circle_template
+        self.circles.set_points(self._place(circles.reshape(-1, 3)))
+        self.arms.set_points_as_corners(self._place(nodes))
+        tips = self._tips[:frame + 1] if frame > 0 else self._tips[[0, 0]]
+        self.trace.set_points_as_corners(self._place(tips))
+        return self
@@ -2,6 +2,9 @@
 from manim import *
 import numpy as np
 
+from fourier_engine import FourierSeries
+from geometry import graph_from_samples
+
 class FourierSeriesVisualization(Scene):
     def construct(self):
         # 设置默认字体
@@ -47,12 +50,10 @@ class FourierSeriesVisualization(Scene):
         def square_wave(x):
             return np.where(np.sin(x) >= 0, 1, -1)  # 恢复原来的方波函数定义
 
-        # 定义傅立叶级数部分和函数
-        def get_fourier_series(x, n):
-            result = 0
-            for k in range(1, n+1, 2):
-                result += 4/(k*np.pi) * np.sin(k*x)
-            return result
+        # 傅立叶系数用FFT只计算一次，各阶部分和在整个采样网格上一次算出
+        harmonics = [1, 3, 5, 9, 15, 23]
+        x_samples = np.arange(-4, 4 + 0.005, 0.01)
+        partial_sums = FourierSeries(square_wave).partial_sums(x_samples, harmonics)
 
         # 显示原函数图像
         original = axes.plot(
@@ -99,13 +100,9 @@ class FourierSeriesVisualization(Scene):
         approximations = []
         labels = []
         
-        for i, n in enumerate([1, 3, 5, 9, 15, 23]):
+        for i, n in enumerate(harmonics):
             # 绘制第n项逼近
-            approx = axes.plot(
-                lambda x: get_fourier_series(x, n),
-                color=colors[i],
-                x_range=[-4, 4, 0.01]
-            )
+            approx = graph_from_samples(axes, x_samples, partial_sums[i], color=colors[i])
             approximations.append(approx)
             
             # 添加标签
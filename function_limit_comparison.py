@@ -8,17 +8,19 @@
 """
 
 import numpy as np
+from mpl_export import animate
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib import cm
 
+from limit_kernels import sinc, radial_sinc, evaluate_on_grid
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei']  # 正常显示中文
 plt.rcParams['axes.unicode_minus'] = False    # 正常显示负号
 
 def create_animation():
-    """创建动画对比一元函数和二元函数的概念和极限"""
+    """创建动画对比一元函数和二元函数的概念和极限，返回 (图形, 更新函数, 帧序列)"""
     
     # 创建图形和子图布局
     fig = plt.figure(figsize=(16, 8))
@@ -44,23 +46,12 @@ def create_animation():
     ax2.set_zlabel('f(x,y)')
     ax2.set_title('二元函数 f(x,y) = sin(√(x²+y²))/√(x²+y²) 的极限')
     
-    # 一元函数 f(x) = sin(x)/x
+    # 一元函数 f(x) = sin(x)/x（x = 0 处无定义，取 NaN 使曲线在此断开）
     def f1(x):
-        with np.errstate(divide='ignore', invalid='ignore'):
-            result = np.sin(x) / x
-        return result
-    
-    # 二元函数 f(x,y) = sin(√(x²+y²))/√(x²+y²)
-    def f2(x, y):
-        r = np.sqrt(x**2 + y**2)
-        with np.errstate(divide='ignore', invalid='ignore'):
-            result = np.sin(r) / r
-        # 处理原点的情况
-        if isinstance(r, np.ndarray):
-            result[r == 0] = 1
-        elif r == 0:
-            result = 1
-        return result
+        return sinc(x, at_zero=np.nan)
+    
+    # 二元函数 f(x,y) = sin(√(x²+y²))/√(x²+y²)，原点处补充定义为极限值 1
+    f2 = radial_sinc
     
     # 绘制初始状态
     x = np.linspace(-5, 5, 1000)
@@ -72,15 +63,8 @@ def create_animation():
     limit_text1 = ax1.text(0.05, 0.95, '', transform=ax1.transAxes, 
                           fontsize=10, verticalalignment='top')
     
-    # 二元函数表面
-    x = np.linspace(-5, 5, 100)
-    y = np.linspace(-5, 5, 100)
-    X, Y = np.meshgrid(x, y)
-    Z = np.zeros_like(X)
-    
-    for i in range(len(x)):
-        for j in range(len(y)):
-            Z[i, j] = f2(X[i, j], Y[i, j])
+    # 二元函数表面：整个网格一次性向量化计算
+    X, Y, Z = evaluate_on_grid(f2, (-5, 5), (-5, 5), 100)
     
     surface = ax2.plot_surface(X, Y, Z, cmap=cm.viridis, alpha=0.8, 
                               rstride=1, cstride=1, linewidth=0)
@@ -129,24 +113,18 @@ def create_animation():
         
         return line1, point1, limit_text1, surface, point2, limit_text2
     
-    # 创建动画
-    ani = FuncAnimation(fig, update, frames=np.arange(0, 100), 
-                       interval=100, blit=False)
-    
     # 调整布局
     plt.tight_layout()
     
-    return fig, ani
+    return fig, update, np.arange(0, 100)
 
 def main():
     """主函数"""
-    fig, ani = create_animation()
+    fig, update, frames = create_animation()
     
     # 显示图形和动画
-    plt.show()
-    
-    # 保存动画（可选）
-    # ani.save('function_limit_comparison.gif', writer='pillow', fps=10)
+    # 导出视频：python function_limit_comparison.py --export function_limit_comparison.mp4 --fps 10
+    ani = animate(fig, update, frames, interval=100, blit=False)
     
     print("动画展示完成！")
 
@@ -2,6 +2,9 @@
 from manim import *
 import numpy as np
 
+from geometry import graph_from_samples
+from series_engine import SeriesPartialSums
+
 class FunctionSeriesConvergence(Scene):
     def construct(self):
         # 设置默认字体
@@ -44,9 +47,9 @@ class FunctionSeriesConvergence(Scene):
         def get_term(x, n):
             return 1/(n**2 * x**2 + 1)
 
-        # 定义部分和函数
-        def get_partial_sum(x, N):
-            return sum(get_term(x, n) for n in range(1, N+1))
+        # 所有部分和 S_1 ... S_10 在采样点上一次算出
+        xs = np.arange(-4, 4 + 1e-9, 0.01)
+        series_sums = SeriesPartialSums(lambda n, x: get_term(x, n), 10, x=xs, start=1)
 
         # 绘制前几项
         colors = [RED, GREEN, BLUE, YELLOW, PURPLE]
@@ -84,11 +87,7 @@ class FunctionSeriesConvergence(Scene):
         
         for i, N in enumerate([1, 2, 3, 5, 10]):
             # 绘制部分和
-            sum_curve = axes.plot(
-                lambda x: get_partial_sum(x, N),
-                color=WHITE,
-                x_range=[-4, 4, 0.01]
-            )
+            sum_curve = graph_from_samples(axes, xs, series_sums(N), color=WHITE)
             partial_sums.append(sum_curve)
             
             # 添加标签
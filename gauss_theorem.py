@@ -1,4 +1,6 @@
 from manim import *
+from arrow_field import ArrowField3D
+from fast_surface import FastSurface
 import numpy as np
 
 config.tex_template = TexTemplateLibrary.ctex
@@ -33,12 +35,12 @@ class GaussTheorem(ThreeDScene):
         self.wait(1)
 
         # 创建一个球体（作为闭合曲面）
-        sphere = Surface(
-            lambda u, v: np.array([
+        sphere = FastSurface(
+            lambda u, v: (
                 np.cos(u) * np.cos(v),
                 np.cos(u) * np.sin(v),
                 np.sin(u)
-            ]),
+            ),
             u_range=[-PI/2, PI/2],
             v_range=[0, 2*PI],
             resolution=(20, 40),
@@ -50,58 +52,35 @@ class GaussTheorem(ThreeDScene):
         self.wait(1)
 
         # 创建向外的法向量场
-        normal_vectors = VGroup()
-        points = [
+        points = np.array([
             (0, 0, 1),    # 顶部
             (0, 0, -1),   # 底部
             (1, 0, 0),    # 右
             (-1, 0, 0),   # 左
             (0, 1, 0),    # 前
             (0, -1, 0),   # 后
-        ]
+        ], dtype=float)
         
-        for point in points:
-            normal = np.array(point)  # 球面上的点就是其法向量方向
-            vector = Arrow3D(
-                start=normal,
-                end=normal * 1.5,  # 延长法向量
-                color=YELLOW,
-                thickness=0.03
-            )
-            normal_vectors.add(vector)
+        # 球面上的点就是其法向量方向，延长到1.5倍
+        normal_vectors = ArrowField3D(points, points * 0.5, color=YELLOW, thickness=0.03)
 
         # 修改向量场为从一个偏移点发出
         source_point = np.array([0.3, 0.3, 0.3])  # 源点位置
-        field_vectors = VGroup()
-        for point in points:
-            start = np.array(point) * 0.3
-            # 计算从源点到表面点的方向
-            direction = np.array(point) - source_point
-            # 归一化并设置长度
-            direction = direction / np.linalg.norm(direction) * 1.5
-            end = start + direction
-            
-            vector = Arrow3D(
-                start=start,
-                end=end,
-                color=RED,
-                thickness=0.03
-            )
-            field_vectors.add(vector)
+        # 计算从源点到表面点的方向，归一化并设置长度
+        directions = points - source_point
+        directions = directions / np.linalg.norm(directions, axis=1, keepdims=True) * 1.5
+        field_vectors = ArrowField3D(points * 0.3, directions, color=RED, thickness=0.03)
 
         
         # 创建点M处的向量场箭头（将在收缩后显示）
-        point_vectors = VGroup()
-        for direction in [(1, 0, 0), (-1, 0, 0), (0, 1, 0), 
-                         (0, -1, 0), (0, 0, 1), (0, 0, -1)]:
-            direction = np.array(direction)
-            vector = Arrow3D(
-                start=source_point,
-                end=source_point + direction * 0.5,  # 较短的箭头
-                color=RED,
-                thickness=0.02
-            )
-            point_vectors.add(vector)
+        directions = np.array([(1, 0, 0), (-1, 0, 0), (0, 1, 0),
+                               (0, -1, 0), (0, 0, 1), (0, 0, -1)], dtype=float)
+        point_vectors = ArrowField3D(
+            np.tile(source_point, (len(directions), 1)),
+            directions * 0.5,  # 较短的箭头
+            color=RED,
+            thickness=0.02
+        )
 
         # 修改等待时间
         self.play(Create(normal_vectors))
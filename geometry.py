@@ -0,0 +1,58 @@
+"""坐标变换与折线的公共工具
+
+本模块只依赖 numpy（graph_from_samples 在调用时才导入 manim），
+引擎模块（mesh_cache、粒子系统等）可以放心导入，也便于单独测试。
+"""
+
+import numpy as np
+
+
+def affine_basis(axes):
+    """坐标轴的仿射表示 (原点, 基向量)，基向量按行排列，形状为 (3, 3)
+
+    坐标轴是线性的，因此 c2p 是仿射变换：原点 + x * e_x + y * e_y + z * e_z，
+    调用四次 c2p 即可完全确定。二维坐标轴的 c2p 同样接受三个坐标。
+    """
+    origin = np.asarray(axes.c2p(0, 0, 0), dtype=float)
+    basis = np.array([axes.c2p(1, 0, 0), axes.c2p(0, 1, 0), axes.c2p(0, 0, 1)], dtype=float) - origin
+    return origin, basis
+
+
+def axes_c2p(axes, x, y, z=0):
+    """axes.c2p 的数组版本：x, y, z 可以是任意形状（可广播）的数组，返回形状为 (..., 3) 的场景坐标
+
+    先用 affine_basis 求出基向量，之后整个网格一次矩阵运算完成。
+    """
+    origin, basis = affine_basis(axes)
+    coords = np.stack(np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in (x, y, z))), axis=-1)
+    return origin + coords @ basis
+
+
+def line_segment_points(starts, ends):
+    """从 starts 到 ends 的直线段的三次贝塞尔控制点，形状为 (..., 4, 3)
+
+    控制点位于 1/3、2/3 处，与 VMobject.set_points_as_corners 相同。
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    t = np.linspace(0, 1, 4).reshape(4, 1)
+    return starts[..., None, :] + t * (ends - starts)[..., None, :]
+
+
+def polyline_bezier_points(corners):
+    """折线顶点 (..., n, 3) 转换为 VMobject 的贝塞尔控制点 (..., 4(n-1), 3)
+
+    每段是一条直线段；前面的维度各自成为一条独立的折线。
+    """
+    corners = np.asarray(corners, dtype=float)
+    segments = line_segment_points(corners[..., :-1, :], corners[..., 1:, :])
+    return segments.reshape(*corners.shape[:-2], -1, 3)
+
+
+def graph_from_samples(axes, x, y, **kwargs):
+    """由采样点直接构造函数图像（折线），不再逐点调用函数"""
+    from manim import VMobject
+
+    graph = VMobject(**kwargs)
+    graph.set_points(polyline_bezier_points(axes_c2p(axes, x, y, 0)))
+    return graph
@@ -0,0 +1,196 @@
+"""逐字形缓存的文字
+
+Text 每次构造都要经过 Pango 排版、写出 SVG、再解析 SVG，一个标签要几十毫秒。
+场景里经常在循环中反复创建只有几个字不同的中文标签，大部分时间花在重复的字上。
+
+GlyphText 按 (字体, 字号, 粗细, 倾斜, 字符) 缓存每个字形的轮廓和前进宽度，
+组装标签时只复制缓存的字形并按前进宽度依次排开，新出现的字符才调用一次 Text。
+字形的位置和宽度在 "|字|" 这样的排版中测得（两侧的参考字符给出笔位置和基线），
+因此不同字符的基线对齐、间距与 Text 一致（不考虑字偶距，中文字体中影响很小）。
+
+tex=True 时字形改由 MathTex 排版，与相邻公式中的数字字体一致。
+"""
+
+from manim import *
+import numpy as np
+
+# 测量字形位置用的参考字符
+REFERENCE_CHAR = "|"
+
+# (字形样式, 字符) -> (以笔位置和基线为原点的字形（空白字符为 None）, 前进宽度, 左下角, 右上角)
+_GLYPHS = {}
+
+# 字形样式 -> 参考字符的前进宽度
+_REFERENCE_ADVANCES = {}
+
+
+class _Unsupported(Exception):
+    """字符无法单独测量（例如排版时与相邻字符合成了一个字形）"""
+
+
+def _render(text, style):
+    """按字形样式排版一段文字，返回各字形依次排列的 VGroup"""
+    options = dict(style)
+    if options.pop("tex", False):
+        # 每个字符单独成组，数学模式下不插入运算符间距（负号按一元负号排版）
+        return MathTex("".join("{" + char + "}" for char in text), **options)[0]
+    return Text(text, **options)
+
+
+def _reference_advance(style):
+    if style not in _REFERENCE_ADVANCES:
+        pair = _render(REFERENCE_CHAR * 2, style)
+        _REFERENCE_ADVANCES[style] = pair[1].get_left()[0] - pair[0].get_left()[0]
+    return _REFERENCE_ADVANCES[style]
+
+
+def _glyph(char, style):
+    key = (style, char)
+    if key not in _GLYPHS:
+        layout = _render(REFERENCE_CHAR + char + REFERENCE_CHAR, style)
+        if len(layout) not in (2, 3):
+            raise _Unsupported(char)
+        first, last = layout[0], layout[-1]
+        pen = first.get_left()[0] + _reference_advance(style)
+        advance = last.get_left()[0] - pen
+        glyph, lower, upper = None, None, None
+        if len(layout) == 3:
+            glyph = layout[1].copy().shift([-pen, -first.get_bottom()[1], 0])
+            lower, upper = glyph.get_corner(DL), glyph.get_corner(UR)
+        _GLYPHS[key] = (glyph, advance, lower, upper)
+    return _GLYPHS[key]
+
+
+class GlyphText(VGroup):
+    """单行文字，用法与 Text 相同，但由缓存的字形拼成
+
+        label = GlyphText(f"当ε = {epsilon}时:", font="SimSun").scale(0.4)
+        label.set_text(f"当ε = {epsilon}时:")  # 保持左端位置和缩放，只替换字形
+
+    set_text 复用已有的字形对象：新旧文字中相同的字符只移动位置，
+    只有新出现的字符才复制缓存的字形。多行文字或无法逐字测量的字符串
+    直接交给 Text 处理。旋转过的文字不支持 set_text。
+
+    tex 为 True 时字形由 MathTex 排版（忽略 font、weight、slant），
+    用于夹在公式中间的数字，使其字体与两侧的 MathTex 相同。
+    """
+
+    def __init__(self, text, font="", font_size=DEFAULT_FONT_SIZE, weight=NORMAL, slant=NORMAL,
+                 color=WHITE, tex=False, **kwargs):
+        super().__init__(**kwargs)
+        if tex:
+            self.style = (("tex", True), ("font_size", font_size))
+        else:
+            self.style = (("font", font), ("font_size", font_size), ("weight", weight), ("slant", slant))
+        self.text = None
+        self._chars = None
+        self._build(text, color)
+        self.center()
+
+    def _layout(self, text):
+        """各可见字形的 (字符, 缓存项, 笔位置)，以及未缩放时的包围盒"""
+        if "\n" in text:
+            raise _Unsupported(text)
+        pen = 0.0
+        layout = []
+        for char in text:
+            entry = _glyph(char, self.style)
+            if entry[0] is not None:
+                layout.append((char, entry, pen))
+            pen += entry[1]
+        if not layout:
+            return layout, None, None
+        lower = np.min([entry[2] + pen * RIGHT for _, entry, pen in layout], axis=0)
+        upper = np.max([entry[3] + pen * RIGHT for _, entry, pen in layout], axis=0)
+        return layout, lower, upper
+
+    def _build(self, text, color):
+        try:
+            layout, self._lower, self._upper = self._layout(text)
+            self.submobjects = [entry[0].copy().shift(pen * RIGHT) for _, entry, pen in layout]
+            self._chars = [char for char, _, _ in layout]
+            self._pens = np.array([pen for _, _, pen in layout])
+        except _Unsupported:
+            self.submobjects = _render(text, self.style).submobjects
+            self._chars = None
+        self.set_color(color)
+        self.text = text
+
+    def set_text(self, text):
+        """替换文字内容，保持左端位置、缩放比例和颜色"""
+        if text == self.text:
+            return self
+        layout = None
+        if self._chars is not None and self.submobjects:
+            try:
+                layout, lower, upper = self._layout(text)
+            except _Unsupported:
+                pass
+        if not layout:
+            # 无法逐字拼出、或新旧文字有一方为空白：整体重建后对齐左端
+            left = self.get_left() if self.submobjects else None
+            self._build(text, self.get_color() if self.submobjects else WHITE)
+            if left is not None and self.submobjects:
+                self.move_to(left, aligned_edge=LEFT)
+            return self
+
+        # 由当前包围盒反推“未缩放坐标 -> 画面坐标”的缩放和平移
+        scale = self.width / (self._upper[0] - self._lower[0])
+        offset = self.get_corner(DL) - scale * self._lower
+        color = self.get_color()
+        unused = {}
+        for char, mob, pen in zip(self._chars, self.submobjects, self._pens):
+            unused.setdefault(char, []).append((mob, pen))
+
+        submobjects = []
+        for char, entry, pen in layout:
+            if unused.get(char):
+                mob, old_pen = unused[char].pop()
+                mob.shift(scale * (pen - old_pen) * RIGHT)
+            else:
+                mob = entry[0].copy().set_color(color)
+                mob.scale(scale, about_point=ORIGIN).shift(offset + scale * pen * RIGHT)
+            submobjects.append(mob)
+
+        self.submobjects = submobjects
+        self._chars = [char for char, _, _ in layout]
+        self._pens = np.array([pen for _, _, pen in layout])
+        self._lower, self._upper = lower, upper
+        self.text = text
+        return self
+
+
+class NumberReadout(GlyphText):
+    """数值读数，代替每次更新都重新创建的 Text/MathTex/DecimalNumber
+
+    数字、正负号和小数点的字形按字体只渲染一次；set_value 只移动或复制
+    缓存的字形，适合在每帧执行的更新器中使用：
+
+        readout = NumberReadout(0, num_decimal_places=2, font="SimSun")
+        readout.add_updater(lambda m: m.set_value(tracker.get_value()))
+
+    与 MathTex 拼在一起时传入 tex=True，数字与公式使用同样的字形：
+
+        label = VGroup(MathTex("N ="), NumberReadout(N, num_decimal_places=0, tex=True))
+
+    include_sign 为 True 时正数也显示“+”，数值变号时宽度不变。
+    """
+
+    def __init__(self, value=0, num_decimal_places=2, include_sign=False, **kwargs):
+        self.num_decimal_places = num_decimal_places
+        self.include_sign = include_sign
+        super().__init__(self._format(value), **kwargs)
+        for char in "0123456789.+-":
+            _glyph(char, self.style)
+        self.value = value
+
+    def _format(self, value):
+        sign = "+" if self.include_sign else ""
+        return f"{value:{sign}.{self.num_decimal_places}f}"
+
+    def set_value(self, value):
+        self.value = value
+        return self.set_text(self._format(value))
+
+    def get_value(self):
+        return self.value
@@ -1,6 +1,6 @@
 import numpy as np
+from mpl_export import animate
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
 
 # 创建一个二次函数作为示例
@@ -32,48 +32,59 @@ contour = ax2.contour(X, Y, Z, levels=20, cmap='viridis')
 ax2.set_title('等高线图和Hessian特征向量')
 plt.colorbar(contour)
 
+# 设置坐标轴范围（静态图层只绘制一次，动画中不再清空坐标轴）
+ax1.set_xlim([-3, 3])
+ax1.set_ylim([-3, 3])
+ax1.set_zlim([0, 30])
+
+ax2.set_xlim([-3, 3])
+ax2.set_ylim([-3, 3])
+
 # 计算特征值和特征向量
 H = hessian(0, 0)
 eigvals, eigvecs = np.linalg.eig(H)
 
-# 动画函数
+def eigenvectors_at(angle):
+    """当前角度下旋转后的两个特征向量方向，形状为 (2, 2)，每行一个向量"""
+    return (eigvecs * np.cos(angle) + np.roll(eigvecs, 1, axis=0) * np.sin(angle)).T
+
+def arrow_segments(origin, vecs, length=2, head_ratio=0.3, head_angle=np.pi/12):
+    """三维箭头的线段（箭杆 + 两条箭头边），向量都在水平面内"""
+    tips = origin + length * np.column_stack([vecs, np.zeros(len(vecs))])
+    back = origin - tips
+    segments = []
+    for tip, b in zip(tips, back):
+        segments.append([origin, tip])
+        for sign in (1, -1):
+            c, s_ = np.cos(sign * head_angle), np.sin(sign * head_angle)
+            head = np.array([c * b[0] - s_ * b[1], s_ * b[0] + c * b[1], b[2]]) * head_ratio
+            segments.append([tip, tip + head])
+    return segments
+
+# 特征向量箭头只创建一次，之后每帧原地更新
+origin3d = np.array([0, 0, f(0, 0)])
+vecs = eigenvectors_at(0)
+quiver3d = ax1.quiver([0, 0], [0, 0], [f(0, 0)] * 2, vecs[:, 0], vecs[:, 1], [0, 0],
+                      color='red', alpha=0.6, length=2)
+quiver3d.set_segments(arrow_segments(origin3d, vecs))
+quiver2d = ax2.quiver([0, 0], [0, 0], vecs[:, 0], vecs[:, 1],
+                      color='red', alpha=0.6, scale=2)
+
+# 动画函数：静态曲面和等高线保持不变，只移动两个特征向量
 def update(frame):
-    ax1.clear()
-    ax2.clear()
-    
-    # 重新绘制3D曲面
-    surf = ax1.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8)
-    ax1.set_title('3D曲面和Hessian特征向量')
-    
-    # 重新绘制等高线
-    contour = ax2.contour(X, Y, Z, levels=20, cmap='viridis')
-    ax2.set_title('等高线图和Hessian特征向量')
-    
     # 计算当前角度
     angle = frame * 2 * np.pi / 100
+    vecs = eigenvectors_at(angle)
     
-    # 绘制特征向量
-    for i in range(2):
-        # 3D图
-        vec = eigvecs[:, i] * np.cos(angle) + np.roll(eigvecs[:, i], 1) * np.sin(angle)
-        ax1.quiver(0, 0, f(0, 0), vec[0], vec[1], 0, 
-                  color='red', alpha=0.6, length=2)
-        
-        # 等高线图
-        ax2.quiver(0, 0, vec[0], vec[1], 
-                  color='red', alpha=0.6, scale=2)
-    
-    # 设置坐标轴范围
-    ax1.set_xlim([-3, 3])
-    ax1.set_ylim([-3, 3])
-    ax1.set_zlim([0, 30])
+    # 3D图：更新三维线段后立即投影，blit 时不会经过 Axes3D.draw
+    quiver3d.set_segments(arrow_segments(origin3d, vecs))
+    quiver3d.do_3d_projection()
     
-    ax2.set_xlim([-3, 3])
-    ax2.set_ylim([-3, 3])
+    # 等高线图
+    quiver2d.set_UVC(vecs[:, 0], vecs[:, 1])
     
-    return surf, contour
+    return quiver3d, quiver2d
 
-# 创建动画
-anim = FuncAnimation(fig, update, frames=100, interval=50, blit=True)
+# 创建并显示动画（带 --export 参数时导出视频）
 plt.tight_layout()
-plt.show() 
\ No newline at end of file
+anim = animate(fig, update, frames=100, interval=50, blit=True)
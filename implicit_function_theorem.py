@@ -1,4 +1,6 @@
 from manim import *
+from fast_surface import FastSurface
+from glyph_text import NumberReadout
 import numpy as np
 
 class ImplicitFunctionTheorem(ThreeDScene):
@@ -35,8 +37,8 @@ class ImplicitFunctionTheorem(ThreeDScene):
             return x**2 + y**2 - 1
         
         # 创建表面 z = F(x,y)
-        surface = Surface(
-            lambda u, v: np.array([u, v, F(u, v)]),
+        surface = FastSurface(
+            lambda u, v: (u, v, F(u, v)),
             u_range=[-2, 2],
             v_range=[-2, 2],
             resolution=(30, 30),
@@ -49,8 +51,8 @@ class ImplicitFunctionTheorem(ThreeDScene):
         self.wait(1)
         
         # 添加 z=0 的平面
-        z_plane = Surface(
-            lambda u, v: np.array([u, v, 0]),
+        z_plane = FastSurface(
+            lambda u, v: (u, v, 0),
             u_range=[-2, 2],
             v_range=[-2, 2],
             resolution=(2, 2),
@@ -213,8 +215,8 @@ class HyperbolicExample(ThreeDScene):
             return x**2 - y**2 - 1
         
         # 创建表面 z = F(x,y)
-        surface = Surface(
-            lambda u, v: np.array([u, v, F(u, v)]),
+        surface = FastSurface(
+            lambda u, v: (u, v, F(u, v)),
             u_range=[-3, 3],
             v_range=[-3, 3],
             resolution=(30, 30),
@@ -225,8 +227,8 @@ class HyperbolicExample(ThreeDScene):
         self.play(Create(surface))
         
         # 添加 z=0 的平面
-        z_plane = Surface(
-            lambda u, v: np.array([u, v, 0]),
+        z_plane = FastSurface(
+            lambda u, v: (u, v, 0),
             u_range=[-3, 3],
             v_range=[-3, 3],
             resolution=(2, 2),
@@ -615,11 +617,14 @@ class MovingDerivativeDemo(Scene):
         
         dx_val, dy_val, slope_val = get_derivative_values(0)
         
-        # 显示偏导数
-        derivatives_tex = MathTex(
-            r"\frac{\partial F}{\partial x} = ", f"{dx_val:.2f},\\",
-            r"\frac{\partial F}{\partial y} = ", f"{dy_val:.2f}"
-        ).scale(0.7)
+        # 显示偏导数：公式部分只编译一次，数值由缓存的 LaTeX 数字字形拼成
+        dx_readout = NumberReadout(dx_val, num_decimal_places=2, tex=True)
+        dy_readout = NumberReadout(dy_val, num_decimal_places=2, tex=True)
+        derivatives_tex = VGroup(
+            MathTex(r"\frac{\partial F}{\partial x} = "), dx_readout,
+            MathTex(r",\ \frac{\partial F}{\partial y} = "), dy_readout
+        ).arrange(RIGHT, buff=0.1).scale(0.7)
+        derivatives_buff = 0.1 * 0.7
         derivatives_tex.to_corner(DL)
         self.add_fixed_in_frame_mobjects(derivatives_tex)
         self.play(Write(derivatives_tex))
@@ -724,14 +729,14 @@ class MovingDerivativeDemo(Scene):
             new_label = MathTex("P(x,y)").next_to(new_point, UR, buff=0.1)
             
             # 计算新的切线和法向量
-            dx, dy = get_derivative_values(t_val)
+            dx, dy, _ = get_derivative_values(t_val)
             
-            # 创建新的偏导数文本
-            new_derivatives = MathTex(
-                r"\frac{\partial F}{\partial x} = ", f"{dx:.2f},\\",
-                r"\frac{\partial F}{\partial y} = ", f"{dy:.2f}"
-            ).scale(0.7)
-            new_derivatives.to_corner(DL)
+            # 偏导数读数随动画从旧值连续变化到新值
+            def update_derivatives(mob, alpha, old=(dx_readout.get_value(), dy_readout.get_value()), new=(dx, dy)):
+                dx_readout.set_value(interpolate(old[0], new[0], alpha))
+                dy_readout.set_value(interpolate(old[1], new[1], alpha))
+                # 数值变号时宽度改变，重新排列，避免与后面的公式重叠
+                mob.arrange(RIGHT, buff=derivatives_buff).to_corner(DL)
             
             # 计算新的切线
             tangent_vector = np.array([-dy, dx, 0])
@@ -759,7 +764,7 @@ class MovingDerivativeDemo(Scene):
                 Transform(moving_point_label, new_label),
                 Transform(tangent_line, new_tangent),
                 Transform(normal_arrow, new_normal),
-                Transform(derivatives_tex, new_derivatives),
+                UpdateFromAlphaFunc(derivatives_tex, update_derivatives),
                 run_time=0.5
             )
         
@@ -827,8 +832,8 @@ class ImplicitFunction3D(ThreeDScene):
         self.play(Write(function_tex))
         
         # 创建曲面 z = x^2 + y^2
-        surface = Surface(
-            lambda u, v: np.array([u, v, u**2 + v**2]),
+        surface = FastSurface(
+            lambda u, v: (u, v, u**2 + v**2),
             u_range=[-2, 2],
             v_range=[-2, 2],
             resolution=(30, 30),
@@ -842,8 +847,8 @@ class ImplicitFunction3D(ThreeDScene):
         
         # 创建水平截面 z = 1
         z_level = 1
-        plane = Surface(
-            lambda u, v: np.array([u, v, z_level]),
+        plane = FastSurface(
+            lambda u, v: (u, v, z_level),
             u_range=[-2, 2],
             v_range=[-2, 2],
             resolution=(2, 2),
@@ -0,0 +1,67 @@
+"""极限演示用的函数核
+
+sinc、radial_sinc 在原点有可去奇点，补充定义为极限值后处处连续；
+xy_over_r2 是对照用的反例，原点处极限不存在（沿不同方向趋近得到不同的值），
+它的 at_zero 只是画图时原点处取的值，不能当作极限。
+
+这些函数都像 numpy 的 ufunc 一样工作：输入可以是标量，也可以是任意形状的
+数组（会按广播规则计算），输出形状与输入一致，标量输入返回标量。
+在奇点处（分母为 0）返回给定的补充定义值，不产生除零警告；
+输入中的 NaN 原样传播为 NaN。
+"""
+
+import numpy as np
+
+
+def _as_result(result, *inputs):
+    """标量输入返回 Python 浮点数，数组输入返回数组"""
+    if all(np.ndim(v) == 0 for v in inputs):
+        return float(result)
+    return result
+
+
+# ---- 可去奇点：at_zero 默认取极限值 ----
+
+def sinc(x, at_zero=1.0):
+    """sin(x)/x，x = 0 处补充定义为 at_zero（默认取极限值 1）"""
+    x_arr = np.asarray(x, dtype=float)
+    # np.sinc(t) = sin(πt)/(πt)，原点处已取极限值 1
+    result = np.sinc(x_arr / np.pi)
+    if at_zero != 1.0:
+        result = np.where(x_arr == 0, at_zero, result)
+    return _as_result(result, x)
+
+
+def radial_sinc(x, y, at_zero=1.0):
+    """sin(r)/r，r = √(x²+y²)，原点处补充定义为 at_zero"""
+    r = np.hypot(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    result = np.sinc(r / np.pi)
+    if at_zero != 1.0:
+        result = np.where(r == 0, at_zero, result)
+    return _as_result(result, x, y)
+
+
+# ---- 无极限的例子：奇点不可去，at_zero 只是画图用的取值 ----
+
+def xy_over_r2(x, y, at_zero=0.0):
+    """xy/(x²+y²)，原点处极限不存在：沿 y = kx 趋近时极限为 k/(1+k²)，随方向变化
+
+    不是可去奇点，原点处无论补充定义为什么值都不连续；at_zero 只决定
+    画图时原点处的取值（默认 0，与沿坐标轴趋近的值相同）。
+    """
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+    # 分母只在原点为 0，其余位置直接相除
+    den = x_arr**2 + y_arr**2
+    num, den = np.broadcast_arrays(x_arr * y_arr, den)
+    result = np.full(num.shape, at_zero, dtype=float)
+    np.divide(num, den, out=result, where=den != 0)
+    return _as_result(result, x, y)
+
+
+def evaluate_on_grid(func, x_range, y_range, resolution):
+    """在 resolution × resolution 的网格上一次性计算 func，返回 X, Y, Z"""
+    x = np.linspace(*x_range, resolution)
+    y = np.linspace(*y_range, resolution)
+    X, Y = np.meshgrid(x, y)
+    return X, Y, func(X, Y)
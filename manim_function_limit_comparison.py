@@ -9,6 +9,10 @@
 from manim import *
 import numpy as np
 
+from fast_surface import FastSurface
+from geometry import axes_c2p
+from limit_kernels import radial_sinc, xy_over_r2
+
 # 配置中文支持
 config.tex_template.add_to_preamble(r"\usepackage[UTF8]{ctex}")
 
@@ -166,17 +170,14 @@ class TwoVariableFunction(ThreeDScene):
         
         # 函数定义
         def f(x, y):
-            r = np.sqrt(x**2 + y**2)
-            if r == 0:
-                return A
-            return np.sin(r) / r
+            return radial_sinc(x, y, at_zero=A)
         
         # 创建曲面
-        surface = Surface(
-            lambda u, v: axes.c2p(u, v, f(u, v)),
+        surface = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, f(u, v)),
             u_range=[-4, 4],
             v_range=[-4, 4],
-            resolution=(20, 20),
+            resolution="auto",
             checkerboard_colors=[BLUE_D, BLUE_E],
             fill_opacity=0.7
         )
@@ -327,20 +328,17 @@ class LimitDoesNotExist(ThreeDScene):
         
         # 函数定义
         def f(x, y):
-            r_squared = x**2 + y**2
-            if r_squared == 0:
-                return A  # 函数在原点未定义，但这里设为A便于可视化
-            return (x * y) / r_squared
-        
-        # 创建表面，去除原点周围以避免奇点
-        resolution = 20  # 减小以提高性能
-        surface = Surface(
-            lambda u, v: axes.c2p(
-                u, v, f(u, v)
+            # 函数在原点未定义，但这里设为A便于可视化
+            return xy_over_r2(x, y, at_zero=A)
+        
+        # 创建表面（分辨率按渲染质量自动选择）
+        surface = FastSurface(
+            lambda u, v: axes_c2p(
+                axes, u, v, f(u, v)
             ),
             u_range=[-4, 4],
             v_range=[-4, 4],
-            resolution=(resolution, resolution),
+            resolution="auto",
             checkerboard_colors=[BLUE_D, BLUE_E],
             fill_opacity=0.7
         )
@@ -848,17 +846,14 @@ class CompleteFunctionLimitDemo(ThreeDScene):
         
         # 函数定义，计算曲面上的点
         def f(x, y):
-            r = np.sqrt(x**2 + y**2)
-            if r == 0:
-                return A
-            return np.sin(r) / r
+            return radial_sinc(x, y, at_zero=A)
         
         # 创建曲面
-        surface = Surface(
-            lambda u, v: axes_3d.c2p(u, v, f(u, v)),
+        surface = FastSurface(
+            lambda u, v: axes_c2p(axes_3d, u, v, f(u, v)),
             u_range=[-4, 4],
             v_range=[-4, 4],
-            resolution=(20, 20),
+            resolution="auto",
             checkerboard_colors=[BLUE_D, BLUE_E],
             fill_opacity=0.7
         )
@@ -1011,17 +1006,15 @@ class CompleteFunctionLimitDemo(ThreeDScene):
         
         # 创建函数 z = xy/(x^2+y^2) 的曲面
         def f2(x, y):
-            r_squared = x**2 + y**2
-            if r_squared < 0.001:  # 避免除以零
-                return 0  # 返回0而不是A，因为在这个例子中沿x轴和y轴趋近的极限值是0
-            return (x * y) / r_squared
+            # 原点处返回0而不是A，因为在这个例子中沿x轴和y轴趋近的极限值是0
+            return xy_over_r2(x, y, at_zero=0)
         
         # 创建曲面
-        surface_2 = Surface(
-            lambda u, v: axes_3d_2.c2p(u, v, f2(u, v)),
+        surface_2 = FastSurface(
+            lambda u, v: axes_c2p(axes_3d_2, u, v, f2(u, v)),
             u_range=[-2, 2],
             v_range=[-2, 2],
-            resolution=(30, 30),
+            resolution="auto",
             fill_opacity=0.7,
             checkerboard_colors=[BLUE_D, BLUE_E],
         )
@@ -1,6 +1,6 @@
 import numpy as np
+from mpl_export import animate
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 
 # 设置图形和坐标轴
 fig, ax = plt.subplots(figsize=(10, 6))
@@ -104,11 +104,7 @@ ax.set_ylabel('y')
 ax.set_title('微分中值定理动画演示')
 ax.grid(True)
 
-# 创建动画
-ani = FuncAnimation(fig, update, frames=100, interval=50, blit=True)
-
-# 保存动画（可选）
-# ani.save('mean_value_theorem.gif', writer='pillow', fps=20)
-
+# 创建并显示动画
+# 导出视频：python mean_value_theorem_animation.py --export mean_value_theorem.mp4 --fps 20
 plt.tight_layout()
-plt.show() 
\ No newline at end of file
+ani = animate(fig, update, frames=100, interval=50, blit=True) 
\ No newline at end of file
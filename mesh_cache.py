@@ -0,0 +1,208 @@
+"""曲面网格缓存
+
+同一个曲面（例如 z = x² + y² 的抛物面、单位球面）常在多个场景里重复构建。
+FastSurface 计算出的面顶点数组按 (函数内容, u/v 采样点) 的哈希保存：
+进程内先查内存中的 LRU 表，再查磁盘上的 .npy 文件（以内存映射方式读取），
+都未命中才真正计算。render_all 每个场景在独立的进程中渲染，磁盘缓存使一次
+批量渲染中相同的曲面只计算一次。
+
+函数的“内容”取自其字节码、常量、默认参数以及闭包和全局变量中引用的值，
+与函数名、所在文件和行号无关，因此不同文件里写法相同的 lambda 共享同一份缓存。
+闭包中引用了无法识别内容的对象时不缓存，直接计算。
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+from geometry import affine_basis
+
+# 缓存键格式变化时递增，使旧缓存全部失效
+CACHE_VERSION = 1
+
+# 默认上限：内存中 64MB，磁盘上 512MB
+DEFAULT_MEMORY_BYTES = 64 * 1024 ** 2
+DEFAULT_DISK_BYTES = 512 * 1024 ** 2
+
+
+class _Unhashable(Exception):
+    """函数引用了无法确定内容的对象"""
+
+
+def _code_fingerprint(code, h, seen):
+    # 局部变量名和位置信息不影响计算结果，不计入
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        _fingerprint(const, h, seen)
+
+
+def _global_names(code):
+    """代码（含嵌套的代码对象）中引用的全部全局名"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _fingerprint(obj, h, seen):
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray:{obj.dtype}:{obj.shape};".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        _fingerprint(obj.item(), h, seen)
+    elif isinstance(obj, (tuple, list)):
+        h.update(f"{type(obj).__name__}:{len(obj)};".encode())
+        for item in obj:
+            _fingerprint(item, h, seen)
+    elif isinstance(obj, types.ModuleType):
+        h.update(f"module:{obj.__name__};".encode())
+    elif isinstance(obj, types.CodeType):
+        _code_fingerprint(obj, h, seen)
+    elif isinstance(obj, types.FunctionType):
+        if id(obj) in seen:
+            h.update(b"recursive;")
+            return
+        seen.add(id(obj))
+        _code_fingerprint(obj.__code__, h, seen)
+        _fingerprint(obj.__defaults__, h, seen)
+        for cell in obj.__closure__ or ():
+            _fingerprint(cell.cell_contents, h, seen)
+        for name in sorted(_global_names(obj.__code__)):
+            if name in obj.__globals__:
+                h.update(f"global:{name};".encode())
+                _fingerprint(obj.__globals__[name], h, seen)
+    elif isinstance(obj, (types.BuiltinFunctionType, np.ufunc, type)):
+        name = getattr(obj, "__qualname__", obj.__name__)
+        h.update(f"{getattr(obj, '__module__', '')}.{name};".encode())
+    elif hasattr(obj, "c2p"):
+        # 坐标轴：c2p 是仿射变换，由原点和三个基向量完全确定
+        origin, basis = affine_basis(obj)
+        _fingerprint(np.concatenate([origin, basis.ravel()]), h, seen)
+    else:
+        raise _Unhashable(type(obj).__name__)
+
+
+def mesh_key(func, u_values, v_values, kind="faces"):
+    """网格的缓存键；func 引用了无法识别内容的对象时返回 None"""
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION}:{kind}:{sys.version_info[:2]}:{np.__version__};".encode())
+    try:
+        _fingerprint(func, h, set())
+    except _Unhashable:
+        return None
+    _fingerprint(np.asarray(u_values, dtype=float), h, set())
+    _fingerprint(np.asarray(v_values, dtype=float), h, set())
+    return h.hexdigest()[:32]
+
+
+class MeshCache:
+    """内存 + 磁盘两级的网格缓存
+
+    磁盘上每个条目是 <哈希>.npy；多个渲染进程可能同时读写同一目录，
+    因此不维护共享的索引文件，而是用文件的修改时间记录最近使用时间，
+    总大小超过上限时按最近最少使用（LRU）顺序删除。
+    """
+
+    def __init__(self, cache_dir=os.path.join("media", "mesh_cache"),
+                 memory_bytes=DEFAULT_MEMORY_BYTES, disk_bytes=DEFAULT_DISK_BYTES):
+        self.cache_dir = cache_dir
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def get(self, key):
+        """查找缓存的数组，未命中返回 None"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        path = self._entry_path(key)
+        try:
+            array = np.load(path, mmap_mode="r")
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        self._remember(key, array)
+        return array
+
+    def put(self, key, array):
+        """保存新计算的数组，写入磁盘失败时只保留在内存中"""
+        array = np.ascontiguousarray(array)
+        self._remember(key, array)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 先写临时文件再原子替换，其他进程不会读到写了一半的文件
+            tmp_path = f"{self._entry_path(key)}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, self._entry_path(key))
+            self._evict_disk()
+        except OSError:
+            pass
+
+    def get_or_compute(self, key, compute):
+        """命中时返回缓存的数组，否则调用 compute() 计算并保存；key 为 None 时不缓存"""
+        if key is None:
+            return compute()
+        array = self.get(key)
+        if array is None:
+            array = compute()
+            self.put(key, array)
+        return array
+
+    def _remember(self, key, array):
+        with self._lock:
+            self._memory[key] = array
+            self._memory.move_to_end(key)
+            # 内存映射的数组不占用进程内存，只统计真正载入内存的数组
+            total = sum(a.nbytes for a in self._memory.values() if not isinstance(a, np.memmap))
+            while total > self.memory_bytes and len(self._memory) > 1:
+                _, old = self._memory.popitem(last=False)
+                if not isinstance(old, np.memmap):
+                    total -= old.nbytes
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".npy"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:  # 已被其他进程删除
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """清空内存和磁盘上的全部条目"""
+        with self._lock:
+            self._memory.clear()
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".npy"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+
+# 所有 FastSurface 默认共享的缓存
+default_cache = MeshCache()
@@ -1,21 +1,31 @@
 import numpy as np
+from mpl_export import animate
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 
 # 参数设置
-num_samples = 2000    # 总样本数
-batch_size = 20      # 每次动画更新添加的点数
-radius = 1.0         # 圆半径
+num_samples = 2000000  # 总样本数
+batch_size = 2000      # 每次动画更新添加的点数
+radius = 1.0           # 圆半径
+resolution = 800       # 散点图层的像素分辨率
+
+num_frames = num_samples // batch_size
 
 # 创建图形和轴
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
 fig.suptitle('蒙特卡洛方法估算π值', fontsize=14)
 
-# 初始化数据存储
-x_points = []
-y_points = []
-pi_estimates = []
-frame_numbers = []
+# 运行计数器与预分配的估计值缓冲区（每帧只处理新的 batch_size 个点）
+inside_count = 0
+total_count = 0
+frame_numbers = np.zeros(num_frames)
+pi_estimates = np.zeros(num_frames)
+
+# 散点直接写入一张 RGBA 图像：每帧只修改新点所在的像素，绘制开销与已有点数无关
+point_layer = np.zeros((resolution, resolution, 4))
+inside_color = np.array([0.0, 0.0, 1.0, 1.0])   # 蓝色
+outside_color = np.array([1.0, 0.0, 0.0, 1.0])  # 红色
+
+rng = np.random.default_rng()
 
 # 设置坐标轴
 ax1.set_xlim(0, radius)
@@ -38,53 +48,60 @@ ax2.grid(True)
 ax2.axhline(y=np.pi, color='r', linestyle='--', label='实际π值')
 ax2.legend()
 
-# 散点和线的初始化
-scatter_inside = ax1.scatter([], [], c='blue', s=2, label='圆内')
-scatter_outside = ax1.scatter([], [], c='red', s=2, label='圆外')
+# 散点图层和线的初始化
+points_image = ax1.imshow(point_layer, extent=(0, radius, 0, radius), origin='lower',
+                          interpolation='nearest', zorder=3)
+ax1.scatter([], [], c='blue', s=2, label='圆内')   # 仅用于图例
+ax1.scatter([], [], c='red', s=2, label='圆外')
 line, = ax2.plot([], [], 'g-', label='估计值')
 ax1.legend()
 
+# 计数文字放在坐标轴内部，才能随 blit 一起刷新
+count_text = ax1.text(0.02, 0.95, '', transform=ax1.transAxes, zorder=4,
+                      bbox=dict(facecolor='white', alpha=0.8))
+estimate_text = ax2.text(0.02, 0.95, '', transform=ax2.transAxes,
+                         bbox=dict(facecolor='white', alpha=0.8))
+
 def init():
     """初始化动画"""
-    return scatter_inside, scatter_outside, line
+    return points_image, line, count_text, estimate_text
 
 def update(frame):
     """更新动画帧"""
-    # 生成新的随机点
-    new_x = np.random.uniform(0, radius, batch_size)
-    new_y = np.random.uniform(0, radius, batch_size)
-    
-    # 添加新点到列表
-    x_points.extend(new_x)
-    y_points.extend(new_y)
-    
-    # 计算点到原点的距离
-    distances = np.sqrt(np.array(x_points)**2 + np.array(y_points)**2)
-    inside = distances <= radius
-    
-    # 更新散点图
-    scatter_inside.set_offsets(np.c_[np.array(x_points)[inside], 
-                                   np.array(y_points)[inside]])
-    scatter_outside.set_offsets(np.c_[np.array(x_points)[~inside], 
-                                    np.array(y_points)[~inside]])
-    
+    global inside_count, total_count
+
+    # 从第 0 帧开始（首次播放或导出视频）时重置累计状态
+    if frame == 0:
+        inside_count = 0
+        total_count = 0
+        point_layer[:] = 0
+
+    # 生成新的随机点，只对这一批点分类
+    new_points = rng.uniform(0, radius, size=(batch_size, 2))
+    inside = np.sum(new_points**2, axis=1) <= radius**2
+    inside_count += int(np.count_nonzero(inside))
+    total_count += batch_size
+
+    # 把新点写入图层对应的像素
+    pixels = np.minimum((new_points / radius * resolution).astype(int), resolution - 1)
+    point_layer[pixels[:, 1], pixels[:, 0]] = np.where(inside[:, None], inside_color, outside_color)
+    points_image.set_data(point_layer)
+
     # 计算并存储π值估计
-    pi_estimate = 4 * np.sum(inside) / len(x_points)
-    pi_estimates.append(pi_estimate)
-    frame_numbers.append(len(x_points))
-    
+    pi_estimate = 4 * inside_count / total_count
+    pi_estimates[frame] = pi_estimate
+    frame_numbers[frame] = total_count
+
     # 更新π值估计图
-    line.set_data(frame_numbers, pi_estimates)
-    
-    # 更新标题
-    ax1.set_title(f'采样点数: {len(x_points)}')
-    ax2.set_title(f'π估计值: {pi_estimate:.4f}')
-    
-    return scatter_inside, scatter_outside, line
-
-# 创建动画
-anim = FuncAnimation(fig, update, frames=num_samples//batch_size,
-                    init_func=init, blit=True, interval=1)
+    line.set_data(frame_numbers[:frame + 1], pi_estimates[:frame + 1])
+
+    # 更新计数文字
+    count_text.set_text(f'采样点数: {total_count}')
+    estimate_text.set_text(f'π估计值: {pi_estimate:.4f}')
+
+    return points_image, line, count_text, estimate_text
 
+# 创建并显示动画（带 --export 参数时导出视频；每帧依赖之前累积的点，不能分段并行）
 plt.tight_layout()
-plt.show() 
\ No newline at end of file
+anim = animate(fig, update, frames=num_frames, init_func=init, stateful=True,
+               blit=True, interval=1, repeat=False)
@@ -1,12 +1,48 @@
 from manim import *
 import numpy as np
 
+from geometry import axes_c2p
+from glyph_text import GlyphText, NumberReadout
+
+
+class SampleCloud(PMobject):
+    """采样点云：所有点和颜色保存在预分配的数组中，每次追加一整批"""
+    def __init__(self, capacity=1024, stroke_width=2, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.count = 0
+        self._point_buffer = np.zeros((capacity, 3))
+        self._rgba_buffer = np.zeros((capacity, 4))
+
+    def add_samples(self, points, rgbas):
+        """追加一批点（points 为 (n, 3)，rgbas 为 (n, 4)）"""
+        end = self.count + len(points)
+        if end > len(self._point_buffer):
+            # 容量不足时按倍数扩容，避免每批都重新分配
+            capacity = max(end, 2 * len(self._point_buffer))
+            self._point_buffer = np.resize(self._point_buffer, (capacity, 3))
+            self._rgba_buffer = np.resize(self._rgba_buffer, (capacity, 4))
+        self._point_buffer[self.count:end] = points
+        self._rgba_buffer[self.count:end] = rgbas
+        self.count = end
+        # points/rgbas 只是缓冲区前 count 行的视图
+        self.points = self._point_buffer[:end]
+        self.rgbas = self._rgba_buffer[:end]
+        return self
+
+
+class DigitCounter(NumberReadout):
+    """数字计数器：0-9 和小数点的字形只渲染一次，更新数值时只复制并排列字形"""
+    def __init__(self, value=0, num_decimal_places=0, font="SimSun", font_size=48, **kwargs):
+        super().__init__(value, num_decimal_places=num_decimal_places, font=font,
+                         font_size=font_size, **kwargs)
+
+
 class MonteCarloPI(Scene):
     def construct(self):
         # 配置参数
-        num_points = 500
+        num_points = 100000
+        num_batches = 60
         radius = 2
-        point_radius = 0.02
         
         # 创建坐标系
         axes = Axes(
@@ -22,13 +58,13 @@ class MonteCarloPI(Scene):
         
         # 添加坐标轴标签
         x_labels = VGroup(*[
-            Text(str(i), font_size=20).next_to(
+            GlyphText(str(i), font_size=20).next_to(
                 axes.c2p(i, 0), DOWN
             ) for i in range(radius + 1)
         ])
         
         y_labels = VGroup(*[
-            Text(str(i), font_size=20).next_to(
+            GlyphText(str(i), font_size=20).next_to(
                 axes.c2p(0, i), LEFT
             ) for i in range(radius + 1)
         ])
@@ -51,9 +87,14 @@ class MonteCarloPI(Scene):
         # 创建标题
         title = Text("蒙特卡洛方法估算π", font="SimSun").scale(0.8).to_edge(UP)
         
-        # 创建计数器
-        points_counter = Text("点数: 0", font="SimSun").to_edge(UR)
-        pi_value = Text("π ≈ 0.0000", font="SimSun").next_to(points_counter, DOWN)
+        # 创建计数器（标签只渲染一次，数值部分由缓存的数字字形拼成）
+        count_value = DigitCounter(0)
+        pi_number = DigitCounter(0, num_decimal_places=4)
+        points_counter = VGroup(Text("点数: ", font="SimSun"), count_value).arrange(RIGHT, aligned_edge=DOWN)
+        # 数字位数会增加，左侧预留出空间
+        points_counter.to_edge(UR).shift(LEFT * 1.5)
+        pi_value = VGroup(Text("π ≈ ", font="SimSun"), pi_number).arrange(RIGHT, aligned_edge=DOWN)
+        pi_value.next_to(points_counter, DOWN, aligned_edge=LEFT)
         
         # 设置场景
         self.play(
@@ -67,42 +108,34 @@ class MonteCarloPI(Scene):
             Write(pi_value)
         )
         
-        # 点的存储
-        points_inside = []
-        points_outside = []
+        # 所有采样点都放在同一个点云中
+        cloud = SampleCloud(capacity=num_points)
+        self.add(cloud)
+        inside_rgba = color_to_rgba(GREEN)
+        outside_rgba = color_to_rgba(RED)
         
-        # 添加点的动画
-        for i in range(num_points):
-            x = np.random.uniform(0, radius)
-            y = np.random.uniform(0, radius)
+        # 批大小按几何级数增长：开始时能看清单个点，后面快速累积
+        batch_ends = np.unique(np.geomspace(1, num_points, num_batches).astype(int))
+        batch_sizes = np.diff(batch_ends, prepend=0)
             
-            point = axes.c2p(x, y)  # 转换坐标
-            dot = Dot(point, radius=point_radius)
+        rng = np.random.default_rng()
+        total_points = 0
+        inside_points = 0
+        for size in batch_sizes:
+            samples = rng.uniform(0, radius, size=(size, 2))
+            inside = np.sum(samples**2, axis=1) <= radius*radius
             
-            if x*x + y*y <= radius*radius:
-                dot.set_color(GREEN)
-                points_inside.append(dot)
-            else:
-                dot.set_color(RED)
-                points_outside.append(dot)
+            points = axes_c2p(axes, samples[:, 0], samples[:, 1])  # 整批一起变换
+            rgbas = np.where(inside[:, None], inside_rgba, outside_rgba)
+            cloud.add_samples(points, rgbas)
             
             # 更新计数和π估计值
-            total_points = len(points_inside) + len(points_outside)
-            pi_estimate = 4 * len(points_inside) / total_points
-            
-            # 每10个点更新一次动画
-            if i % 10 == 0:
-                new_counter = Text(f"点数: {total_points}", font="SimSun").to_edge(UR)
-                new_pi = Text(f"π ≈ {pi_estimate:.4f}", font="SimSun").next_to(new_counter, DOWN)
-                
-                self.play(
-                    Create(dot),
-                    Transform(points_counter, new_counter),
-                    Transform(pi_value, new_pi),
-                    run_time=0.1
-                )
-            else:
-                self.add(dot)
+            total_points += size
+            inside_points += int(np.count_nonzero(inside))
+            pi_estimate = 4 * inside_points / total_points
+            count_value.set_value(total_points)
+            pi_number.set_value(pi_estimate)
+            self.wait(0.1)
         
         # 最终结果
         final_text = Text(
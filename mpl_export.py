@@ -0,0 +1,170 @@
+"""matplotlib 动画的无界面导出
+
+脚本用 animate() 代替 FuncAnimation + plt.show()。正常运行时照常弹出窗口；
+命令行带 --export 时改用非交互的 Agg 后端，逐帧调用 update，把画布的原始
+RGBA 帧缓冲直接写进 ffmpeg 编码进程的标准输入，不在磁盘上生成 PNG。
+
+    python hessian_animation.py --export hessian.mp4 --fps 30 --dpi 120 --workers 4
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+
+# 必须在脚本导入 pyplot 之前切换后端，因此脚本要先导入本模块
+if "--export" in sys.argv:
+    matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+
+
+def parse_export_args(argv=None):
+    """解析导出参数，未指定 --export 时返回 None"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--export", default=None, help="导出的视频文件路径")
+    parser.add_argument("--fps", type=int, default=30, help="视频帧率")
+    parser.add_argument("--dpi", type=int, default=100, help="渲染分辨率（每英寸像素数）")
+    parser.add_argument("--workers", type=int, default=1, help="并行导出的进程数")
+    parser.add_argument("--codec", default="libx264", help="ffmpeg 视频编码器")
+    parser.add_argument("--frame-range", default=None, help="只导出 [start:stop) 范围的帧")
+    args, _ = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    return args if args.export else None
+
+
+def export_frames(fig, update, frames, output, fps=30, dpi=100, init_func=None,
+                  codec="libx264", blit=False):
+    """在 Agg 画布上逐帧绘制，并把帧缓冲直接送入 ffmpeg
+
+    blit 为 True 时与交互模式的 blit 相同：update/init_func 返回的艺术家对象
+    之外的内容只绘制一次并缓存为背景，之后每帧只恢复背景、重绘这些对象。
+    没有 init_func 时由第一帧的 update 确定这些对象，第一帧不再重复调用 update。
+    """
+    frames = list(frames)
+    if not frames:
+        raise ValueError("没有可导出的帧")
+    fig.set_dpi(dpi)
+    canvas = fig.canvas
+    first_done = False
+    if blit:
+        if init_func is not None:
+            animated = init_func()
+        else:
+            animated = update(frames[0])
+            first_done = True
+        for artist in animated:
+            artist.set_animated(True)
+    elif init_func is not None:
+        init_func()
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox) if blit else None
+    height, width = canvas.buffer_rgba().shape[:2]
+
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba",
+        "-s", f"{width}x{height}", "-r", str(fps),
+        "-i", "pipe:0",
+        # yuv420p 要求宽高为偶数
+        "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+        "-c:v", codec, "-pix_fmt", "yuv420p",
+        output,
+    ]
+    # 错误输出写入临时文件，ffmpeg 输出再多也不会阻塞管道
+    with tempfile.TemporaryFile() as log:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=log)
+        broken = False
+        try:
+            for i, frame in enumerate(frames):
+                if blit:
+                    canvas.restore_region(background)
+                    artists = animated if i == 0 and first_done else update(frame)
+                    for artist in artists:
+                        fig.draw_artist(artist)
+                else:
+                    update(frame)
+                    canvas.draw()
+                proc.stdin.write(canvas.buffer_rgba())
+        except BrokenPipeError:
+            # ffmpeg 已提前退出，原因见其错误输出
+            broken = True
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                broken = True
+            proc.wait()
+        if broken or proc.returncode != 0:
+            log.seek(0)
+            message = log.read().decode(errors="replace").strip()
+            raise RuntimeError(f"ffmpeg 编码失败（返回码 {proc.returncode}）: {message}")
+
+
+def _export_parallel(args, frames, workers):
+    """把帧序列分段，每段由一个子进程重新运行脚本并编码，最后直接复制流拼接"""
+    from combine_videos import concat_copy
+
+    if not frames or workers < 1:
+        raise ValueError("没有可导出的帧")
+    bounds = [round(i * len(frames) / workers) for i in range(workers + 1)]
+    tmp_dir = tempfile.mkdtemp(prefix="mpl_export_")
+    chunks = [os.path.join(tmp_dir, f"chunk_{i:03d}.mp4") for i in range(workers)]
+
+    def run_chunk(i):
+        cmd = [
+            sys.executable, sys.argv[0],
+            "--export", chunks[i],
+            "--fps", str(args.fps), "--dpi", str(args.dpi), "--codec", args.codec,
+            "--frame-range", f"{bounds[i]}:{bounds[i + 1]}",
+        ]
+        return subprocess.run(cmd).returncode
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        codes = list(pool.map(run_chunk, range(workers)))
+    try:
+        if any(codes):
+            raise RuntimeError("部分帧段导出失败")
+        result = concat_copy(chunks, args.export)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode())
+    finally:
+        for chunk in chunks:
+            if os.path.exists(chunk):
+                os.remove(chunk)
+        os.rmdir(tmp_dir)
+
+
+def animate(fig, update, frames, init_func=None, stateful=False, **kwargs):
+    """交互运行时创建 FuncAnimation 并显示；带 --export 时无界面导出视频
+
+    stateful 表示 update 依赖之前各帧累积的状态，此时不能分段并行导出。
+    其余关键字参数（interval、blit 等）原样传给 FuncAnimation。
+    """
+    args = parse_export_args()
+    if args is None:
+        anim = FuncAnimation(fig, update, frames=frames, init_func=init_func, **kwargs)
+        plt.show()
+        return anim
+
+    frames = list(range(frames)) if isinstance(frames, int) else list(frames)
+    if args.frame_range is not None:
+        start, stop = (int(v) for v in args.frame_range.split(":"))
+        frames = frames[start:stop]
+    elif args.workers > 1:
+        if stateful:
+            print("该动画的每一帧依赖前面的帧，改为单进程导出")
+        else:
+            _export_parallel(args, frames, min(args.workers, len(frames)))
+            print(f"导出完成: {args.export}")
+            return None
+
+    export_frames(fig, update, frames, args.export, args.fps, args.dpi, init_func,
+                  args.codec, blit=kwargs.get("blit", False))
+    if args.frame_range is None:
+        print(f"导出完成: {args.export}")
+    return None
@@ -1,4 +1,6 @@
 from manim import *
+from fast_surface import FastSurface
+from geometry import axes_c2p
 import numpy as np
 
 class HessianVisualization(ThreeDScene):
@@ -40,8 +42,8 @@ class HessianVisualization(ThreeDScene):
         axes.set_color(GRAY)
         
         # 创建曲面
-        surface = Surface(
-            lambda u, v: axes.c2p(u, v, u**2 + v**2),
+        surface = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, u**2 + v**2),
             u_range=[-2, 2],
             v_range=[-2, 2],
             resolution=(30, 30),
@@ -112,8 +114,8 @@ class HessianVisualization(ThreeDScene):
         )
         
         # 创建初始曲面
-        surface = Surface(
-            lambda u, v: np.array([u, v, u**2 + v**2]),
+        surface = FastSurface(
+            lambda u, v: (u, v, u**2 + v**2),
             u_range=[-2, 2],
             v_range=[-2, 2],
             resolution=(30, 30),
@@ -154,8 +156,8 @@ class HessianVisualization(ThreeDScene):
         # 执行变形
         for t, conclusion, color in morphing_steps:
             # 创建新的曲面
-            new_surface = Surface(
-                lambda u, v: np.array([u, v, u**2 + (1-2*t)*v**2]),
+            new_surface = FastSurface(
+                lambda u, v: (u, v, u**2 + (1-2*t)*v**2),
                 u_range=[-2, 2],
                 v_range=[-2, 2],
                 resolution=(30, 30),
@@ -2,6 +2,9 @@
 from manim import *
 import numpy as np
 
+from geometry import graph_from_samples
+from series_engine import SeriesPartialSums
+
 class PowerSeriesConvergence(Scene):
     def construct(self):
         # 设置默认字体
@@ -40,11 +43,9 @@ class PowerSeriesConvergence(Scene):
         axes_group = VGroup(axes, x_label, y_label)
         self.play(Create(axes_group))
 
-        # 定义部分和函数
-        def get_partial_sum(x, n):
-            if abs(x) >= 1:  # 收敛半径外返回None
-                return None
-            return sum(x**k for k in range(n+1))
+        # 所有部分和 S_0 ... S_10 在采样点上一次算出（只取收敛半径内，避免在x=±1处的奇异点）
+        xs = np.arange(-0.99, 0.99 + 1e-9, 0.01)
+        partial_sums = SeriesPartialSums(lambda k, x: x**k, 11, x=xs)
 
         # 绘制不同阶数的部分和
         colors = [RED, GREEN, BLUE, YELLOW, PURPLE]
@@ -52,16 +53,8 @@ class PowerSeriesConvergence(Scene):
         labels = []
         
         for i, n in enumerate([1, 2, 3, 5, 10]):
-            # 创建部分和函数
-            def partial_sum(x, current_n=n):
-                return get_partial_sum(x, current_n)
-            
             # 绘制曲线
-            curve = axes.plot(
-                partial_sum,
-                color=colors[i],
-                x_range=[-0.99, 0.99, 0.01]  # 避免在x=±1处的奇异点
-            )
+            curve = graph_from_samples(axes, xs, partial_sums(n), color=colors[i])
             curves.append(curve)
             
             # 添加标签
@@ -1,4 +1,5 @@
 from manim import *
+from fast_surface import FastSurface
 
 class QuadraticSurfaces(ThreeDScene):
     def construct(self):
@@ -28,12 +29,12 @@ class QuadraticSurfaces(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title, equation)
         
         a, b, c = 3, 2, 1
-        ellipsoid = ParametricSurface(
-            lambda u, v: np.array([
+        ellipsoid = FastSurface(
+            lambda u, v: (
                 a * np.cos(u) * np.sin(v),
                 b * np.sin(u) * np.sin(v),
                 c * np.cos(v)
-            ]),
+            ),
             u_range=[0, 2 * PI],
             v_range=[0, PI],
             resolution=(20, 20),
@@ -54,12 +55,12 @@ class QuadraticSurfaces(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title, equation)
         
         a, b, c = 1, 1, 1
-        hyperboloid_one_sheet = ParametricSurface(
-            lambda u, v: np.array([
+        hyperboloid_one_sheet = FastSurface(
+            lambda u, v: (
                 a * np.cosh(u) * np.cos(v),
                 b * np.cosh(u) * np.sin(v),
                 c * np.sinh(u)
-            ]),
+            ),
             u_range=[-2, 2],
             v_range=[0, 2 * PI],
             resolution=(20, 20),
@@ -80,12 +81,12 @@ class QuadraticSurfaces(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title, equation)
         
         a, b, c = 1, 1, 1
-        hyperboloid_two_sheets_1 = ParametricSurface(
-            lambda u, v: np.array([
+        hyperboloid_two_sheets_1 = FastSurface(
+            lambda u, v: (
                 a * np.cosh(u),
                 b * np.sinh(u) * np.cos(v),
                 c * np.sinh(u) * np.sin(v)
-            ]),
+            ),
             u_range=[0.1, 2],
             v_range=[0, 2 * PI],
             resolution=(20, 20),
@@ -93,12 +94,12 @@ class QuadraticSurfaces(ThreeDScene):
             stroke_width=0.5
         )
         
-        hyperboloid_two_sheets_2 = ParametricSurface(
-            lambda u, v: np.array([
+        hyperboloid_two_sheets_2 = FastSurface(
+            lambda u, v: (
                 -a * np.cosh(u),
                 b * np.sinh(u) * np.cos(v),
                 c * np.sinh(u) * np.sin(v)
-            ]),
+            ),
             u_range=[0.1, 2],
             v_range=[0, 2 * PI],
             resolution=(20, 20),
@@ -119,12 +120,12 @@ class QuadraticSurfaces(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title, equation)
         
         a, b = 1, 1
-        hyperbolic_paraboloid = ParametricSurface(
-            lambda u, v: np.array([
+        hyperbolic_paraboloid = FastSurface(
+            lambda u, v: (
                 u,
                 v,
                 u**2/a**2 - v**2/b**2
-            ]),
+            ),
             u_range=[-3, 3],
             v_range=[-3, 3],
             resolution=(20, 20),
@@ -145,12 +146,12 @@ class QuadraticSurfaces(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title, equation)
         
         a, b = 1, 1
-        elliptic_paraboloid = ParametricSurface(
-            lambda u, v: np.array([
+        elliptic_paraboloid = FastSurface(
+            lambda u, v: (
                 u,
                 v,
                 u**2/a**2 + v**2/b**2
-            ]),
+            ),
             u_range=[-2, 2],
             v_range=[-2, 2],
             resolution=(20, 20),
@@ -171,12 +172,12 @@ class QuadraticSurfaces(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title, equation)
         
         a, b = 1, 1
-        elliptic_cone = ParametricSurface(
-            lambda u, v: np.array([
+        elliptic_cone = FastSurface(
+            lambda u, v: (
                 a * u * np.cos(v),
                 b * u * np.sin(v),
                 u
-            ]),
+            ),
             u_range=[-2, 2],
             v_range=[0, 2 * PI],
             resolution=(20, 20),
@@ -0,0 +1,275 @@
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# manim 中可直接渲染的场景基类
+SCENE_BASES = {"Scene", "ThreeDScene", "ZoomedScene", "MovingCameraScene"}
+
+# 画质参数与 manim 输出目录的对应关系
+QUALITY_DIRS = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+
+# 不参与批量渲染的脚本
+EXCLUDED_FILES = {"render_all.py", "render_cache.py", "tex_cache.py", "combine_videos.py"}
+
+
+def _base_name(node):
+    """取基类表达式的名字（支持 Scene 与 manim.Scene 两种写法）"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def find_scenes_in_file(path):
+    """静态解析一个模块，返回其中所有场景类的名字（不导入模块）"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    scene_names = []
+    known = set(SCENE_BASES)
+    # 按定义顺序扫描，模块内继承自其他场景类的子类同样算作场景
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = {_base_name(base) for base in node.bases}
+        if bases & known:
+            known.add(node.name)
+            scene_names.append(node.name)
+    return scene_names
+
+
+def discover_scenes(root="."):
+    """查找目录下所有 manim 场景，返回 [(模块文件, 场景名), ...]"""
+    jobs = []
+    for filename in sorted(os.listdir(root)):
+        if not filename.endswith(".py") or filename in EXCLUDED_FILES:
+            continue
+        path = os.path.join(root, filename)
+        try:
+            scene_names = find_scenes_in_file(path)
+        except SyntaxError as e:
+            print(f"跳过无法解析的文件 {filename}: {e}")
+            continue
+        for name in scene_names:
+            jobs.append((filename, name))
+    return jobs
+
+
+def video_path(module_file, scene_name, quality="h", media_dir="media"):
+    """manim 默认的输出视频路径"""
+    module_name = os.path.splitext(os.path.basename(module_file))[0]
+    return os.path.join(
+        media_dir, "videos", module_name, QUALITY_DIRS[quality], f"{scene_name}.mp4"
+    )
+
+
+def render_scene(module_file, scene_name, quality="h", root=".", log_dir=None, extra_args=()):
+    """在独立子进程中渲染一个场景，返回耗时、CPU 时间与峰值内存
+
+    extra_args 是附加的 manim 命令行参数（如 tex_cache.manim_args 的结果）。
+    """
+    cmd = [
+        sys.executable, "-m", "manim", "render", *extra_args,
+        f"-q{quality}", module_file, scene_name,
+    ]
+    log = subprocess.DEVNULL
+    if log_dir is not None:
+        os.makedirs(log_dir, exist_ok=True)
+        module_name = os.path.splitext(module_file)[0]
+        log = open(os.path.join(log_dir, f"{module_name}.{scene_name}.log"), "w")
+
+    start = time.perf_counter()
+    try:
+        proc = subprocess.Popen(cmd, cwd=root, stdout=log, stderr=subprocess.STDOUT)
+        if hasattr(os, "wait4"):
+            # wait4 返回该子进程（含其已回收的 ffmpeg/latex 子进程）的资源统计
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            cpu_time = usage.ru_utime + usage.ru_stime
+            # Linux 上 ru_maxrss 单位为 KB，macOS 上为字节
+            peak_rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            proc.wait()
+            cpu_time = None
+            peak_rss = None
+    finally:
+        if log is not subprocess.DEVNULL:
+            log.close()
+
+    return {
+        "module": module_file,
+        "scene": scene_name,
+        "ok": proc.returncode == 0,
+        "returncode": proc.returncode,
+        "wall_time": time.perf_counter() - start,
+        "cpu_time": cpu_time,
+        "peak_rss": peak_rss,
+    }
+
+
+def render_all(jobs, quality="h", workers=None, root=".", log_dir=None, cache=None,
+               tex_dir=None, prewarm_tex=True):
+    """用与 CPU 核数相同大小的进程池并行渲染所有场景，单个场景失败不影响其他场景
+
+    传入 RenderCache 时，内容未变化的场景直接复用缓存中的视频，不再渲染。
+    prewarm_tex 为 True 时，渲染前先并行编译待渲染模块中的 MathTex/Tex 公式。
+    所有场景共用同一个 LaTeX 缓存目录，预热后和每个场景渲染完成后清理其中
+    已生成 SVG 的公式的中间文件。
+    """
+    workers = workers or os.cpu_count() or 1
+    results = []
+
+    if cache is not None:
+        from render_cache import scene_cache_key
+
+        keys = {}
+        pending = []
+        for module_file, scene_name in jobs:
+            key = scene_cache_key(module_file, scene_name, quality, root)
+            output = os.path.join(root, video_path(module_file, scene_name, quality))
+            if cache.restore(key, output):
+                print(f"[缓存] {module_file} {scene_name}")
+                results.append({
+                    "module": module_file, "scene": scene_name, "ok": True,
+                    "returncode": 0, "wall_time": 0.0,
+                    "cpu_time": 0.0, "peak_rss": None, "cached": True,
+                })
+                continue
+            # 先删除旧的输出，渲染失败时不会留下过时的视频
+            if os.path.exists(output):
+                os.remove(output)
+            keys[(module_file, scene_name)] = key
+            pending.append((module_file, scene_name))
+        jobs = pending
+
+    if not jobs:
+        return results
+
+    from tex_cache import manim_args, prewarm, prune_intermediates
+
+    # 配置文件在启动任何子进程之前写好一次，各场景使用同一组参数
+    extra_args = manim_args(tex_dir, root)
+    tex_path = tex_dir or os.path.join(root, "media", "Tex")
+    if prewarm_tex:
+        prewarm(sorted({module_file for module_file, _ in jobs}), tex_path, workers, root)
+        prune_intermediates(tex_path)
+
+    # 每个线程只负责启动并等待一个 manim 子进程，真正的渲染并行发生在子进程中
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(render_scene, module_file, scene_name, quality, root, log_dir, extra_args):
+                (module_file, scene_name)
+            for module_file, scene_name in jobs
+        }
+        for future in as_completed(futures):
+            module_file, scene_name = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {
+                    "module": module_file, "scene": scene_name, "ok": False,
+                    "returncode": None, "wall_time": 0.0,
+                    "cpu_time": None, "peak_rss": None, "error": str(e),
+                }
+            # 清理和写缓存出错不影响已渲染好的视频，报告后继续处理其他场景
+            try:
+                prune_intermediates(tex_path)
+                if cache is not None and result["ok"]:
+                    cache.store(
+                        keys[(module_file, scene_name)],
+                        os.path.join(root, video_path(module_file, scene_name, quality)),
+                        label=f"{module_file}:{scene_name}:{quality}",
+                    )
+            except Exception as e:
+                print(f"[警告] {module_file} {scene_name} 清理或写入缓存失败: {e}")
+                result["cached"] = False
+                result["cache_error"] = str(e)
+            status = "完成" if result["ok"] else "失败"
+            print(f"[{status}] {module_file} {scene_name} ({result['wall_time']:.1f}s)")
+            results.append(result)
+    return results
+
+
+def print_summary(results, total_time):
+    """打印每个场景的耗时、CPU 时间与峰值内存"""
+    def fmt(value, scale=1.0, unit=""):
+        return "-" if value is None else f"{value / scale:.1f}{unit}"
+
+    results = sorted(results, key=lambda r: r["wall_time"], reverse=True)
+    print()
+    print(f"{'模块':<40}{'场景':<36}{'状态':<6}{'耗时':>10}{'CPU':>10}{'峰值内存':>12}")
+    for r in results:
+        print(
+            f"{r['module']:<40}{r['scene']:<36}{'成功' if r['ok'] else '失败':<6}"
+            f"{fmt(r['wall_time'], unit='s'):>10}"
+            f"{fmt(r['cpu_time'], unit='s'):>10}"
+            f"{fmt(r['peak_rss'], 1024 * 1024, 'MB'):>12}"
+        )
+    failed = [r for r in results if not r["ok"]]
+    cached = [r for r in results if r.get("cached")]
+    serial_time = sum(r["wall_time"] for r in results)
+    print()
+    print(f"共 {len(results)} 个场景，复用缓存 {len(cached)} 个，失败 {len(failed)} 个")
+    print(f"总耗时 {total_time:.1f}s（串行渲染约需 {serial_time:.1f}s）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="并行渲染仓库中的所有 manim 场景")
+    parser.add_argument("modules", nargs="*", help="只渲染指定的模块文件（默认全部）")
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITY_DIRS),
+                        help="渲染画质，对应 manim 的 -ql/-qm/-qh/-qp/-qk")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="并行进程数（默认等于 CPU 核数）")
+    parser.add_argument("--log-dir", default=os.path.join("media", "render_logs"),
+                        help="每个场景的 manim 输出日志目录")
+    parser.add_argument("--list", action="store_true", help="只列出找到的场景")
+    parser.add_argument("--no-cache", action="store_true", help="忽略渲染缓存，全部重新渲染")
+    parser.add_argument("--cache-size", type=float, default=5.0,
+                        help="渲染缓存的容量上限（GB），超出后按 LRU 淘汰")
+    parser.add_argument("--tex-dir", default=os.environ.get("MANIM_TEX_CACHE"),
+                        help="共用的 LaTeX 缓存目录（默认为环境变量 MANIM_TEX_CACHE 或 media/Tex）")
+    parser.add_argument("--no-tex-prewarm", action="store_true", help="渲染前不预先编译公式")
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    jobs = discover_scenes(root)
+    if args.modules:
+        wanted = {os.path.basename(m) for m in args.modules}
+        jobs = [job for job in jobs if job[0] in wanted]
+
+    if args.list:
+        for module_file, scene_name in jobs:
+            print(f"{module_file} {scene_name}")
+        return
+
+    print(f"找到 {len(jobs)} 个场景，使用 {args.workers or os.cpu_count()} 个进程并行渲染")
+    start = time.perf_counter()
+    log_dir = os.path.join(root, args.log_dir)
+    cache = None
+    if not args.no_cache:
+        from render_cache import RenderCache
+
+        cache = RenderCache(
+            os.path.join(root, "media", "render_cache"),
+            max_bytes=int(args.cache_size * 1024 ** 3),
+        )
+    results = render_all(jobs, args.quality, args.workers, root, log_dir, cache,
+                         args.tex_dir, not args.no_tex_prewarm)
+    print_summary(results, time.perf_counter() - start)
+    if any(not r["ok"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
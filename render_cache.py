@@ -0,0 +1,227 @@
+import ast
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+try:
+    from importlib.metadata import version as _package_version
+except ImportError:  # Python < 3.8
+    _package_version = None
+
+from render_all import SCENE_BASES, _base_name
+
+# 缓存键格式变化时递增，使旧缓存全部失效
+CACHE_VERSION = 2
+
+# 默认缓存上限：5GB
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+
+def _manim_version():
+    """当前安装的 manim 版本（模板库的导言区随版本变化）"""
+    if _package_version is None:
+        return "unknown"
+    try:
+        return _package_version("manim")
+    except Exception:
+        return "unknown"
+
+
+def _is_main_guard(node):
+    """判断是否为 if __name__ == "__main__": 代码块"""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    left = node.test.left
+    return isinstance(left, ast.Name) and left.id == "__name__"
+
+
+def _mentions_tex_template(node):
+    """判断语句是否设置了 LaTeX 模板（如 ctex 与 STSong 导言区）"""
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Attribute) and sub.attr in ("tex_template", "add_to_preamble"):
+            return True
+        if isinstance(sub, ast.Name) and sub.id in ("TexTemplate", "TexTemplateLibrary"):
+            return True
+    return False
+
+
+def _local_imports(tree, root):
+    """模块导入的仓库内其他模块文件"""
+    paths = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            path = os.path.join(root, name.split(".")[0] + ".py")
+            if os.path.isfile(path):
+                paths.append(path)
+    return paths
+
+
+def _module_digest(path, root, seen):
+    """仓库内辅助模块的摘要（递归包含其导入的本地模块）"""
+    path = os.path.abspath(path)
+    if path in seen:
+        return ""
+    seen.add(path)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    h = hashlib.sha256(ast.dump(tree).encode())
+    for dep in _local_imports(tree, root):
+        h.update(_module_digest(dep, root, seen).encode())
+    return h.hexdigest()
+
+
+def scene_cache_key(module_file, scene_name, quality, root="."):
+    """计算场景的内容哈希
+
+    键由以下部分组成：场景类及其本地基类的源码、模块级辅助函数与变量、
+    tex_template 导言区设置、仓库内被导入模块的内容、画质参数与 manim 版本。
+    使用 AST 而非原始文本，因此只改注释或排版不会使缓存失效。
+    """
+    path = os.path.join(root, module_file)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    if scene_name not in classes:
+        raise KeyError(f"{module_file} 中没有场景 {scene_name}")
+
+    # 场景类及其在本模块中定义的基类链
+    scene_chain = []
+    name = scene_name
+    while name in classes and name not in scene_chain:
+        scene_chain.append(name)
+        bases = [_base_name(base) for base in classes[name].bases]
+        name = next((b for b in bases if b in classes), None)
+
+    # 其他场景类与运行入口不影响本场景的画面
+    other_scenes = {
+        node.name for node in classes.values()
+        if {_base_name(base) for base in node.bases} & (SCENE_BASES | set(classes))
+    } - set(scene_chain)
+
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION}|{quality}|manim={_manim_version()}".encode())
+    for name in scene_chain:
+        h.update(ast.dump(classes[name]).encode())
+
+    preamble = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and (node.name in other_scenes or node.name in scene_chain):
+            continue
+        if isinstance(node, ast.FunctionDef) and node.name == "main":
+            continue
+        if _is_main_guard(node):
+            continue
+        if _mentions_tex_template(node):
+            preamble.append(node)
+        else:
+            h.update(ast.dump(node).encode())
+
+    # 导言区单独计入（只计一次），确保模板变化一定使缓存失效
+    h.update(b"|preamble|")
+    for node in preamble:
+        h.update(ast.dump(node).encode())
+
+    seen = {os.path.abspath(path)}
+    for dep in _local_imports(tree, root):
+        h.update(_module_digest(dep, root, seen).encode())
+    return h.hexdigest()
+
+
+class RenderCache:
+    """以内容哈希为键的渲染结果缓存
+
+    已渲染的视频以 <哈希>.mp4 保存在缓存目录中，index.json 记录每个条目的
+    大小与最近使用时间，总大小超过上限时按最近最少使用（LRU）顺序淘汰。
+    """
+
+    def __init__(self, cache_dir=os.path.join("media", "render_cache"), max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # 丢弃文件已被删除的条目
+        return {
+            key: entry for key, entry in index.items()
+            if os.path.exists(self._entry_path(key))
+        }
+
+    def _save_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.mp4")
+
+    def total_bytes(self):
+        return sum(entry["size"] for entry in self.index.values())
+
+    def restore(self, key, output_path):
+        """命中时把缓存的视频放到 manim 的输出路径，返回是否命中"""
+        with self._lock:
+            if key not in self.index:
+                return False
+            self.index[key]["last_used"] = time.time()
+            self._save_index()
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        _copy(self._entry_path(key), output_path)
+        return True
+
+    def store(self, key, video_path, label=""):
+        """把新渲染的视频加入缓存，并在超出上限时淘汰旧条目"""
+        if not os.path.exists(video_path):
+            return
+        _copy(video_path, self._entry_path(key))
+        with self._lock:
+            self.index[key] = {
+                "label": label,
+                "size": os.path.getsize(video_path),
+                "last_used": time.time(),
+            }
+            self._evict()
+            self._save_index()
+
+    def _evict(self):
+        total = self.total_bytes()
+        for key in sorted(self.index, key=lambda k: self.index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self.index[key]["size"]
+            del self.index[key]
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+
+
+def _copy(src, dst):
+    """复制文件，先写临时文件再替换，避免留下不完整的视频
+
+    不使用硬链接：媒体目录中的链接会在缓存条目被淘汰后继续占用同样的空间，
+    缓存的大小上限就失去了意义。
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+    tmp_path = dst + ".tmp"
+    shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dst)
@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from series_engine import SeriesPartialSums
+
 class SeriesConvergence(Scene):
     def construct(self):
         # 创建标题
@@ -41,10 +43,9 @@ class SeriesConvergence(Scene):
         ).scale(0.8).next_to(axes, UP, buff=0.2)
 
         # 创建调和级数 Sn = 1 + 1/2 + 1/3 + ... + 1/n
-        def harmonic_sum(n):
-            return sum(1/k for k in range(1, n+2))
-
-        harmonic_points = [axes.c2p(n, harmonic_sum(n)) for n in range(10)]
+        # H_1 ... H_10 一次算出；调和级数发散得很慢，用补偿求和
+        harmonic_sums = SeriesPartialSums(lambda k: 1.0 / k, 10, start=1, compensated=True)
+        harmonic_points = [axes.c2p(n, harmonic_sums(n + 1)) for n in range(10)]
         harmonic_dots = VGroup(*[Dot(point, color=RED) for point in harmonic_points])
         harmonic_line = VMobject(color=RED)
         harmonic_line.set_points_smoothly(harmonic_points)
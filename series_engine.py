@@ -0,0 +1,69 @@
+"""级数部分和计算
+
+逐个部分和重新求和（S_n = Σ_{k≤n} a_k 每次从头加起）的代价是项数的平方，
+对函数项级数还要再乘以采样点数。这里先把全部项放进一个
+(项数 × 采样点) 的数组，再沿项的方向做一次累加，所有部分和一次得到：
+
+    S = cumsum(A, axis=0)，A[i, j] = a_{start+i}(x_j)
+
+第 i 行就是部分和 S_{start+i} 在整个采样网格上的值。对于收敛很慢、
+项数很多的级数（如调和级数、交错级数），可以改用 Kahan 补偿求和，
+舍入误差不随项数累积。
+"""
+
+import numpy as np
+
+
+def kahan_cumsum(terms, axis=0):
+    """沿 axis 的 Kahan 补偿累加，结果形状与 terms 相同
+
+    只在项的方向上循环，每一步对其余维度（例如所有采样点）同时计算。
+    """
+    terms = np.moveaxis(np.asarray(terms, dtype=float), axis, 0)
+    sums = np.empty_like(terms)
+    total = np.zeros(terms.shape[1:])
+    compensation = np.zeros(terms.shape[1:])
+    for i, term in enumerate(terms):
+        corrected = term - compensation
+        new_total = total + corrected
+        # (new_total - total) 是实际加上去的量，与 corrected 之差即本次舍入损失
+        compensation = (new_total - total) - corrected
+        total = new_total
+        sums[i] = total
+    return np.moveaxis(sums, 0, axis)
+
+
+class SeriesPartialSums:
+    """级数 Σ_{k=start}^{∞} a_k(x) 的前 n_terms 个部分和
+
+    term(k, x) 为通项，k、x 都是数组（k 的形状为 (项数, 1)，x 为 (1, 采样点数)），
+    按广播规则返回全部项；数项级数不传 x，此时 term(k) 只接收 k。
+    compensated 为 True 时使用 Kahan 补偿求和。
+
+        sums = SeriesPartialSums(lambda k, x: x ** k, 11, x=xs)
+        sums(5)        # S_5(x) = Σ_{k=0}^{5} x^k 在 xs 上的值
+        sums.sums      # 全部部分和，形状为 (11, len(xs))
+    """
+
+    def __init__(self, term, n_terms, x=None, start=0, compensated=False):
+        self.start = start
+        k = np.arange(start, start + n_terms)
+        if x is None:
+            self.x = None
+            terms = np.broadcast_to(np.asarray(term(k), dtype=float), k.shape)
+        else:
+            self.x = np.asarray(x, dtype=float)
+            terms = np.broadcast_to(np.asarray(term(k[:, None], self.x[None, :]), dtype=float),
+                                    (n_terms, len(self.x)))
+        self.terms = terms
+        self.sums = kahan_cumsum(terms) if compensated else np.cumsum(terms, axis=0)
+
+    @property
+    def n_terms(self):
+        return len(self.sums)
+
+    def __call__(self, n):
+        """部分和 S_n = Σ_{k=start}^{n} a_k（函数项级数时为采样网格上的数组）"""
+        if not self.start <= n < self.start + self.n_terms:
+            raise ValueError(f"只计算了 S_{self.start} 到 S_{self.start + self.n_terms - 1}")
+        return self.sums[n - self.start]
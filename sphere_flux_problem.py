@@ -1,4 +1,5 @@
 from manim import *
+from fast_surface import FastSurface
 import numpy as np
 
 config.tex_template = TexTemplateLibrary.ctex
@@ -56,12 +57,12 @@ class SphereFluxProblem(ThreeDScene):
         self.wait(1)
 
         # 创建球面 x² + y² + z² = 4
-        sphere = Surface(
-            lambda u, v: np.array([
+        sphere = FastSurface(
+            lambda u, v: (
                 2 * np.sin(u) * np.cos(v),
                 2 * np.sin(u) * np.sin(v),
                 2 * np.cos(u)
-            ]),
+            ),
             u_range=[0, PI],
             v_range=[0, TAU],
             resolution=(20, 20),
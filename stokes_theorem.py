@@ -1,4 +1,6 @@
 from manim import *
+from arrow_field import ArrowField3D, grid_points
+from fast_surface import FastSurface
 import numpy as np
 
 config.tex_template = TexTemplateLibrary.ctex
@@ -33,8 +35,8 @@ class StokesTheorem(ThreeDScene):
         self.wait(1)
 
         # 创建曲面（抛物面）
-        surface = Surface(
-            lambda u, v: np.array([u, v, 0.5*(u**2 + v**2)]),
+        surface = FastSurface(
+            lambda u, v: (u, v, 0.5*(u**2 + v**2)),
             u_range=[-1, 1],
             v_range=[-1, 1],
             resolution=(20, 20),
@@ -61,25 +63,20 @@ class StokesTheorem(ThreeDScene):
         self.wait(1)
 
         # 创建向量场 F = (-y, x, z/2)
-        def vector_field_func(point):
-            x, y, z = point
-            return np.array([-y, x, z/2]) / 2
+        def vector_field_func(x, y, z):
+            return -y / 2, x / 2, z / 4
 
         # 在曲面上创建向量场
-        vector_field = VGroup()
         n_points = 6  # 每个方向上的点数
-        for u in np.linspace(-0.9, 0.9, n_points):
-            for v in np.linspace(-0.9, 0.9, n_points):
-                if u**2 + v**2 <= 0.9:  # 只在边界内显示向量场
-                    point = np.array([u, v, 0.5*(u**2 + v**2)])
-                    vector = vector_field_func(point)
-                    arrow = Arrow3D(
-                        start=point,
-                        end=point + vector,
-                        color=BLUE,
-                        thickness=0.02
-                    )
-                    vector_field.add(arrow)
+        samples = grid_points(np.linspace(-0.9, 0.9, n_points), np.linspace(-0.9, 0.9, n_points), [0])
+        samples = samples[np.sum(samples**2, axis=1) <= 0.9]  # 只在边界内显示向量场
+        samples[:, 2] = 0.5 * (samples[:, 0]**2 + samples[:, 1]**2)
+        vector_field = ArrowField3D.from_function(
+            vector_field_func,
+            samples,
+            color=BLUE,
+            thickness=0.02
+        )
 
         # 显示向量场
         self.play(Create(vector_field))
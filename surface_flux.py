@@ -1,4 +1,6 @@
 from manim import *
+from arrow_field import ArrowField3D, field_on_points, normalized
+from geometry import axes_c2p
 import numpy as np
 
 config.tex_template = TexTemplateLibrary.ctex
@@ -57,17 +59,15 @@ class SurfaceFlux(ThreeDScene):
         self.wait(1)
 
         # 创建平面上的法向量场（只显示几个代表性向量）
-        normal_vectors = VGroup()
-        for u, v in [(-0.8, -0.8), (-0.8, 0.8), (0.8, -0.8), (0.8, 0.8), (0, 0)]:
-            point = left_axes.c2p(u, v, 0)  # 改为z=0平面上的点
-            normal = np.array([0, 0, 1])
-            vector = Arrow3D(
-                start=point,
-                end=point + normal * 0.5,
-                color=YELLOW,
-                thickness=0.02
-            )
-            normal_vectors.add(vector)
+        samples = np.array([(-0.8, -0.8), (-0.8, 0.8), (0.8, -0.8), (0.8, 0.8), (0, 0)])
+        u, v = samples[:, 0], samples[:, 1]
+        points = axes_c2p(left_axes, u, v, 0)  # 改为z=0平面上的点
+        normal_vectors = ArrowField3D(
+            points,
+            np.tile(OUT * 0.5, (len(samples), 1)),
+            color=YELLOW,
+            thickness=0.02
+        )
 
         # 显示法向量场
         self.play(
@@ -87,28 +87,21 @@ class SurfaceFlux(ThreeDScene):
 
         # 创建向量场 F = (0, 0, z)
         def get_vector_field(u, v, z):
-            return np.array([1, 1, 1])  # 统一方向的向量场，指向(1,1,1)
-
-        field_vectors = VGroup()
-        for u, v in [(-0.8, -0.8), (-0.8, 0.8), (0.8, -0.8), (0.8, 0.8), (0, 0)]:
-            point = left_axes.c2p(u, v, 0)
-            field = get_vector_field(u, v, 0)
-            # 归一化向量场
-            norm = np.linalg.norm(field)
-            if norm > 0:
-                field = field / norm * 0.5
-            vector = Arrow3D(
-                start=point,
-                end=point + field,
-                color=RED,
-                thickness=0.03
-            )
-            vector.set_fill(RED, opacity=0.8)
-            field_vectors.add(vector)
+            return 1, 1, 1  # 统一方向的向量场，指向(1,1,1)
+
+        # 归一化向量场
+        field = field_on_points(get_vector_field, np.column_stack([u, v, np.zeros_like(u)]))
+        field_vectors = ArrowField3D(
+            points,
+            normalized(field, 0.5),
+            color=RED,
+            thickness=0.03,
+            fill_opacity=0.8
+        )
 
         # 显示向量场
         self.play(
-            *[Create(vec) for vec in field_vectors],
+            Create(field_vectors),
             run_time=1
         )
         self.wait(2)
@@ -144,62 +137,49 @@ class SurfaceFlux(ThreeDScene):
         self.wait(1)
 
         # 定义法向量计算函数
+        # （u、v 可以是标量，也可以是数组）
         def get_normal_vector(u, v):
             # 计算曲面在点(u,v)处的法向量
-            tangent_u = np.array([1, 0, 0.2*u])  # 修改系数
-            tangent_v = np.array([0, 1, 0.2*v])
-            normal = np.cross(tangent_u, tangent_v)
-            normal = normal / np.linalg.norm(normal)
-            return normal
+            u, v = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+            tangent_u = np.stack([np.ones_like(u), np.zeros_like(u), 0.2*u], axis=-1)  # 修改系数
+            tangent_v = np.stack([np.zeros_like(v), np.ones_like(v), 0.2*v], axis=-1)
+            return normalized(np.cross(tangent_u, tangent_v))
 
         # 定义向量场函数
         def get_vector_field(u, v):
-            point = np.array([u, v, 0.1*(u**2 + v**2)])  # 修改系数
-            return point
+            u, v = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+            return np.stack([u, v, 0.1*(u**2 + v**2)], axis=-1)  # 修改系数
 
         # 创建法向量场
-        normal_vectors = VGroup()
-        for u, v in [(-0.8, -0.8), (-0.8, 0.8), (0.8, -0.8), (0.8, 0.8), (0, 0)]:
-            point = right_axes.c2p(u, v, 0.1*(u**2 + v**2))
-            normal = get_normal_vector(u, v)
-            vector = Arrow3D(
-                start=point,
-                end=point + normal * 0.5,
-                color=YELLOW,
-                thickness=0.03
-            )
-            vector.set_fill(YELLOW, opacity=0.8)
-            normal_vectors.add(vector)
+        points = axes_c2p(right_axes, u, v, 0.1*(u**2 + v**2))
+        normal_vectors = ArrowField3D(
+            points,
+            get_normal_vector(u, v) * 0.5,
+            color=YELLOW,
+            thickness=0.03,
+            fill_opacity=0.8
+        )
 
         # 修改显示法向量场的方式
         self.play(
-            *[Create(vec) for vec in normal_vectors],
+            Create(normal_vectors),
             run_time=1
         )
         self.wait(0.3)
 
         # 创建向量场（同样减少向量数量）
-        field_vectors = VGroup()
-        for u, v in [(-0.8, -0.8), (-0.8, 0.8), (0.8, -0.8), (0.8, 0.8), (0, 0)]:
-            point = right_axes.c2p(u, v, 0.1*(u**2 + v**2))
-            field = get_vector_field(u, v)
-            # 归一化向量场，避免太长
-            norm = np.linalg.norm(field)
-            if norm > 0:
-                field = field / norm * 0.5
-            vector = Arrow3D(
-                start=point,
-                end=point + field,
-                color=RED,
-                thickness=0.03
-            )
-            # 设置向量的填充不透明度
-            vector.set_fill(RED, opacity=0.8)
-            field_vectors.add(vector)
+        # 归一化向量场，避免太长；设置向量的填充不透明度
+        field_vectors = ArrowField3D(
+            points,
+            normalized(get_vector_field(u, v), 0.5),
+            color=RED,
+            thickness=0.03,
+            fill_opacity=0.8
+        )
 
         # 修改显示向量场的方式
         self.play(
-            *[Create(vec) for vec in field_vectors],
+            Create(field_vectors),
             run_time=1
         )
         self.wait(2)
@@ -1,4 +1,6 @@
 from manim import *
+from fast_surface import FastSurface
+from geometry import axes_c2p
 import numpy as np
 
 class TaylorSeriesDemo(ThreeDScene):
@@ -42,8 +44,8 @@ class TaylorSeriesDemo(ThreeDScene):
         self.add(axes)
         
         # 创建原始曲面，缩小范围
-        original_surface = Surface(
-            lambda u, v: axes.c2p(u, v, f(u, v)),
+        original_surface = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, f(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),  # 增加分辨率使曲面更平滑
@@ -66,8 +68,8 @@ class TaylorSeriesDemo(ThreeDScene):
             # f(0,0) = 1
             return 1
         
-        taylor_0 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_0_func(u, v)),
+        taylor_0 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_0_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
@@ -90,8 +92,8 @@ class TaylorSeriesDemo(ThreeDScene):
             # ∂f/∂x(0,0) = ∂f/∂y(0,0) = 0
             return 1
         
-        taylor_1 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_1_func(u, v)),
+        taylor_1 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_1_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
@@ -118,8 +120,8 @@ class TaylorSeriesDemo(ThreeDScene):
             # ∂²f/∂x∂y(0,0) = 0
             return 1 - x**2 - y**2
         
-        taylor_2 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_2_func(u, v)),
+        taylor_2 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_2_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
@@ -144,8 +146,8 @@ class TaylorSeriesDemo(ThreeDScene):
             # 三阶展开，三阶导数在(0,0)处均为0
             return 1 - x**2 - y**2
         
-        taylor_3 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_3_func(u, v)),
+        taylor_3 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_3_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
@@ -173,8 +175,8 @@ class TaylorSeriesDemo(ThreeDScene):
             # ∂⁴f/∂x²∂y²(0,0) = 4
             return 1 - x**2 - y**2 + x**4/2 + x**2*y**2 + y**4/2
         
-        taylor_4 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_4_func(u, v)),
+        taylor_4 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_4_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
@@ -200,8 +202,8 @@ class TaylorSeriesDemo(ThreeDScene):
             # 五阶展开，五阶导数在(0,0)处均为0
             return 1 - x**2 - y**2 + x**4/2 + x**2*y**2 + y**4/2
         
-        taylor_5 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_5_func(u, v)),
+        taylor_5 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_5_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
@@ -229,8 +231,8 @@ class TaylorSeriesDemo(ThreeDScene):
             return (1 - x**2 - y**2 + x**4/2 + x**2*y**2 + y**4/2 - 
                    x**6/6 - x**4*y**2/2 - x**2*y**4/2 - y**6/6)
         
-        taylor_6 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_6_func(u, v)),
+        taylor_6 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_6_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
@@ -259,8 +261,8 @@ class TaylorSeriesDemo(ThreeDScene):
         self.wait()
         
         # 重新创建一个新的泰勒六阶曲面，避免使用之前可能存在残影的对象
-        new_taylor_6 = Surface(
-            lambda u, v: axes.c2p(u, v, taylor_6_func(u, v)),
+        new_taylor_6 = FastSurface(
+            lambda u, v: axes_c2p(axes, u, v, taylor_6_func(u, v)),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
             resolution=(25, 25),
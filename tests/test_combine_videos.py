@@ -0,0 +1,97 @@
+import os
+import subprocess
+
+import pytest
+
+import combine_videos
+from combine_videos import _concat_list, concat_reencode, probe_all
+
+VIDEO = ("h264", "High", "1280", "720", "yuv420p", "30/1", "1/15360")
+AUDIO = ("aac", "44100", "2", "stereo")
+
+
+def test_concat_list_uses_absolute_file_urls(tmp_path):
+    paths = [str(tmp_path / "a.mp4"), "relative/b.mp4"]
+    lines = _concat_list(paths).decode().splitlines()
+    assert lines == [
+        f"file 'file:{os.path.abspath(paths[0])}'",
+        f"file 'file:{os.path.abspath(paths[1])}'",
+    ]
+
+
+def test_concat_list_escapes_single_quotes(tmp_path):
+    path = str(tmp_path / "it's.mp4")
+    line = _concat_list([path]).decode()
+    assert line == "file 'file:" + os.path.abspath(path).replace("'", r"'\''") + "'\n"
+
+
+def test_probe_all_without_paths():
+    assert probe_all([]) == []
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch):
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+    monkeypatch.setattr(combine_videos.subprocess, "run", run)
+    return calls
+
+
+def filter_graph(cmd):
+    return cmd[cmd.index("-filter_complex") + 1]
+
+
+def test_reencode_fills_missing_audio_with_silence(ffmpeg_calls):
+    params = [
+        {"duration": 2.0, "video": VIDEO},
+        {"duration": 3.0, "video": VIDEO, "audio": AUDIO},
+    ]
+    concat_reencode(["a.mp4", "b.mp4"], "out.mp4", params)
+    graph = filter_graph(ffmpeg_calls[0])
+    assert "anullsrc=channel_layout=stereo:sample_rate=44100,atrim=duration=2.0[a0]" in graph
+    assert "[v0][a0][v1][1:a]concat=n=2:v=1:a=1[outv][outa]" in graph
+    assert "[outa]" in ffmpeg_calls[0]
+
+
+def test_reencode_takes_size_from_first_input_with_video(ffmpeg_calls):
+    params = [
+        {"duration": 1.5, "audio": AUDIO},
+        {"duration": 3.0, "video": VIDEO, "audio": AUDIO},
+    ]
+    concat_reencode(["a.m4a", "b.mp4"], "out.mp4", params)
+    graph = filter_graph(ffmpeg_calls[0])
+    assert "color=c=black:s=1280x720:r=30/1:d=1.5," in graph
+    assert "[1:v]scale=1280:720" in graph
+
+
+def test_reencode_without_any_video(ffmpeg_calls):
+    with pytest.raises(ValueError):
+        concat_reencode(["a.m4a"], "out.mp4", [{"duration": 1.0, "audio": AUDIO}])
+    assert ffmpeg_calls == []
+
+
+def test_cached_chapter_skips_stale_segments(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    chapter = {"module": "scene_a", "scene": "SceneA", "quality": "l", "segments": True}
+    final = combine_videos.chapter_path(chapter)
+    segment_dir = os.path.join(os.path.dirname(final), "partial_movie_files", "SceneA")
+    os.makedirs(segment_dir)
+    segment = os.path.join(segment_dir, "old.mp4")
+    open(segment, "w").close()
+    with open(os.path.join(segment_dir, "partial_movie_file_list.txt"), "w") as f:
+        f.write(f"file 'file:{segment}'\n")
+
+    calls = []
+    monkeypatch.setattr(combine_videos, "concat_videos", lambda paths, *args: calls.append(paths) or True)
+
+    monkeypatch.setattr(combine_videos, "render_chapters", lambda chapters: (True, set()))
+    combine_videos.combine_chapters([chapter], "out.mp4", render=True)
+    monkeypatch.setattr(
+        combine_videos, "render_chapters", lambda chapters: (True, {combine_videos.chapter_job(chapter)})
+    )
+    combine_videos.combine_chapters([chapter], "out.mp4", render=True)
+    assert calls == [[segment], [final]]
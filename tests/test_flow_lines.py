@@ -0,0 +1,55 @@
+import numpy as np
+
+from flow_lines import integrate_streamlines, streamlines
+
+BOUNDS = (-3, 3, -3, 3)
+
+
+def rotation(x, y):
+    return -y, x
+
+
+def uniform(x, y):
+    return np.ones_like(x), np.zeros_like(y)
+
+
+def valid(line):
+    return line[~np.isnan(line[:, 0])]
+
+
+def test_rotation_streamlines_stay_on_circles():
+    seeds = np.array([[1.0, 0.0], [0.0, 2.0], [-1.5, 0.0]])
+    lines = integrate_streamlines(rotation, seeds, BOUNDS, max_length=2.0, tol=1e-5)
+    assert lines.shape == (3, 201, 2)
+    for seed, line in zip(seeds, lines):
+        radius = np.linalg.norm(valid(line), axis=1)
+        assert np.allclose(radius, np.linalg.norm(seed), atol=1e-3)
+
+
+def test_length_limit_and_direction():
+    lines = integrate_streamlines(uniform, [[0.0, 0.0]], BOUNDS, max_length=1.0)
+    line = valid(lines[0])
+    assert np.all(np.diff(line[:, 0]) > 0)
+    assert 1.0 <= line[-1, 0] < 1.0 + 4 * 0.02 + 1e-9
+    backward = valid(integrate_streamlines(uniform, [[0.0, 0.0]], BOUNDS, sign=-1.0)[0])
+    assert np.all(np.diff(backward[:, 0]) < 0)
+
+
+def test_stops_outside_bounds_and_at_stagnation_points():
+    lines = integrate_streamlines(uniform, [[2.9, 0.0], [5.0, 0.0]], BOUNDS, max_length=5.0)
+    inside = valid(lines[0])
+    # 第一个离开 bounds 的点之后全部为 NaN
+    assert inside[-1, 0] > 3 and np.all(inside[:-1, 0] <= 3)
+    # 种子点本身在 bounds 之外时不积分
+    assert len(valid(lines[1])) == 1
+
+    still = integrate_streamlines(lambda x, y: (0 * x, 0 * y), [[0.0, 0.0]], BOUNDS)
+    assert len(valid(still[0])) == 1
+
+
+def test_streamlines_join_both_directions():
+    lines = streamlines(uniform, [[0.0, 0.0], [10.0, 0.0]], BOUNDS, max_length=1.0)
+    assert len(lines) == 1
+    line = lines[0]
+    assert line[0, 0] < 0 < line[-1, 0]
+    assert np.all(np.diff(line[:, 0]) > 0)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from fourier_engine import EpicycleDrawing, Epicycles, FourierSeries  # noqa: E402
+
+TAU = 2 * np.pi
+
+
+def square_wave(x):
+    return np.where(np.mod(x, TAU) < np.pi, 1.0, -1.0)
+
+
+def test_square_wave_coefficients():
+    series = FourierSeries(square_wave, n_samples=4096)
+    k = np.arange(1, 8)
+    expected_b = np.where(k % 2 == 1, 4 / (np.pi * k), 0.0)
+    assert abs(series.a0) < 1e-9
+    assert np.allclose(series.a[:7], 0, atol=1e-3)
+    assert np.allclose(series.b[:7], expected_b, atol=1e-3)
+
+
+def test_partial_sums_match_direct_sums():
+    series = FourierSeries(lambda x: np.exp(np.sin(x)), n_samples=256)
+    x = np.linspace(0, TAU, 50)
+    harmonics = [0, 1, 3, 10]
+    sums = series.partial_sums(x, harmonics)
+    assert sums.shape == (4, 50)
+    for n, row in zip(harmonics, sums):
+        k = np.arange(1, n + 1)[:, None]
+        direct = series.a0 + (series.a[:n, None] * np.cos(k * x) + series.b[:n, None] * np.sin(k * x)).sum(axis=0)
+        assert np.allclose(row, direct)
+    assert np.allclose(series(x, 3), sums[2])
+    # 光滑函数的部分和收敛到函数本身
+    assert np.allclose(sums[-1], np.exp(np.sin(x)), atol=1e-8)
+
+
+def test_partial_sums_beyond_available_harmonics():
+    series = FourierSeries(np.sin, n_samples=16)
+    with pytest.raises(ValueError):
+        series.partial_sums([0.0], [series.max_harmonic + 1])
+
+
+def test_epicycles_reproduce_path():
+    t = np.arange(64) / 64
+    points = np.stack([np.cos(TAU * t) + 0.3 * np.cos(3 * TAU * t), np.sin(TAU * t)], axis=-1)
+    epicycles = Epicycles(points)
+    chain = epicycles.chain(t)
+    assert chain.shape == (64, 65)
+    assert np.allclose(chain[:, 0], 0)
+    assert np.allclose(chain[:, -1], points[:, 0] + 1j * points[:, 1])
+    # 按模从大到小排列
+    assert np.all(np.diff(epicycles.radii) <= 1e-12)
+
+
+def test_epicycles_keep_largest_terms():
+    t = np.arange(32) / 32
+    z = 2 * np.exp(TAU * 1j * t) + 0.5 * np.exp(-2 * TAU * 1j * t) + 0.01 * np.exp(5 * TAU * 1j * t)
+    epicycles = Epicycles(np.stack([z.real, z.imag], axis=-1), n_terms=2)
+    assert np.allclose(epicycles.frequencies, [1, -2])
+    assert np.allclose(epicycles.radii, [2, 0.5])
+    assert np.allclose(epicycles.chain(t)[:, -1], z - 0.01 * np.exp(5 * TAU * 1j * t))
+
+
+def test_drawing_keeps_transforms_across_frames():
+    t = np.arange(32) / 32
+    points = np.stack([np.cos(TAU * t), np.sin(TAU * t)], axis=-1)
+    drawing = EpicycleDrawing(Epicycles(points), n_frames=9)
+    drawing.set_progress(1)
+    expected = drawing.arms.points * 2 + np.array([1.0, -1.0, 0.0])
+    drawing.scale(2, about_point=np.zeros(3)).shift([1, -1, 0])
+    drawing.set_progress(0)
+    drawing.set_progress(1)
+    assert np.allclose(drawing.arms.points, expected)
@@ -0,0 +1,46 @@
+import numpy as np
+
+from geometry import affine_basis, axes_c2p, line_segment_points, polyline_bezier_points
+
+
+class Axes:
+    """c2p 为 (2x + 1, 3y - 1, z / 2) 的坐标轴，与 manim 一样接受二维或三维坐标"""
+
+    def c2p(self, x, y, z=0):
+        return np.array([2 * x + 1, 3 * y - 1, z / 2])
+
+
+def test_affine_basis():
+    origin, basis = affine_basis(Axes())
+    assert np.allclose(origin, [1, -1, 0])
+    assert np.allclose(basis, np.diag([2, 3, 0.5]))
+
+
+def test_axes_c2p_matches_pointwise_c2p():
+    axes = Axes()
+    x, y = np.meshgrid(np.linspace(-1, 1, 4), np.linspace(0, 2, 3), indexing="ij")
+    z = x * y
+    points = axes_c2p(axes, x, y, z)
+    assert points.shape == (4, 3, 3)
+    expected = [[axes.c2p(*c) for c in zip(*row)] for row in zip(x, y, z)]
+    assert np.allclose(points, expected)
+    # z 可以省略，也可以是标量（按广播规则展开）
+    assert np.allclose(axes_c2p(axes, x, y), axes_c2p(axes, x, y, 0))
+
+
+def test_line_segment_points_thirds():
+    points = line_segment_points([0, 0, 0], [3, 6, 0])
+    assert np.allclose(points, [[0, 0, 0], [1, 2, 0], [2, 4, 0], [3, 6, 0]])
+
+
+def test_polyline_bezier_points_batches():
+    corners = np.array([
+        [[0, 0, 0], [3, 0, 0], [3, 3, 0]],
+        [[0, 0, 1], [0, 3, 1], [0, 3, 4]],
+    ], dtype=float)
+    points = polyline_bezier_points(corners)
+    assert points.shape == (2, 8, 3)
+    # 每条折线的锚点依次为各顶点，相邻两段首尾相接
+    assert np.allclose(points[:, ::4], corners[:, :-1])
+    assert np.allclose(points[:, 3::4], corners[:, 1:])
+    assert np.allclose(points[0, 1], [1, 0, 0])
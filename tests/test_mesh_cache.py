@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from mesh_cache import MeshCache, mesh_key
+
+U = np.linspace(0, 1, 5)
+V = np.linspace(-1, 1, 7)
+
+
+class Axes:
+    def __init__(self, scale):
+        self.scale = scale
+
+    def c2p(self, x, y, z=0):
+        return np.array([x, y, z]) * self.scale
+
+
+def paraboloid(scale):
+    return lambda u, v: (u, v, scale * (u**2 + v**2))
+
+
+def test_same_function_text_shares_key():
+    f = lambda u, v: (u, v, u * v)
+    g = lambda u, v: (u, v, u * v)
+    assert mesh_key(f, U, V) == mesh_key(g, U, V)
+
+
+def test_key_changes_with_code_closure_and_samples():
+    key = mesh_key(paraboloid(1.0), U, V)
+    assert mesh_key(paraboloid(1.0), U, V) == key
+    assert mesh_key(paraboloid(2.0), U, V) != key
+    assert mesh_key(lambda u, v: (u, v, u**2 - v**2), U, V) != key
+    assert mesh_key(paraboloid(1.0), U, V[:-1]) != key
+    assert mesh_key(paraboloid(1.0), U, V, kind="grid") != key
+
+
+def test_key_follows_axes_transform():
+    def on_axes(axes):
+        return lambda u, v: axes.c2p(u, v, u * v)
+
+    assert mesh_key(on_axes(Axes(1.0)), U, V) == mesh_key(on_axes(Axes(1.0)), U, V)
+    assert mesh_key(on_axes(Axes(1.0)), U, V) != mesh_key(on_axes(Axes(2.0)), U, V)
+
+
+def test_key_changes_with_referenced_globals():
+    namespace = {"A": 1.0}
+    exec("f = lambda u, v: (u, v, A * u)", namespace)
+    key = mesh_key(namespace["f"], U, V)
+    namespace["A"] = 3.0
+    assert mesh_key(namespace["f"], U, V) != key
+
+
+def test_unhashable_closure_is_not_cached():
+    state = object()
+    assert mesh_key(lambda u, v: (u, v, id(state)), U, V) is None
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MeshCache(str(tmp_path), memory_bytes=1024, disk_bytes=1024 ** 2)
+
+
+def test_get_or_compute_hits_memory_and_disk(cache, tmp_path):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return np.arange(12.0).reshape(3, 4)
+
+    first = cache.get_or_compute("k", compute)
+    assert np.array_equal(cache.get_or_compute("k", compute), first)
+    # 新的缓存对象（相当于另一个渲染进程）从磁盘读取
+    other = MeshCache(str(tmp_path))
+    assert np.array_equal(other.get_or_compute("k", compute), first)
+    assert len(calls) == 1
+
+
+def test_none_key_always_computes(cache):
+    calls = []
+    cache.get_or_compute(None, lambda: calls.append(1) or np.zeros(1))
+    cache.get_or_compute(None, lambda: calls.append(1) or np.zeros(1))
+    assert len(calls) == 2
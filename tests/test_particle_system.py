@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from particle_system import ParticleSystem, euler_step, rotation_velocity  # noqa: E402
+
+
+def drift(positions, t):
+    """所有粒子以单位速度沿 x 方向运动"""
+    return np.tile([1.0, 0.0, 0.0], (len(positions), 1))
+
+
+def test_step_uses_substeps_and_updates_in_place():
+    system = ParticleSystem(np.zeros((2, 3)), drift, integrator=euler_step, max_step=0.1)
+    positions = system.positions
+    system.step(1.0)
+    assert system.positions is positions
+    assert np.allclose(system.positions[:, 0], 1.0)
+    assert system.time == pytest.approx(1.0)
+
+
+def test_zero_dt_does_nothing():
+    system = ParticleSystem(np.zeros((1, 3)), drift)
+    system.step(0)
+    assert np.allclose(system.positions, 0) and system.time == 0
+
+
+def test_rk4_rotation_stays_on_circle():
+    start = np.array([[1.0, 0, 0], [0, 2.0, 0]])
+    system = ParticleSystem(start, rotation_velocity(omega=1.0))
+    system.step(np.pi)
+    assert np.allclose(system.positions, -start, atol=1e-6)
+    assert np.allclose(np.linalg.norm(system.positions, axis=1), [1, 2], atol=1e-9)
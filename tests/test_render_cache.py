@@ -0,0 +1,113 @@
+import os
+
+from render_cache import RenderCache, scene_cache_key
+
+MODULE = '''from manim import *
+from helper import shift
+
+config.tex_template = TexTemplate()
+
+
+def label(text):
+    return Text(text)
+
+
+class First(Scene):
+    def construct(self):
+        self.add(label("a"))
+
+
+class Second(Scene):
+    def construct(self):
+        self.add(label("b"))
+
+
+if __name__ == "__main__":
+    pass
+'''
+
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def make_repo(tmp_path, module=MODULE, helper="def shift(x):\n    return x + 1\n"):
+    write(tmp_path / "scenes.py", module)
+    write(tmp_path / "helper.py", helper)
+    return scene_cache_key("scenes.py", "First", "h", root=str(tmp_path))
+
+
+def test_key_is_stable(tmp_path):
+    key = make_repo(tmp_path)
+    assert key == scene_cache_key("scenes.py", "First", "h", root=str(tmp_path))
+
+
+def test_key_ignores_comments_and_layout(tmp_path):
+    key = make_repo(tmp_path)
+    reformatted = MODULE.replace("def label(text):", "# 注释\ndef label( text ):")
+    assert make_repo(tmp_path, reformatted) == key
+
+
+def test_key_ignores_other_scenes_and_main_guard(tmp_path):
+    key = make_repo(tmp_path)
+    changed = MODULE.replace('label("b")', 'label("c")').replace("    pass", "    print()")
+    assert make_repo(tmp_path, changed) == key
+
+
+def test_key_changes_with_scene_helpers_and_preamble(tmp_path):
+    key = make_repo(tmp_path)
+    assert make_repo(tmp_path, MODULE.replace('label("a")', 'label("x")')) != key
+    assert make_repo(tmp_path, MODULE.replace("Text(text)", "Tex(text)")) != key
+    assert make_repo(tmp_path, MODULE.replace(
+        "config.tex_template = TexTemplate()",
+        "config.tex_template = TexTemplateLibrary.ctex",
+    )) != key
+    assert make_repo(tmp_path, helper="def shift(x):\n    return x + 2\n") != key
+
+
+def test_key_changes_with_quality(tmp_path):
+    make_repo(tmp_path)
+    root = str(tmp_path)
+    assert scene_cache_key("scenes.py", "First", "h", root) != scene_cache_key("scenes.py", "First", "l", root)
+
+
+def test_restore_copies_and_eviction_frees_entries(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=15)
+    video = tmp_path / "video.mp4"
+    write(video, "x" * 10)
+    cache.store("a", str(video))
+
+    output = tmp_path / "media" / "out.mp4"
+    assert cache.restore("a", str(output))
+    assert output.read_text() == "x" * 10
+    # 复制而不是硬链接：淘汰缓存条目后空间能真正释放
+    assert os.stat(output).st_nlink == 1
+
+    cache.store("b", str(video))
+    assert "a" not in cache.index
+    assert not cache.restore("a", str(output))
+    assert cache.total_bytes() <= 15
+
+
+def test_render_all_survives_cache_store_errors(tmp_path, monkeypatch):
+    import render_all
+
+    make_repo(tmp_path)
+
+    def render_scene(module_file, scene_name, *args):
+        return {"module": module_file, "scene": scene_name, "ok": True, "returncode": 0,
+                "wall_time": 0.0, "cpu_time": 0.0, "peak_rss": None}
+
+    class BrokenCache:
+        def restore(self, key, output):
+            return False
+
+        def store(self, key, video, label=""):
+            raise OSError("disk full")
+
+    monkeypatch.setattr(render_all, "render_scene", render_scene)
+    jobs = [("scenes.py", "First"), ("scenes.py", "Second")]
+    results = render_all.render_all(jobs, root=str(tmp_path), cache=BrokenCache(), prewarm_tex=False)
+    assert sorted(r["scene"] for r in results) == ["First", "Second"]
+    assert all(r["ok"] and not r["cached"] and "disk full" in r["cache_error"] for r in results)
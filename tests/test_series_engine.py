@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from series_engine import SeriesPartialSums, kahan_cumsum
+
+
+def test_kahan_cumsum_matches_cumsum_and_axis():
+    rng = np.random.default_rng(0)
+    terms = rng.normal(size=(20, 3))
+    assert np.allclose(kahan_cumsum(terms), np.cumsum(terms, axis=0))
+    assert np.allclose(kahan_cumsum(terms, axis=1), np.cumsum(terms, axis=1))
+
+
+def test_kahan_cumsum_compensates_rounding():
+    # 1 + 10000 个 1e-16：逐项相加时每一项都被舍入掉
+    terms = np.concatenate([[1.0], np.full(10000, 1e-16)])
+    assert np.cumsum(terms)[-1] == 1.0
+    assert kahan_cumsum(terms)[-1] == pytest.approx(1 + 1e-12, abs=1e-15)
+
+
+def test_harmonic_partial_sums():
+    n = 100000
+    sums = SeriesPartialSums(lambda k: 1.0 / k, n, start=1, compensated=True)
+    exact = math.fsum(1.0 / k for k in range(1, n + 1))
+    assert sums(n) == exact
+    assert sums(1) == 1.0
+    assert sums.n_terms == n
+
+
+def test_function_series_partial_sums():
+    xs = np.linspace(-0.5, 0.5, 7)
+    sums = SeriesPartialSums(lambda k, x: x ** k, 11, x=xs)
+    assert sums.sums.shape == (11, 7)
+    assert np.allclose(sums(5), (1 - xs ** 6) / (1 - xs))
+    # 常数项会被广播到所有采样点
+    constant = SeriesPartialSums(lambda k, x: 1.0, 4, x=xs)
+    assert np.allclose(constant(3), 4.0)
+
+
+def test_out_of_range_partial_sum():
+    sums = SeriesPartialSums(lambda k: (-1.0) ** k / (k + 1), 10)
+    with pytest.raises(ValueError):
+        sums(10)
+    with pytest.raises(ValueError):
+        sums(-1)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from trail import TrailGroup, fade_opacities  # noqa: E402
+
+
+def layer_points(trails):
+    return np.concatenate([layer.points for layer in trails.submobjects])
+
+
+def test_ring_buffer_keeps_latest_segments_in_order():
+    trails = TrailGroup(np.zeros((2, 3)), capacity=4, n_layers=2)
+    assert len(layer_points(trails)) == 0
+    for x in range(1, 6):
+        trails.add_points([[x, 0, 0], [0, x, 0]])
+    # 容量为 4 个位置，即最近 3 段；各段按时间从旧到新排列，每段是 4 个控制点
+    points = layer_points(trails).reshape(3, 2, 4, 3)
+    assert np.allclose(points[:, 0, 0, 0], [2, 3, 4])
+    assert np.allclose(points[:, 0, -1, 0], [3, 4, 5])
+    assert np.allclose(points[:, 1, -1, 1], [3, 4, 5])
+
+
+def test_layers_are_views_into_one_buffer():
+    trails = TrailGroup(np.zeros((3, 3)), capacity=20)
+    buffer = trails._segments
+    for x in range(30):
+        trails.add_points(np.full((3, 3), float(x)))
+        for layer in trails.submobjects:
+            assert len(layer.points) == 0 or np.shares_memory(layer.points, buffer)
+    assert trails._segments is buffer
+
+
+def test_layer_opacities_fade_towards_tail():
+    trails = TrailGroup(np.zeros((1, 3)), capacity=50, opacity=0.3, n_layers=4)
+    opacities = [layer.get_stroke_opacity() for layer in trails.submobjects]
+    assert np.allclose(opacities, fade_opacities(0.3, 5)[1:])
+    assert np.all(np.diff(opacities) > 0)
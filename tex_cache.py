@@ -0,0 +1,238 @@
+"""LaTeX 编译缓存与并行预热
+
+manim 把每个 MathTex/Tex 编译成 SVG 时，文件名取自完整 .tex 文件内容的哈希，
+而 .tex 文件由公式、环境（align*、center 等）和模板导言区共同生成，
+因此 tex_dir 本身就是一个按 (公式, 导言区, 环境) 寻址的缓存：只要多个进程、
+多台机器使用同一个 tex_dir（例如共享或同步的目录），相同的公式只需编译一次。
+
+这里补上两件事：
+
+- 让并行渲染安全地共用一个 tex_dir：manim 每次编译后会删除 tex_dir 中
+  的 .dvi/.log 等中间文件，多个进程同时编译时会删掉彼此尚未用完的文件，
+  所以共用目录时关闭这一清理（manim_args），改为由 prune_intermediates
+  只删除已生成 SVG 的公式的中间文件，tex_dir 中长期保留的只有 SVG。
+- 预热：静态收集模块中所有参数为字面量的 MathTex/Tex 调用，在渲染开始前
+  用进程池并发编译，渲染时只需读取现成的 SVG。
+
+    python tex_cache.py cauchy_inequality.py unified_mean_value_theorems.py -j 8
+
+缓存目录默认为 media/Tex（manim 的默认 tex_dir），可用环境变量
+MANIM_TEX_CACHE 或 --tex-dir 指定其他目录。
+"""
+
+import argparse
+import ast
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from render_all import _base_name
+
+DEFAULT_TEX_DIR = os.environ.get("MANIM_TEX_CACHE", os.path.join("media", "Tex"))
+
+# 需要编译 LaTeX 的类
+TEX_CLASSES = {"MathTex", "Tex", "SingleStringMathTex"}
+
+# 影响编译内容的关键字参数（颜色、字号等只影响显示，不影响 SVG）
+COMPILE_KWARGS = {"arg_separator", "substrings_to_isolate", "tex_environment"}
+
+
+def manim_args(tex_dir=None, root="."):
+    """manim 命令行参数：共用 tex_dir 时关闭中间文件清理，必要时指定 tex_dir
+
+    tex_dir 为 None 时使用 manim 默认的 media/Tex。manim 没有设置 tex_dir 的
+    命令行选项，因此写一个只包含 tex_dir 的配置文件，通过 --config_file 传入。
+    配置文件每次调用都会重写，应在启动渲染子进程之前调用一次，
+    所有子进程使用同一组参数。
+    """
+    args = ["--no_latex_cleanup"]
+    if tex_dir is not None:
+        config_path = os.path.join(root, "media", "tex_cache.cfg")
+        os.makedirs(os.path.dirname(config_path), exist_ok=True)
+        with open(config_path, "w", encoding="utf-8") as f:
+            f.write(f"[CLI]\ntex_dir = {os.path.abspath(tex_dir)}\n")
+        args += ["--config_file", config_path]
+    return args
+
+
+def prune_intermediates(tex_dir):
+    """删除 tex_dir 中已生成 SVG 的公式的中间文件（.tex/.dvi/.log 等），返回删除的文件数
+
+    关闭 manim 的清理后这些文件会一直累积。manim 只在 SVG 不存在时才编译，
+    SVG 已经存在的公式不会再用到它的中间文件；还没有 SVG 的公式可能正在
+    其他进程中编译，保留不动。
+    """
+    try:
+        names = os.listdir(tex_dir)
+    except FileNotFoundError:
+        return 0
+    finished = {stem for stem, ext in map(os.path.splitext, names) if ext == ".svg"}
+    removed = 0
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        if ext != ".svg" and stem in finished:
+            try:
+                os.remove(os.path.join(tex_dir, name))
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+class _NotLiteral(Exception):
+    """参数不是字面量，无法静态确定编译内容"""
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        raise _NotLiteral
+
+
+def _tex_call(node):
+    """把一个 MathTex/Tex 调用转换为可在子进程中重建的描述，无法静态确定时返回 None
+
+    返回 (类名, 位置参数, 关键字参数, tex_to_color_map 的键, tex_template 变量名)。
+    """
+    try:
+        args = tuple(_literal(arg) for arg in node.args)
+        if not args or not all(isinstance(arg, str) for arg in args):
+            return None
+        kwargs = {}
+        color_keys = ()
+        template_name = None
+        for keyword in node.keywords:
+            if keyword.arg in COMPILE_KWARGS:
+                kwargs[keyword.arg] = _literal(keyword.value)
+            elif keyword.arg == "tex_to_color_map":
+                # 只有键影响公式的拆分方式，颜色无关
+                if not isinstance(keyword.value, ast.Dict):
+                    return None
+                color_keys = tuple(_literal(key) for key in keyword.value.keys)
+            elif keyword.arg == "tex_template":
+                if not isinstance(keyword.value, ast.Name):
+                    return None
+                template_name = keyword.value.id
+            elif keyword.arg is None:  # **kwargs
+                return None
+    except _NotLiteral:
+        return None
+    if isinstance(kwargs.get("substrings_to_isolate"), list):
+        kwargs["substrings_to_isolate"] = tuple(kwargs["substrings_to_isolate"])
+    return (_base_name(node.func), args, tuple(sorted(kwargs.items())), color_keys, template_name)
+
+
+def collect_tex_calls(path):
+    """静态收集模块中参数均为字面量的 MathTex/Tex 调用（去重，不导入模块）"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    calls = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and _base_name(node.func) in TEX_CLASSES:
+            call = _tex_call(node)
+            if call is not None:
+                calls.setdefault(call, None)
+    return list(calls)
+
+
+# 子进程中已导入的模块及其 LaTeX 模板
+_modules = {}
+
+
+def _load_module(module_path):
+    """在子进程中导入模块，记录模块级代码设置的 LaTeX 模板（如 ctex + STSong）"""
+    if module_path not in _modules:
+        from manim import TexTemplate, config
+
+        # 各模块都在默认模板的基础上修改，先复位，避免受之前导入的模块影响
+        config.tex_template = TexTemplate()
+        sys.path.insert(0, os.path.dirname(os.path.abspath(module_path)))
+        name = "_tex_prewarm_" + os.path.splitext(os.path.basename(module_path))[0]
+        spec = importlib.util.spec_from_file_location(name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[module_path] = (module, config.tex_template)
+    return _modules[module_path]
+
+
+def _compile_call(module_path, tex_dir, call):
+    """在子进程中构造一次 MathTex/Tex，使其 SVG 写入 tex_dir，返回耗时"""
+    import manim
+    from manim import WHITE, config
+
+    config.tex_dir = os.path.abspath(tex_dir)
+    config.no_latex_cleanup = True
+    module, template = _load_module(module_path)
+    class_name, args, kwargs, color_keys, template_name = call
+    kwargs = dict(kwargs)
+    if color_keys:
+        kwargs["tex_to_color_map"] = dict.fromkeys(color_keys, WHITE)
+    kwargs["tex_template"] = getattr(module, template_name) if template_name else template
+    tex_class = getattr(module, class_name, None) or getattr(manim, class_name)
+
+    start = time.perf_counter()
+    tex_class(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def prewarm(module_files, tex_dir=DEFAULT_TEX_DIR, workers=None, root="."):
+    """并发编译各模块中的 MathTex/Tex 字面量，返回 (公式数, 失败数)
+
+    已编译过的公式在子进程中直接命中 tex_dir 中的 SVG，几乎不耗时。
+    """
+    jobs = []
+    for module_file in module_files:
+        path = os.path.join(root, module_file)
+        try:
+            calls = collect_tex_calls(path)
+        except SyntaxError as e:
+            print(f"跳过无法解析的文件 {module_file}: {e}")
+            continue
+        jobs += [(path, call) for call in calls]
+    if not jobs:
+        return 0, 0
+
+    os.makedirs(tex_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    failed = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_compile_call, path, tex_dir, call): (path, call) for path, call in jobs}
+        for future in as_completed(futures):
+            path, call = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[失败] {os.path.basename(path)} {call[0]}{call[1]!r}: {e}")
+    print(f"预热 {len(jobs)} 个公式，失败 {failed} 个，耗时 {time.perf_counter() - start:.1f}s")
+    return len(jobs), failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="在渲染前并行编译模块中的 MathTex/Tex 公式")
+    parser.add_argument("modules", nargs="+", help="要预热的模块文件")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="并行进程数（默认等于 CPU 核数）")
+    parser.add_argument("--tex-dir", default=DEFAULT_TEX_DIR,
+                        help="LaTeX 缓存目录（默认为环境变量 MANIM_TEX_CACHE 或 media/Tex）")
+    parser.add_argument("--list", action="store_true", help="只列出收集到的公式")
+    args = parser.parse_args()
+
+    if args.list:
+        for module_file in args.modules:
+            for call in collect_tex_calls(module_file):
+                print(f"{module_file} {call[0]}{call[1]!r}")
+        return
+
+    _, failed = prewarm(args.modules, args.tex_dir, args.workers)
+    prune_intermediates(args.tex_dir)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from manim import *
+import numpy as np
+
+from fast_surface import FastSurface, evaluate_uv_grid, grid_face_points
+from geometry import polyline_bezier_points
+
+
+class TrackedSurface(FastSurface):
+    """随 ValueTracker 变化的曲面，用来代替 always_redraw(lambda: Surface(...))
+
+    func(u, v, value) 与 FastSurface 的函数相同，只是多一个参数：追踪器的当前值。
+    曲面只在构造时创建一次面和样式（包括棋盘格配色），之后追踪器的值变化时，
+    更新器用一次向量化计算重写所有面的顶点：各个面的 points 都是同一个
+    (面数, 16, 3) 缓冲区的视图，写入缓冲区即完成更新。
+
+    u、v 的范围固定；范围随追踪器变化时，把变化写进 func（例如用 u ∈ [0, 1] 乘以半径）。
+    """
+
+    def __init__(self, func, tracker, **kwargs):
+        self.tracker = tracker
+        self._tracked_func = func
+        self._value = tracker.get_value()
+        value = self._value
+        kwargs["mesh_cache"] = None
+        super().__init__(lambda u, v: func(u, v, value), **kwargs)
+        self._face_buffer = np.array([face.points for face in self.list_of_faces])
+        self._bind_faces()
+        self.add_updater(lambda mob: mob.update_vertices())
+
+    def _bind_faces(self):
+        for face, points in zip(self.list_of_faces, self._face_buffer):
+            face.points = points
+
+    def update_vertices(self):
+        value = self.tracker.get_value()
+        if value == self._value:
+            return self
+        self._value = value
+        u_values, v_values = self._get_u_values_and_v_values()
+        grid = evaluate_uv_grid(lambda u, v: self._tracked_func(u, v, value), u_values, v_values)
+        self._face_buffer[:] = grid_face_points(grid).reshape(self._face_buffer.shape)
+        # 动画（如 Create）会给面换上新的点数组，此时重新绑定到缓冲区
+        if not np.shares_memory(self.list_of_faces[0].points, self._face_buffer):
+            self._bind_faces()
+        return self
+
+
+class TrackedCurve(VMobject):
+    """随 ValueTracker 变化的参数曲线，用来代替 always_redraw(lambda: ParametricFunction(...))
+
+    func(t, value) 接收参数数组 t，返回 (x, y, z) 三个分量（分量可以是标量）。
+    曲线由 n_samples 个采样点连成的折线构成，点数固定；追踪器的值变化时
+    只把新的控制点写入原有的点数组。
+    """
+
+    def __init__(self, func, tracker, t_range=(0, 1), n_samples=200, **kwargs):
+        super().__init__(**kwargs)
+        self.tracker = tracker
+        self.func = func
+        self.t_values = np.linspace(t_range[0], t_range[1], n_samples)
+        self._value = tracker.get_value()
+        self._point_buffer = self._curve_points(self._value)
+        self.points = self._point_buffer
+        self.add_updater(lambda mob: mob.update_points())
+
+    def _curve_points(self, value):
+        t = self.t_values
+        components = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in self.func(t, value)), t)[:3]
+        return polyline_bezier_points(np.stack(components, axis=-1))
+
+    def update_points(self):
+        value = self.tracker.get_value()
+        if value == self._value:
+            return self
+        self._value = value
+        self._point_buffer[:] = self._curve_points(value)
+        if self.points is not self._point_buffer:
+            self.points = self._point_buffer
+        return self
@@ -0,0 +1,71 @@
+from manim import *
+import numpy as np
+
+from geometry import line_segment_points
+
+
+def fade_opacities(opacity=1.0, n_stops=8, power=1.5):
+    """轨迹从尾部（透明）到头部（opacity）的不透明度渐变，一次算出全部色标"""
+    return opacity * np.linspace(0, 1, n_stops) ** power
+
+
+class TrailGroup(VGroup):
+    """一组固定容量的轨迹，例如一群粒子各自的运动轨迹
+
+    所有轨迹的贝塞尔控制点保存在一个预分配的环形缓冲区中，形状为
+    (2 × 段数, 轨迹数, 4, 3)。每个新线段同时写入 i 和 i + 段数 两处，
+    因此按时间顺序排列的最近若干段总是一段连续的切片。
+
+    轨迹按时间分成 n_layers 层，每层是一个子对象（VMobject），其 points
+    是上述切片中属于这一层的部分的视图，每条线段是一个子路径。
+    add_points 只把新线段写入缓冲区，再把各层的视图移到新的位置，
+    不复制、不重新分配点数组，内存和每帧的开销都不随运行时间增长。
+
+    fade 为 True 时各层的描边不透明度由 fade_opacities 一次算出，越新的层
+    越不透明；不透明度设在描边上，与投影无关，ThreeDScene 中同样正确。
+    只有一条轨迹时传入形状为 (1, 3) 的起点即可。
+
+        trails = TrailGroup(system.positions, capacity=50, color=BLUE_A)
+        trails.add_updater(lambda m: m.add_points(system.positions))
+    """
+
+    def __init__(self, starts, capacity=50, color=WHITE, stroke_width=2, opacity=1.0,
+                 n_layers=8, fade=True, **kwargs):
+        super().__init__(**kwargs)
+        starts = np.atleast_2d(np.asarray(starts, dtype=float))
+        self.n_segments = max(capacity - 1, 1)
+        self.n_layers = min(n_layers, self.n_segments) if fade else 1
+        self._segments = np.empty((2 * self.n_segments, len(starts), 4, 3))
+        self._last = starts.copy()
+        opacities = fade_opacities(opacity, self.n_layers + 1)[1:] if fade else [opacity]
+        for layer_opacity in opacities:
+            layer = VMobject()
+            layer.set_stroke(color, width=stroke_width, opacity=layer_opacity)
+            self.add(layer)
+        self.reset(starts)
+
+    def reset(self, positions):
+        """清空轨迹，之后从 positions 重新开始记录"""
+        self._last[:] = positions
+        self._head = 0
+        self._count = 0
+        self._update_views()
+        return self
+
+    def add_points(self, positions):
+        """每条轨迹追加一个新位置（positions 为 (轨迹数, 3)）"""
+        n = self.n_segments
+        self._segments[self._head] = line_segment_points(self._last, positions)
+        self._segments[self._head + n] = self._segments[self._head]
+        self._head = (self._head + 1) % n
+        self._count = min(self._count + 1, n)
+        self._last[:] = positions
+        self._update_views()
+        return self
+
+    def _update_views(self):
+        end = self._head + self.n_segments
+        bounds = np.linspace(end - self._count, end, self.n_layers + 1).round().astype(int)
+        for layer, start, stop in zip(self.submobjects, bounds[:-1], bounds[1:]):
+            # 连续切片的 reshape 仍是缓冲区的视图
+            layer.points = self._segments[start:stop].reshape(-1, 3)
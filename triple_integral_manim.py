@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from tracked_mobjects import TrackedCurve, TrackedSurface
+
 class TripleIntegralScene(ThreeDScene):
     def construct(self):
         # 设置更好的相机角度和更美观的外观
@@ -78,49 +80,40 @@ class TripleIntegralScene(ThreeDScene):
         # 定义z_tracker 
         self.z_tracker = ValueTracker(0.1)
         
+        # 以下随z值变化的对象只创建一次，z改变时由更新器原地重写顶点
         # 创建一个随z值变化的半透明截面平面
-        section_plane = always_redraw(
-            lambda: Surface(
-                lambda u, v: np.array([u, v, self.z_tracker.get_value()]),
-                u_range=[-2.5, 2.5],
-                v_range=[-2.5, 2.5],
-                resolution=(2, 2),
-                fill_opacity=0.2,
-                stroke_width=0.5,
-                stroke_color=YELLOW,
-                fill_color=YELLOW
-            )
+        section_plane = TrackedSurface(
+            lambda u, v, z: (u, v, z),
+            self.z_tracker,
+            u_range=[-2.5, 2.5],
+            v_range=[-2.5, 2.5],
+            resolution=(2, 2),
+            fill_opacity=0.2,
+            stroke_width=0.5,
+            stroke_color=YELLOW,
+            fill_color=YELLOW
         )
         
         # 动态截面 - 使用填充和更突出的边缘
-        cross_section = always_redraw(
-            lambda: ParametricFunction(
-                lambda t: np.array([
-                    np.sqrt(self.z_tracker.get_value()) * np.cos(t),
-                    np.sqrt(self.z_tracker.get_value()) * np.sin(t),
-                    self.z_tracker.get_value()
-                ]),
-                t_range=[0, TAU],
-                color=RED_B,
-                stroke_width=4
-            )
+        cross_section = TrackedCurve(
+            lambda t, z: (np.sqrt(z) * np.cos(t), np.sqrt(z) * np.sin(t), z),
+            self.z_tracker,
+            t_range=[0, TAU],
+            color=RED_B,
+            stroke_width=4
         )
         
         # 在截面内绘制积分区域 - 使用更美观的填充
-        integral_region = always_redraw(
-            lambda: Surface(
-                lambda u, v: np.array([
-                    u * np.cos(v),
-                    u * np.sin(v),
-                    self.z_tracker.get_value()
-                ]),
-                u_range=[0, np.sqrt(self.z_tracker.get_value())],
-                v_range=[0, TAU],
-                fill_opacity=0.4,
-                resolution=(20, 20),
-                stroke_width=0,
-                checkerboard_colors=[RED_D, RED_A]
-            )
+        # 半径范围 [0, √z] 随z变化，这里让 u ∈ [0, 1] 再乘以 √z，网格保持不变
+        integral_region = TrackedSurface(
+            lambda u, v, z: (np.sqrt(z) * u * np.cos(v), np.sqrt(z) * u * np.sin(v), z),
+            self.z_tracker,
+            u_range=[0, 1],
+            v_range=[0, TAU],
+            fill_opacity=0.4,
+            resolution=(20, 20),
+            stroke_width=0,
+            checkerboard_colors=[RED_D, RED_A]
         )
         
         # 创建左下角的2D截面变化示意图 - 坐标轴更长
@@ -174,13 +167,18 @@ class TripleIntegralScene(ThreeDScene):
         range_group.align_to(section_frame, UP)
         
         # 创建动态更新的2D截面圆
-        section_circle = always_redraw(
-            lambda: Circle(
-                radius=np.sqrt(self.z_tracker.get_value()) * 0.75,  # 缩放以适应框架，但比例更大
-                color=RED,
-                fill_opacity=0.3,
-                fill_color=RED_A
-            ).move_to(section_axes.get_center())
+        section_center = section_axes.get_center()
+        section_circle = TrackedCurve(
+            lambda t, z: (
+                section_center[0] + np.sqrt(z) * 0.75 * np.cos(t),  # 缩放以适应框架，但比例更大
+                section_center[1] + np.sqrt(z) * 0.75 * np.sin(t),
+                section_center[2]
+            ),
+            self.z_tracker,
+            t_range=[0, TAU],
+            color=RED,
+            fill_opacity=0.3,
+            fill_color=RED_A
         )
         
         # 提示文字 - 放在右侧上方位置
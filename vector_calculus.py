@@ -1,6 +1,26 @@
 from manim import *
 import numpy as np
 
+from flow_lines import jittered_seeds, streamlines
+from geometry import axes_c2p, polyline_bezier_points
+
+
+def flow_curves(axes, field, color, bounds=(-2, 2, -2, 2), density=40, max_length=0.8):
+    """密集流线：density × density 个种子点同时积分，全部流线作为同一个 VMobject 的子路径
+
+    field(x, y) 在坐标系的坐标中给出向量场 (u, v)，x、y 为数组。
+    """
+    lines = streamlines(field, jittered_seeds(bounds, density, density), bounds, max_length=max_length)
+    flat = np.concatenate(lines)
+    scene_points = axes_c2p(axes, flat[:, 0], flat[:, 1], 0)
+    splits = np.cumsum([len(line) for line in lines])[:-1]
+    curves = VMobject(stroke_color=color, stroke_width=1, stroke_opacity=0.5)
+    curves.set_points(np.concatenate([
+        polyline_bezier_points(line) for line in np.split(scene_points, splits)
+    ]))
+    return curves
+
+
 class GradientField(Scene):
     def construct(self):
         # 添加标题
@@ -47,9 +67,13 @@ class GradientField(Scene):
             length_func=lambda x: 0.3
         )
 
+        # 梯度场的密集流线
+        flow = flow_curves(axes, lambda x, y: (2*x, 2*y), YELLOW)
+
         # 显示坐标系和等高线
         self.play(Create(axes))
         self.play(LaggedStart(*[Create(c) for c in contours]))
+        self.play(FadeIn(flow))
         
         # 显示向量场
         self.play(Create(vector_field))
@@ -90,9 +114,11 @@ class DivergenceField(Scene):
             vector_config={"color": RED},
             length_func=lambda x: 0.3
         )
+        flow = flow_curves(axes, lambda x, y: (x, y), RED)
 
-        # 显示坐标系和向量场
+        # 显示坐标系、密集流线和向量场
         self.play(Create(axes))
+        self.play(FadeIn(flow))
         self.play(Create(vector_field))
 
         # 添加说明文字
@@ -131,9 +157,11 @@ class CurlField(Scene):
             vector_config={"color": GREEN},
             length_func=lambda x: 0.3
         )
+        flow = flow_curves(axes, lambda x, y: (-y, x), GREEN)
 
-        # 显示坐标系和向量场
+        # 显示坐标系、密集流线和向量场
         self.play(Create(axes))
+        self.play(FadeIn(flow))
         self.play(Create(vector_field))
 
         # 添加说明文字